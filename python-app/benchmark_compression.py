@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+上传请求体压缩性能对比工具
+功能：解析日报Excel并转换为批量导入请求体，对比不同编码方式的请求体大小、压缩耗时
+以及在指定上行带宽下的预计上传耗时
+"""
+
+import contextlib
+import io
+import json
+import sys
+import time
+
+from convert_to_api_format import convert_to_api_format
+from services.parse_service import ParseService
+from services.request_compression import available_encodings, compress, encode_json
+
+
+def measure_encoding(label: str, encode, repeat: int = 5) -> dict:
+    """
+    测量一种编码方式的请求体大小和耗时
+
+    :param label: 编码方式名称
+    :param encode: 生成请求体的函数
+    :param repeat: 重复次数（耗时取最小值）
+    :return: 测量结果字典
+    """
+    best_seconds = None
+    body = b''
+    for _ in range(repeat):
+        start = time.perf_counter()
+        body = encode()
+        elapsed = time.perf_counter() - start
+        best_seconds = elapsed if best_seconds is None else min(best_seconds, elapsed)
+    return {'label': label, 'bytes': len(body), 'seconds': best_seconds}
+
+
+def main():
+    """主函数"""
+    if len(sys.argv) < 2:
+        print("使用方法: python benchmark_compression.py <excel文件路径> [上行带宽Mbps]")
+        print("示例: python benchmark_compression.py docs/assets/淮安日报2025.10.19.xlsx 1")
+        sys.exit(1)
+
+    excel_path = sys.argv[1]
+    uplink_mbps = float(sys.argv[2]) if len(sys.argv) > 2 else 1.0
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        reports = ParseService().parse_reports([excel_path])
+        api_data = convert_to_api_format(reports, project_id=1, reporter_id=1)
+
+    print(f"请求体压缩对比: {excel_path}（{len(reports)} 条日报，上行带宽 {uplink_mbps:g} Mbps）")
+    print("=" * 80)
+
+    # requests 的 json= 参数默认转义中文（\uXXXX），作为基准
+    results = [
+        measure_encoding("json=（转义中文）", lambda: json.dumps(api_data).encode('utf-8')),
+        measure_encoding("UTF-8", lambda: encode_json(api_data)),
+    ]
+    for encoding in available_encodings():
+        results.append(measure_encoding(
+            f"UTF-8 + {encoding}",
+            lambda encoding=encoding: compress(encode_json(api_data), encoding)
+        ))
+
+    baseline = results[0]
+    bytes_per_second = uplink_mbps * 1000 * 1000 / 8
+    print(f"{'编码方式':<20}{'大小(KB)':>12}{'压缩比':>10}{'编码(毫秒)':>14}{'预计上传(秒)':>16}")
+    for result in results:
+        upload_seconds = result['seconds'] + result['bytes'] / bytes_per_second
+        print(f"{result['label']:<20}{result['bytes'] / 1024:>12.1f}"
+              f"{baseline['bytes'] / result['bytes']:>10.2f}"
+              f"{result['seconds'] * 1000:>14.2f}{upload_seconds:>16.2f}")
+
+    print("=" * 80)
+    if 'zstd' not in available_encodings():
+        print("提示: 安装 zstandard 后可对比 zstd 压缩（pip install zstandard）")
+
+
+if __name__ == "__main__":
+    main()
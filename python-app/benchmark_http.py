@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+HTTP连接复用性能对比工具
+功能：启动本地桩服务器，对比每次请求新建连接（requests.get）与共享连接池会话的耗时和建立的连接数
+"""
+
+import contextlib
+import io
+import json
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+
+from services.base_service import BaseService
+from services.http_session import close_session
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """桩服务器请求处理（HTTP/1.1 keep-alive），记录建立的连接数"""
+
+    protocol_version = 'HTTP/1.1'
+    # 响应头和响应体分两次写出，关闭Nagle算法避免与客户端延迟确认叠加产生约40ms等待
+    disable_nagle_algorithm = True
+    connection_count = 0
+    lock = threading.Lock()
+
+    def setup(self):
+        super().setup()
+        with StubHandler.lock:
+            StubHandler.connection_count += 1
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        body = json.dumps({'code': 1, 'msg': '查询成功', 'data': {'id': 1}}).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def measure(label: str, request_once, count: int) -> dict:
+    """
+    执行多次请求并统计耗时和新建连接数
+
+    :param label: 模式名称
+    :param request_once: 发送一次请求的函数
+    :param count: 请求次数
+    :return: 测量结果字典
+    """
+    connections_before = StubHandler.connection_count
+    start = time.perf_counter()
+    # 屏蔽服务层的逐请求输出，避免干扰计时
+    with contextlib.redirect_stdout(io.StringIO()):
+        for _ in range(count):
+            request_once()
+    elapsed = time.perf_counter() - start
+    return {
+        'label': label,
+        'seconds': elapsed,
+        'connections': StubHandler.connection_count - connections_before
+    }
+
+
+def main():
+    """主函数"""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), StubHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_port}"
+    endpoint = '/api/v1/projects/my-project'
+
+    print(f"HTTP连接复用对比: {base_url}（{count} 次请求）")
+    print("=" * 80)
+
+    try:
+        results = [
+            measure("每次新建连接", lambda: requests.get(f"{base_url}{endpoint}", timeout=10), count),
+            measure("共享连接池会话", lambda: BaseService(base_url, 'benchmark').get(endpoint), count),
+        ]
+    finally:
+        close_session()
+        server.shutdown()
+        server.server_close()
+
+    print(f"{'模式':<16}{'连接数':>10}{'总耗时(秒)':>14}{'单次(毫秒)':>14}")
+    for result in results:
+        print(f"{result['label']:<16}{result['connections']:>10}"
+              f"{result['seconds']:>14.3f}{result['seconds'] * 1000 / count:>14.2f}")
+
+    print("=" * 80)
+    plain, pooled = results
+    if pooled['seconds'] > 0:
+        print(f"耗时加速比: {plain['seconds'] / pooled['seconds']:.2f}x")
+    if pooled['connections'] <= 1:
+        print("✓ 共享会话复用了同一个连接")
+    else:
+        print(f"⚠️  共享会话建立了 {pooled['connections']} 个连接")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+JSON库性能对比工具
+功能：解析日报Excel并复制到指定条数，对比各JSON库（标准库json、orjson、ujson）在
+上传流程中各环节（字段序列化、请求体序列化、解析缓存读取、服务器响应解析）的耗时
+"""
+
+import contextlib
+import io
+import sys
+import time
+
+from benchmark_payload import replicate_reports
+from convert_to_api_format import convert_to_api_format
+from services.json_codec import DEFAULT_BACKEND, available_backends, dumps, dumps_bytes, loads
+from services.parse_service import ParseService
+
+# 批量导入API格式中以JSON字符串保存的字段
+NESTED_FIELDS = (
+    'taskProgressList', 'tomorrowPlans', 'workerReports',
+    'machineryRentals', 'problemFeedbacks', 'requirements'
+)
+
+
+def measure(run, repeat: int = 5) -> float:
+    """
+    测量耗时
+
+    :param run: 被测函数
+    :param repeat: 重复次数（取最小值）
+    :return: 秒数
+    """
+    best_seconds = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        elapsed = time.perf_counter() - start
+        best_seconds = elapsed if best_seconds is None else min(best_seconds, elapsed)
+    return best_seconds
+
+
+def main():
+    """主函数"""
+    if len(sys.argv) < 2:
+        print("使用方法: python benchmark_json.py <excel文件路径> [日报条数]")
+        print("示例: python benchmark_json.py docs/assets/淮安日报2025.10.19.xlsx 1000")
+        sys.exit(1)
+
+    excel_path = sys.argv[1]
+    count = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        parsed = ParseService().parse_reports([excel_path])
+    if not parsed:
+        print("错误: 没有解析到有效数据")
+        sys.exit(1)
+
+    reports = replicate_reports(parsed, count)
+    api_data = convert_to_api_format(reports, project_id=1, reporter_id=1)
+    report_dicts = [report.to_dict() for report in reports]
+    report_texts = [dumps_bytes(report.to_dict(), backend='json') for report in reports]
+    response_text = dumps_bytes({
+        'code': 1,
+        'data': {
+            'totalCount': count, 'successCount': count, 'failedCount': 0, 'skippedCount': 0,
+            'successReports': [{'reportDate': report.report_date, 'id': index} for index, report in enumerate(reports)],
+            'failedReports': []
+        }
+    }, backend='json')
+
+    print(f"JSON库对比: {excel_path}（{count} 条日报，请求体 {len(dumps_bytes(api_data)) / 1024:.1f} KB）")
+    print("=" * 80)
+
+    cases = [
+        ("字段序列化", lambda backend: [
+            dumps(report_dict[field], backend=backend) for report_dict in report_dicts for field in NESTED_FIELDS
+        ]),
+        ("请求体序列化", lambda backend: dumps_bytes(api_data, backend=backend)),
+        ("读取解析缓存", lambda backend: [loads(text, backend=backend) for text in report_texts]),
+        ("解析服务器响应", lambda backend: loads(response_text, backend=backend)),
+    ]
+
+    backends = available_backends()
+    print(f"{'环节':<16}" + ''.join(f"{backend + '(毫秒)':>16}" for backend in backends))
+    for label, run in cases:
+        row = f"{label:<16}"
+        for backend in backends:
+            row += f"{measure(lambda: run(backend)) * 1000:>16.2f}"
+        print(row)
+
+    print("=" * 80)
+    print(f"当前使用: {DEFAULT_BACKEND}")
+    if 'orjson' not in backends:
+        print("提示: 安装 orjson 后可对比 orjson（pip install orjson）")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+日报Excel解析性能对比工具
+功能：对比只读流式模式与完整编辑模式加载同一Excel文件的耗时和内存峰值
+"""
+
+import contextlib
+import io
+import sys
+import time
+import tracemalloc
+
+from parse_daily_report_excel import DailyReportExcelParser
+
+
+def measure_parse(excel_path: str, read_only: bool, repeat: int = 3) -> dict:
+    """
+    测量解析整个工作簿的耗时和内存峰值
+
+    :param excel_path: Excel文件路径
+    :param read_only: 是否使用只读流式模式
+    :param repeat: 计时重复次数（耗时取最小值）
+    :return: 测量结果字典
+    """
+    def run_once():
+        # 屏蔽解析过程中的逐表输出，避免干扰计时
+        with contextlib.redirect_stdout(io.StringIO()):
+            with DailyReportExcelParser(excel_path, read_only=read_only) as parser:
+                return parser.parse_all_sheets()
+
+    # 计时（不开启tracemalloc，避免内存追踪拖慢解析）
+    best_seconds = None
+    reports = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        reports = run_once()
+        elapsed = time.perf_counter() - start
+        best_seconds = elapsed if best_seconds is None else min(best_seconds, elapsed)
+
+    # 单独测量一次内存峰值
+    tracemalloc.start()
+    run_once()
+    _, peak_bytes = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        'seconds': best_seconds,
+        'peakBytes': peak_bytes,
+        'sheetCount': len(reports),
+        'reports': reports
+    }
+
+
+def main():
+    """主函数"""
+    if len(sys.argv) < 2:
+        print("使用方法: python benchmark_parser.py <excel文件路径> [重复次数]")
+        print("示例: python benchmark_parser.py docs/assets/淮安日报2025.10.19.xlsx 3")
+        sys.exit(1)
+
+    excel_path = sys.argv[1]
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+
+    print(f"解析性能对比: {excel_path}（重复 {repeat} 次）")
+    print("=" * 80)
+
+    full = measure_parse(excel_path, read_only=False, repeat=repeat)
+    streaming = measure_parse(excel_path, read_only=True, repeat=repeat)
+
+    print(f"{'模式':<16}{'工作表数':>10}{'耗时(秒)':>14}{'内存峰值(MB)':>16}")
+    for label, result in (("完整编辑模式", full), ("只读流式模式", streaming)):
+        print(f"{label:<16}{result['sheetCount']:>10}"
+              f"{result['seconds']:>14.3f}{result['peakBytes'] / 1024 / 1024:>16.1f}")
+
+    print("=" * 80)
+    if streaming['seconds'] > 0:
+        print(f"耗时加速比: {full['seconds'] / streaming['seconds']:.2f}x")
+    if streaming['peakBytes'] > 0:
+        print(f"内存降低比: {full['peakBytes'] / streaming['peakBytes']:.2f}x")
+
+    # 两种模式的解析结果必须一致
+    if full['reports'] == streaming['reports']:
+        print("✓ 两种模式解析结果一致")
+    else:
+        print("✗ 两种模式解析结果不一致")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+批量导入请求体内存占用对比工具
+功能：解析日报Excel并复制到指定条数，对比完整序列化（json.dumps + gzip.compress）和
+流式序列化（逐条序列化、边序列化边压缩）生成请求体时的峰值内存和耗时
+"""
+
+import contextlib
+import io
+import sys
+import time
+import tracemalloc
+from datetime import date, timedelta
+
+from convert_to_api_format import convert_to_api_format
+from services.batch_import_service import DEFAULT_BATCH_SIZE, split_batches
+from services.parse_service import ParseService
+from services.payload_stream import JsonStreamBody
+from services.request_compression import compress, encode_json
+
+
+def replicate_reports(reports: list, count: int) -> list:
+    """
+    把解析出的日报循环复制到指定条数（每条使用不同日期）
+
+    :param reports: 解析出的日报
+    :param count: 目标条数
+    :return: 日报列表
+    """
+    start = date(2025, 1, 1)
+    return [
+        reports[index % len(reports)].with_date((start + timedelta(days=index)).strftime('%Y.%m.%d'))
+        for index in range(count)
+    ]
+
+
+def measure(label: str, send_batches, repeat: int = 3) -> dict:
+    """
+    测量生成所有批次请求体的峰值内存（tracemalloc，不含已有的日报数据）和耗时
+
+    :param label: 方式名称
+    :param send_batches: 生成并"发送"（丢弃）所有批次请求体的函数，返回发送的总字节数
+    :param repeat: 重复次数（耗时取最小值）
+    :return: 测量结果字典
+    """
+    best_seconds = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        send_batches()
+        elapsed = time.perf_counter() - start
+        best_seconds = elapsed if best_seconds is None else min(best_seconds, elapsed)
+
+    tracemalloc.start()
+    sent_bytes = send_batches()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {'label': label, 'peak': peak, 'bytes': sent_bytes, 'seconds': best_seconds}
+
+
+def main():
+    """主函数"""
+    if len(sys.argv) < 2:
+        print("使用方法: python benchmark_payload.py <excel文件路径> [日报条数] [每批条数]")
+        print("示例: python benchmark_payload.py docs/assets/淮安日报2025.10.19.xlsx 1000 100")
+        sys.exit(1)
+
+    excel_path = sys.argv[1]
+    count = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+    batch_size = int(sys.argv[3]) if len(sys.argv) > 3 else DEFAULT_BATCH_SIZE
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        parsed = ParseService().parse_reports([excel_path])
+    if not parsed:
+        print("错误: 没有解析到有效数据")
+        sys.exit(1)
+
+    reports = replicate_reports(parsed, count)
+    api_data = convert_to_api_format(reports, project_id=1, reporter_id=1)
+
+    print(f"请求体内存对比: {excel_path}（{count} 条日报，每批 {batch_size} 条）")
+    print("=" * 80)
+
+    def buffered(encoding):
+        def send_batches():
+            sent = 0
+            for batch in split_batches(api_data, batch_size):
+                body = encode_json(batch)
+                sent += len(compress(body, encoding) if encoding else body)
+            return sent
+        return send_batches
+
+    def streamed(encoding):
+        def send_batches():
+            sent = 0
+            for batch in split_batches(api_data, batch_size):
+                for chunk in JsonStreamBody(batch, encoding=encoding):
+                    sent += len(chunk)
+            return sent
+        return send_batches
+
+    results = []
+    for encoding in (None, 'gzip'):
+        suffix = f" + {encoding}" if encoding else ''
+        results.append(measure(f"完整序列化{suffix}", buffered(encoding)))
+        results.append(measure(f"流式序列化{suffix}", streamed(encoding)))
+
+    print(f"{'方式':<22}{'峰值内存(KB)':>14}{'发送(KB)':>12}{'耗时(毫秒)':>14}")
+    for result in results:
+        print(f"{result['label']:<22}{result['peak'] / 1024:>14.1f}"
+              f"{result['bytes'] / 1024:>12.1f}{result['seconds'] * 1000:>14.2f}")
+    print("=" * 80)
+    print("提示: 峰值内存为生成请求体时新分配的内存，每批单独发送；并发上传时按并发批次数成倍增加")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,286 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+解析与上传基准测试套件
+功能：生成指定规模的合成日报工作簿（或使用已有Excel），分别测量 parse_sheet、parse_all_sheets、
+convert_to_api_format、summarize_reports 以及端到端上传（解析 + 转换 + 分批上传到本地桩服务器）的吞吐量（工作表/秒）
+和峰值RSS；可保存结果作为基线，再次运行时与基线对比，性能退化超过阈值时以非零状态退出
+
+每个环节在单独的子进程中运行，峰值RSS互不影响（含该环节启动的解析子进程中最大的一个）
+"""
+
+import argparse
+import gzip
+import json
+import multiprocessing
+import os
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional
+
+try:
+    import resource
+except ImportError:  # Windows 没有 resource 模块，不统计峰值RSS
+    resource = None
+
+from convert_to_api_format import convert_to_api_format
+from parse_daily_report_excel import DailyReportExcelParser
+from services.batch_import_service import BATCH_IMPORT_ENDPOINT, BatchImportService
+from services.http_session import close_session
+from services.parse_service import ParseService
+from services.report_summary import summarize_reports
+from services.request_compression import zstandard
+from synthetic_workbook import generate_workbook
+
+# 测试环节（按执行顺序）：(名称, 说明)
+STAGES = (
+    ('parse_sheet', '逐表解析'),
+    ('parse_all_sheets', '整簿解析'),
+    ('convert_to_api_format', '格式转换'),
+    ('summarize_reports', '汇总统计'),
+    ('upload', '端到端上传'),
+)
+
+# 与基线对比时允许的退化比例（吞吐量下降或峰值RSS上升超过该比例视为退化）
+DEFAULT_TOLERANCE = 0.2
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """桩服务器请求处理：接受批量导入请求（支持分块传输和gzip/zstd压缩），全部返回导入成功"""
+
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_POST(self):
+        if self.path != BATCH_IMPORT_ENDPOINT:
+            return self._reply(404, {'code': 0, 'msg': '接口不存在'})
+
+        body = self._read_body()
+        encoding = self.headers.get('Content-Encoding')
+        if encoding == 'gzip':
+            body = gzip.decompress(body)
+        elif encoding == 'zstd' and zstandard is not None:
+            body = zstandard.ZstdDecompressor().decompressobj().decompress(body)
+        elif encoding:
+            return self._reply(415, {'code': 0, 'msg': f'不支持的压缩编码: {encoding}'})
+
+        reports = json.loads(body)['reports']
+        self._reply(200, {'code': 1, 'msg': '导入成功', 'data': {
+            'totalCount': len(reports), 'successCount': len(reports), 'failedCount': 0, 'skippedCount': 0,
+            'successReports': [{'reportDate': report['reportDate']} for report in reports],
+            'failedReports': []
+        }})
+
+    def _read_body(self) -> bytes:
+        """读取请求体（Content-Length 或分块传输）"""
+        if self.headers.get('Transfer-Encoding', '').lower() != 'chunked':
+            return self.rfile.read(int(self.headers.get('Content-Length') or 0))
+        chunks = []
+        while True:
+            size = int(self.rfile.readline().split(b';')[0].strip(), 16)
+            if size == 0:
+                self.rfile.readline()
+                return b''.join(chunks)
+            chunks.append(self.rfile.read(size))
+            self.rfile.readline()
+
+    def _reply(self, status: int, data: Dict):
+        body = json.dumps(data, ensure_ascii=False).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def peak_rss_bytes() -> Optional[int]:
+    """
+    当前进程及其已结束子进程中最大的峰值RSS
+
+    :return: 字节数，不支持的平台返回None
+    """
+    if resource is None:
+        return None
+    peak = max(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+               resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss)
+    # macOS 的 ru_maxrss 单位为字节，Linux 为KB
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+
+def run_stage(stage: str, excel_path: str, repeat: int, server_url: str = None) -> Dict:
+    """
+    执行一个测试环节（在子进程中执行，必须是模块级函数）
+
+    :param stage: 环节名称（见 STAGES）
+    :param excel_path: Excel文件路径
+    :param repeat: 重复次数（耗时取最小值）
+    :param server_url: 桩服务器地址（端到端上传使用）
+    :return: 测量结果字典（seconds / sheetCount / peakRssBytes）
+    """
+    reports = []
+    if stage in ('convert_to_api_format', 'summarize_reports'):
+        reports = ParseService(use_cache=False).parse_reports([excel_path])
+
+    best_seconds = None
+    sheet_count = 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        if stage == 'parse_sheet':
+            # 不计打开工作簿的耗时，只计逐表解析
+            with DailyReportExcelParser(excel_path, read_only=True) as parser:
+                sheet_names = list(parser.workbook.sheetnames)
+                start = time.perf_counter()
+                for sheet_name in sheet_names:
+                    parser.parse_sheet(sheet_name)
+            sheet_count = len(sheet_names)
+        elif stage == 'parse_all_sheets':
+            with DailyReportExcelParser(excel_path, read_only=True) as parser:
+                sheet_count = len(parser.parse_all_sheets())
+        elif stage == 'convert_to_api_format':
+            sheet_count = len(convert_to_api_format(reports, project_id=1, reporter_id=1)['reports'])
+        elif stage == 'summarize_reports':
+            sheet_count = summarize_reports(reports)['reportCount']
+        elif stage == 'upload':
+            # 与上传服务相同的流程，但不使用解析缓存、上传日志和已上传索引，不影响本机的配置目录
+            parsed = ParseService(use_cache=False).parse_reports([excel_path])
+            api_data = convert_to_api_format(parsed, project_id=1, reporter_id=1, overwrite_existing=True)
+            result = BatchImportService(server_url, 'benchmark').import_reports(api_data)
+            if result['successCount'] != len(parsed):
+                raise Exception(f"上传结果不完整：成功 {result['successCount']} / {len(parsed)} 条")
+            sheet_count = len(parsed)
+        else:
+            raise ValueError(f'未知的测试环节: {stage}')
+        elapsed = time.perf_counter() - start
+        best_seconds = elapsed if best_seconds is None else min(best_seconds, elapsed)
+
+    close_session()
+    return {'seconds': best_seconds, 'sheetCount': sheet_count, 'peakRssBytes': peak_rss_bytes()}
+
+
+def run_suite(excel_path: str, stages, repeat: int) -> Dict[str, Dict]:
+    """
+    依次在独立子进程中执行各测试环节
+
+    :param excel_path: Excel文件路径
+    :param stages: 要执行的环节名称
+    :param repeat: 每个环节的重复次数
+    :return: {环节名称: 测量结果}，额外包含 sheetsPerSecond
+    """
+    server = ThreadingHTTPServer(('127.0.0.1', 0), StubHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    server_url = f"http://127.0.0.1:{server.server_port}"
+
+    results = {}
+    try:
+        for stage in stages:
+            # spawn：子进程不继承父进程的内存，峰值RSS只反映该环节
+            with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context('spawn')) as executor:
+                result = executor.submit(run_stage, stage, excel_path, repeat, server_url).result()
+            seconds = result['seconds']
+            result['sheetsPerSecond'] = result['sheetCount'] / seconds if seconds else 0.0
+            results[stage] = result
+    finally:
+        server.shutdown()
+        server.server_close()
+    return results
+
+
+def compare_with_baseline(results: Dict[str, Dict], baseline: Dict[str, Dict], tolerance: float) -> list:
+    """
+    与基线对比
+
+    :param results: 本次测量结果
+    :param baseline: 基线测量结果
+    :param tolerance: 允许的退化比例
+    :return: 退化描述列表（为空表示没有退化）
+    """
+    regressions = []
+    for stage, label in STAGES:
+        current, previous = results.get(stage), baseline.get(stage)
+        if not current or not previous:
+            continue
+        if previous.get('sheetsPerSecond') and \
+                current['sheetsPerSecond'] < previous['sheetsPerSecond'] * (1 - tolerance):
+            regressions.append(f"{label}: 吞吐量 {previous['sheetsPerSecond']:.1f} → "
+                               f"{current['sheetsPerSecond']:.1f} 表/秒")
+        if previous.get('peakRssBytes') and current['peakRssBytes'] and \
+                current['peakRssBytes'] > previous['peakRssBytes'] * (1 + tolerance):
+            regressions.append(f"{label}: 峰值RSS {previous['peakRssBytes'] / 1024 / 1024:.1f} → "
+                               f"{current['peakRssBytes'] / 1024 / 1024:.1f} MB")
+    return regressions
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """命令行参数"""
+    parser = argparse.ArgumentParser(description='日报解析与上传基准测试')
+    parser.add_argument('--excel', help='使用已有的Excel文件（不指定则生成合成工作簿）')
+    parser.add_argument('--sheets', type=int, default=31, help='合成工作簿的工作表（天）数，默认31')
+    parser.add_argument('--workers', type=int, default=25, help='每天的工作人员行数，默认25')
+    parser.add_argument('--machinery', type=int, default=6, help='每天的机械租赁行数，默认6')
+    parser.add_argument('--problems', type=int, default=3, help='每天的问题反馈行数，默认3')
+    parser.add_argument('--tasks', type=int, default=6, help='每天的逐项进度汇报行数，默认6')
+    parser.add_argument('--stages', nargs='+', choices=[stage for stage, _ in STAGES],
+                        default=[stage for stage, _ in STAGES], help='要执行的环节，默认全部')
+    parser.add_argument('--repeat', type=int, default=3, help='每个环节的重复次数（耗时取最小值），默认3')
+    parser.add_argument('--save', help='把结果保存为JSON文件（可作为之后对比的基线）')
+    parser.add_argument('--baseline', help='与基线结果（--save 保存的JSON文件）对比')
+    parser.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE,
+                        help=f'允许的退化比例，默认{DEFAULT_TOLERANCE}')
+    return parser
+
+
+def main():
+    """主函数"""
+    args = build_parser().parse_args()
+    config = {key: getattr(args, key) for key in ('excel', 'sheets', 'workers', 'machinery', 'problems', 'tasks')}
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        excel_path = args.excel
+        if not excel_path:
+            excel_path = generate_workbook(
+                os.path.join(temp_dir, 'synthetic.xlsx'), sheets=args.sheets, tasks=args.tasks,
+                workers=args.workers, machinery=args.machinery, problems=args.problems
+            )
+        print(f"基准测试: {args.excel or '合成工作簿'}（{os.path.getsize(excel_path) / 1024:.0f} KB，"
+              f"重复 {args.repeat} 次）")
+        print("=" * 80)
+        results = run_suite(excel_path, args.stages, args.repeat)
+
+    print(f"{'环节':<16}{'工作表数':>10}{'耗时(秒)':>12}{'吞吐量(表/秒)':>16}{'峰值RSS(MB)':>14}")
+    for stage, label in STAGES:
+        result = results.get(stage)
+        if not result:
+            continue
+        rss = f"{result['peakRssBytes'] / 1024 / 1024:.1f}" if result['peakRssBytes'] else '-'
+        print(f"{label:<16}{result['sheetCount']:>10}{result['seconds']:>12.3f}"
+              f"{result['sheetsPerSecond']:>16.1f}{rss:>14}")
+    print("=" * 80)
+
+    if args.save:
+        with open(args.save, 'w', encoding='utf-8') as f:
+            json.dump({'config': config, 'results': results}, f, ensure_ascii=False, indent=2)
+        print(f"✓ 结果已保存: {args.save}")
+
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        if baseline.get('config') != config:
+            print("⚠️  基线的测试参数与本次不同，对比结果仅供参考")
+        regressions = compare_with_baseline(results, baseline.get('results', {}), args.tolerance)
+        if regressions:
+            print(f"✗ 相对基线的性能退化超过 {args.tolerance:.0%}:")
+            for regression in regressions:
+                print(f"  - {regression}")
+            sys.exit(1)
+        print(f"✓ 未发现超过 {args.tolerance:.0%} 的性能退化")
+
+
+if __name__ == "__main__":
+    main()
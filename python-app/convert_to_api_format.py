@@ -7,12 +7,20 @@
 import json
 import sys
 
+from report_model import as_daily_report
+from services.json_codec import dumps as json_dumps
+
+
+def _dumps_items(items):
+    """明细列表序列化为JSON字符串"""
+    return json_dumps([item.to_dict() for item in items])
+
 
 def convert_to_api_format(parsed_data, project_id, reporter_id, overwrite_existing=False):
     """
     将解析后的JSON转换为API批量导入格式
     
-    :param parsed_data: 解析后的日报数据列表
+    :param parsed_data: 解析后的日报列表（DailyReport 或从JSON文件读取的字典）
     :param project_id: 项目ID
     :param reporter_id: 填报人ID
     :param overwrite_existing: 是否覆盖已存在的记录，默认False
@@ -21,22 +29,23 @@ def convert_to_api_format(parsed_data, project_id, reporter_id, overwrite_existi
     reports = []
     
     for report in parsed_data:
+        report = as_daily_report(report)
         # 转换单个日报数据
         api_report = {
-            "reportDate": report.get("reportDate", ""),
-            "reporterName": report.get("reporterName", ""),  # ✅ 改为 reporterName（从 projectName）
-            "overallProgress": report.get("overallProgress", "normal"),
-            "progressDescription": report.get("progressDescription", ""),  # ✅ 保留 progressDescription
-            "taskProgressList": json.dumps(report.get("taskProgressList", []), ensure_ascii=False),
-            "tomorrowPlans": json.dumps(report.get("tomorrowPlans", []), ensure_ascii=False),
-            "workerReports": json.dumps(report.get("workerReports", []), ensure_ascii=False),
-            "machineryRentals": json.dumps(report.get("machineryRentals", []), ensure_ascii=False),
-            "problemFeedbacks": json.dumps(report.get("problemFeedbacks", []), ensure_ascii=False),
-            "requirements": json.dumps(report.get("requirements", []), ensure_ascii=False),
-            "weather": report.get("weather"),
-            "temperature": report.get("temperature"),
-            "onSitePersonnelCount": report.get("onSitePersonnelCount", 0),
-            "remarks": report.get("remarks")
+            "reportDate": report.report_date,
+            "reporterName": report.reporter_name,  # ✅ 改为 reporterName（从 projectName）
+            "overallProgress": report.overall_progress,
+            "progressDescription": report.progress_description,  # ✅ 保留 progressDescription
+            "taskProgressList": _dumps_items(report.task_progress_list),
+            "tomorrowPlans": _dumps_items(report.tomorrow_plans),
+            "workerReports": _dumps_items(report.worker_reports),
+            "machineryRentals": _dumps_items(report.machinery_rentals),
+            "problemFeedbacks": _dumps_items(report.problem_feedbacks),
+            "requirements": _dumps_items(report.requirements),
+            "weather": report.weather,
+            "temperature": report.temperature,
+            "onSitePersonnelCount": report.on_site_personnel_count,
+            "remarks": report.remarks
         }
         reports.append(api_report)
     
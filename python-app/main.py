@@ -7,8 +7,10 @@
 
 import sys
 import os
+import logging
 import traceback
 import warnings
+import multiprocessing
 
 # 忽略urllib3的OpenSSL警告
 warnings.filterwarnings('ignore', message='urllib3 v2 only supports OpenSSL 1.1.1+')
@@ -16,9 +18,15 @@ warnings.filterwarnings('ignore', message='urllib3 v2 only supports OpenSSL 1.1.
 from PyQt6.QtWidgets import QApplication, QMessageBox
 from PyQt6.QtCore import Qt, QTranslator, QLocale, QLibraryInfo
 
+from services.logging_config import setup_logging
+
+logger = logging.getLogger(__name__)
+
 
 def main():
     """主函数"""
+    setup_logging()
+    
     try:
         # 启用高DPI缩放
         QApplication.setHighDpiScaleFactorRoundingPolicy(
@@ -39,7 +47,7 @@ def main():
         # 加载Qt基础库的中文翻译
         if translator.load("qtbase_zh_CN", qt_translator_path):
             app.installTranslator(translator)
-            print("✅ Qt中文翻译加载成功")
+            logger.info("✅ Qt中文翻译加载成功")
         else:
             # 如果找不到翻译文件，尝试从PyQt6包目录加载
             try:
@@ -48,11 +56,11 @@ def main():
                 translations_path = os.path.join(pyqt6_path, "Qt6", "translations")
                 if translator.load("qtbase_zh_CN", translations_path):
                     app.installTranslator(translator)
-                    print("✅ Qt中文翻译加载成功（从PyQt6目录）")
+                    logger.info("✅ Qt中文翻译加载成功（从PyQt6目录）")
                 else:
-                    print("⚠️  未找到Qt中文翻译文件，将使用默认英文")
+                    logger.warning("⚠️  未找到Qt中文翻译文件，将使用默认英文")
             except Exception as e:
-                print(f"⚠️  加载翻译文件失败: {e}")
+                logger.warning("⚠️  加载翻译文件失败: %s", e)
         
         # 设置区域为中文
         QLocale.setDefault(QLocale(QLocale.Language.Chinese, QLocale.Country.China))
@@ -77,7 +85,7 @@ def main():
     except Exception as e:
         # 捕获所有异常并显示错误信息
         error_msg = f"程序启动失败：\n\n{str(e)}\n\n详细错误：\n{traceback.format_exc()}"
-        print(error_msg)  # 打印到控制台
+        logger.critical(error_msg)  # 记录到控制台和日志文件
         
         # 尝试显示错误对话框
         try:
@@ -116,5 +124,13 @@ def main():
 
 
 if __name__ == "__main__":
+    # 打包后的程序启动解析子进程时需要
+    multiprocessing.freeze_support()
+    
+    # 无界面上传：main.py upload <文件/目录/通配符> ...（打包后的程序同样可用）
+    if len(sys.argv) > 1 and sys.argv[1] == 'upload':
+        from upload_cli import main as upload_main
+        sys.exit(upload_main(sys.argv[2:]))
+    
     main()
 
@@ -7,343 +7,321 @@
 
 import openpyxl
 import json
+import logging
 import sys
 from datetime import datetime
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Iterator
+
+from report_model import (
+    DailyReport, MachineryRental, ProblemFeedback, Requirement, TaskProgress, TomorrowPlan, WorkerReport
+)
+
+logger = logging.getLogger(__name__)
+
+# 解析器版本号：解析逻辑或输出字段变化时递增，使旧的解析缓存失效
+PARSER_VERSION = "4"
+
+# 解析时读取的最大列号（A~G列）
+MAX_SCAN_COL = 7
+
+# 大区域标题（序号列中的中文序号）
+# 一：项目整体进度（含逐项进度汇报2.x、明日工作计划3.x）
+# 二：各工种工作汇报  三：机械租赁情况  四：问题反馈/需求描述
+SECTION_TITLES = ('一', '二', '三', '四', '五', '六', '七', '八', '九', '十')
+
+
+class SheetRows:
+    """工作表行快照：一次性按行读取单元格值，解析时按行列号取值"""
+    
+    def __init__(self, title: str, rows: List[tuple]):
+        self.title = title
+        self.rows = rows
+    
+    def value(self, row: int, col: int) -> Any:
+        """获取单元格原始值（行列号从1开始），超出范围返回None"""
+        if row > len(self.rows):
+            return None
+        values = self.rows[row - 1]
+        return values[col - 1] if col <= len(values) else None
+
 
 class DailyReportExcelParser:
     """日报Excel解析器"""
     
-    def __init__(self, excel_path: str):
+    def __init__(self, excel_path: str, read_only: bool = True):
         """
         初始化解析器
         :param excel_path: Excel文件路径
+        :param read_only: 是否使用只读流式模式加载（默认True）。
+                          只读模式按行流式读取单元格值，不构建样式和合并单元格，
+                          内存占用和加载时间远低于完整编辑模式
         """
         self.excel_path = excel_path
-        self.workbook = openpyxl.load_workbook(excel_path)
+        self.read_only = read_only
+        self.workbook = openpyxl.load_workbook(excel_path, read_only=read_only)
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+    
+    def close(self):
+        """关闭工作簿（只读模式下会释放文件句柄）"""
+        if self.workbook is not None:
+            self.workbook.close()
         
-    def parse_sheet(self, sheet_name: str = None) -> Dict[str, Any]:
+    def parse_sheet(self, sheet_name: str = None) -> DailyReport:
         """
         解析指定工作表
         :param sheet_name: 工作表名称，不指定则使用活动工作表
-        :return: 解析后的数据字典
+        :return: 解析后的日报
         """
         if sheet_name:
             ws = self.workbook[sheet_name]
         else:
             ws = self.workbook.active
-            
-        report_data = {
-            "reportDate": sheet_name if sheet_name else ws.title,
-            "reporterName": self._get_cell_value(ws, 1, 1).replace("项目工作日报", "").strip(),  # ✅ 改为 reporterName
-            "overallProgress": None,
-            "progressDescription": None,
-            "taskProgressList": [],
-            "tomorrowPlans": [],
-            "workerReports": [],
-            "machineryRentals": [],
-            "problemFeedbacks": [],
-            "requirements": [],
-            "weather": None,
-            "temperature": None,
-            "onSitePersonnelCount": 0,
-            "remarks": None
-        }
+        
+        # 一次性按行读取需要的单元格值，后续解析不再访问工作表
+        ws = self._load_sheet_rows(ws)
         
         # 解析项目整体进度 (第3行)
         progress_desc = self._get_cell_value(ws, 3, 5)
-        report_data["progressDescription"] = progress_desc
         # 根据描述内容判断进度状态
         if "正常" in progress_desc:
-            report_data["overallProgress"] = "normal"
+            overall_progress = "normal"
         elif "滞后" in progress_desc:
-            report_data["overallProgress"] = "delayed"
+            overall_progress = "delayed"
         elif "超前" in progress_desc:
-            report_data["overallProgress"] = "ahead"
+            overall_progress = "ahead"
         else:
-            report_data["overallProgress"] = "normal"
-        
-        # 解析逐项进度汇报 (第6行开始，只保留序号2.x)
-        report_data["taskProgressList"] = self._parse_task_progress(ws, start_row=6, end_row=20)
+            overall_progress = "normal"
         
-        # 解析明天工作计划 (第6行开始，只保留序号3.x)
-        report_data["tomorrowPlans"] = self._parse_tomorrow_plans(ws, start_row=6, end_row=20)
+        # 单次遍历工作表，按区域分发各行数据
+        sections = self._scan_sheet(ws)
         
-        # 解析各工种工作汇报 (从第20行开始扫描，自动检测"二"区域)
-        report_data["workerReports"] = self._parse_worker_reports(ws, start_row=20, end_row=70)
-        
-        # 统计现场总人数
-        report_data["onSitePersonnelCount"] = len([w for w in report_data["workerReports"] if w.get("name")])
-        
-        # 解析机械租赁情况 (从第20行开始扫描，自动检测"三"区域)
-        report_data["machineryRentals"] = self._parse_machinery_rentals(ws, start_row=20, end_row=70)
-        
-        # 解析问题反馈 (从第20行开始扫描，自动检测"四"区域，只保留序号1.x)
-        report_data["problemFeedbacks"] = self._parse_problem_feedbacks(ws, start_row=20, end_row=80)
-        
-        # 解析需求描述 (从第20行开始扫描，自动检测"四"区域，只保留序号2.x)
-        report_data["requirements"] = self._parse_requirements(ws, start_row=20, end_row=80)
+        return DailyReport(
+            report_date=sheet_name if sheet_name else ws.title,
+            reporter_name=self._get_cell_value(ws, 1, 1).replace("项目工作日报", "").strip(),
+            overall_progress=overall_progress,
+            progress_description=progress_desc,
+            weather=None,
+            temperature=None,
+            # 统计现场总人数
+            on_site_personnel_count=len([w for w in sections["worker_reports"] if w.name]),
+            remarks=None,
+            **sections
+        )
+    
+    def _load_sheet_rows(self, ws, max_col: int = MAX_SCAN_COL) -> SheetRows:
+        """
+        按行读取工作表的单元格值（values_only），生成行快照
+        读取到工作表的实际最后一行，并去掉末尾的空行
+        :param ws: 工作表（只读或编辑模式均可）
+        :param max_col: 读取的最大列号
+        :return: 行快照
+        """
+        if self.read_only:
+            # 只读模式下工作表记录的尺寸可能不准确，按实际数据行读取
+            ws.reset_dimensions()
+        rows = list(ws.iter_rows(min_row=1, max_col=max_col, values_only=True))
         
-        return report_data
+        # 去掉末尾的空行
+        while rows and all(v is None or str(v).strip() == "" for v in rows[-1]):
+            rows.pop()
+        return SheetRows(ws.title, rows)
     
-    def _get_cell_value(self, ws, row: int, col: int) -> str:
+    def _get_cell_value(self, ws: SheetRows, row: int, col: int) -> str:
         """获取单元格值，返回字符串"""
-        value = ws.cell(row=row, column=col).value
+        value = ws.value(row, col)
         return str(value).strip() if value is not None else ""
     
-    def _parse_task_progress(self, ws, start_row: int, end_row: int) -> List[Dict]:
-        """解析逐项进度汇报（序号2.x）"""
-        tasks = []
-        for i in range(start_row, end_row + 1):
-            task_no = self._get_cell_value(ws, i, 1)
-            task_name = self._get_cell_value(ws, i, 2)
-            planned_progress = self._get_cell_value(ws, i, 3)
-            actual_progress = self._get_cell_value(ws, i, 5)
-            deviation_reason = self._get_cell_value(ws, i, 6)
-            impact_measures = self._get_cell_value(ws, i, 7)
-            
-            # 只保存有内容且序号以"2."开头的任务
-            if task_name and task_no.startswith("2."):
-                tasks.append({
-                    "taskNo": task_no,
-                    "taskName": task_name,
-                    "plannedProgress": planned_progress,
-                    "actualProgress": actual_progress,
-                    "deviationReason": deviation_reason,
-                    "impactMeasures": impact_measures
-                })
-        return tasks
-    
-    def _parse_tomorrow_plans(self, ws, start_row: int, end_row: int) -> List[Dict]:
-        """解析明天工作计划（序号3.x）"""
-        plans = []
-        for i in range(start_row, end_row + 1):
-            plan_no = self._get_cell_value(ws, i, 1)
-            task_name = self._get_cell_value(ws, i, 2)
-            goal = self._get_cell_value(ws, i, 3)
-            responsible_person = self._get_cell_value(ws, i, 5)
-            required_resources = self._get_cell_value(ws, i, 6)
-            remarks = self._get_cell_value(ws, i, 7)
-            
-            # 只保存有内容且序号以"3."开头的计划
-            if task_name and plan_no.startswith("3."):
-                plans.append({
-                    "planNo": plan_no,  # ✅ 添加序号显示
-                    "taskName": task_name,
-                    "goal": goal,
-                    "responsiblePerson": responsible_person,
-                    "requiredResources": required_resources,
-                    "remarks": remarks
-                })
-        return plans
+    def _iter_row_texts(self, ws: SheetRows):
+        """
+        逐行读取单元格文本，每行只转换一次
+        :return: 各列去空白后的字符串元组迭代器
+        """
+        for values in ws.rows:
+            texts = tuple(str(v).strip() if v is not None else "" for v in values[:MAX_SCAN_COL])
+            if len(texts) < MAX_SCAN_COL:
+                texts += ("",) * (MAX_SCAN_COL - len(texts))
+            yield texts
     
-    def _parse_worker_reports(self, ws, start_row: int, end_row: int) -> List[Dict]:
-        """解析各工种工作汇报（区域二）"""
-        workers = []
-        in_target_area = False  # 是否进入目标区域（二）
+    def _scan_sheet(self, ws: SheetRows) -> Dict[str, List[Any]]:
+        """
+        单次遍历工作表，根据序号列的中文序号（一/二/三/四/五...）识别区域边界，
+        把每一行分发到当前所在区域
+        - 区域一：逐项进度汇报（序号2.x）、明日工作计划（序号3.x）
+        - 区域二：各工种工作汇报
+        - 区域三：机械租赁情况
+        - 区域四：问题反馈（子区域1）、需求描述（子区域2）
+        :param ws: 工作表行快照
+        :return: 各区域解析结果（键为 DailyReport 的明细列表字段名）
+        """
+        tasks, plans, workers, machinery, problems, requirements = [], [], [], [], [], []
+        section = '一'  # 当前所在区域，出现区域标题之前视为区域一
+        in_requirements_section = False  # 是否进入需求描述子区域（2）
         
-        for i in range(start_row, end_row + 1):
-            seq_no = self._get_cell_value(ws, i, 1)
-            name = self._get_cell_value(ws, i, 2)
-            
-            # 检测区域标题
-            if seq_no == '二':
-                in_target_area = True
-                continue  # 跳过标题行
+        for row in self._iter_row_texts(ws):
+            seq_no, name = row[0], row[1]
             
-            # 遇到下一个区域标题，停止解析
-            if seq_no in ['三', '四', '五'] and in_target_area:
-                break
-            
-            # 只在目标区域内解析数据
-            if not in_target_area:
+            # 区域标题行：切换当前区域
+            if seq_no in SECTION_TITLES:
+                section = seq_no
+                in_requirements_section = False
                 continue
             
-            # 跳过表头行
-            if name in ['姓名', '序号']:
+            # 各区域都只保存第二列有内容的行
+            if not name:
                 continue
             
-            job_type = self._get_cell_value(ws, i, 3)
-            worker_type = self._get_cell_value(ws, i, 4)
-            work_content = self._get_cell_value(ws, i, 5)
-            work_hours = self._get_cell_value(ws, i, 7)
-            
-            # 只保存有姓名的记录
-            if name:
-                workers.append({
-                    "seqNo": seq_no,
-                    "name": name,
-                    "jobType": job_type,
-                    "workerType": worker_type,
-                    "workContent": work_content,
-                    "workHours": work_hours
-                })
-        return workers
-    
-    def _parse_machinery_rentals(self, ws, start_row: int, end_row: int) -> List[Dict]:
-        """解析机械租赁情况（区域三）"""
-        machinery = []
-        in_target_area = False  # 是否进入目标区域（三）
-        
-        for i in range(start_row, end_row + 1):
-            seq_no = self._get_cell_value(ws, i, 1)
-            machine_name = self._get_cell_value(ws, i, 2)
-            
-            # 检测区域标题
-            if seq_no == '三':
-                in_target_area = True
-                continue  # 跳过标题行
+            if section == '一':
+                # 逐项进度汇报（序号2.x）和明日工作计划（序号3.x）
+                if seq_no.startswith("2."):
+                    tasks.append(self._task_progress_from_row(row))
+                elif seq_no.startswith("3."):
+                    plans.append(self._tomorrow_plan_from_row(row))
             
-            # 遇到下一个区域标题，停止解析
-            if seq_no in ['四', '五', '六'] and in_target_area:
-                break
+            elif section == '二':
+                # 各工种工作汇报，跳过表头行
+                if name not in ('姓名', '序号'):
+                    workers.append(self._worker_report_from_row(row))
             
-            # 只在目标区域内解析数据
-            if not in_target_area:
-                continue
-            
-            # 跳过表头行
-            if machine_name in ['机械名称', '序号']:
-                continue
+            elif section == '三':
+                # 机械租赁情况，跳过表头行
+                if name not in ('机械名称', '序号'):
+                    machinery.append(self._machinery_rental_from_row(row))
             
-            quantity = self._get_cell_value(ws, i, 3)
-            tonnage = self._get_cell_value(ws, i, 4)
-            usage = self._get_cell_value(ws, i, 5)
-            shift = self._get_cell_value(ws, i, 6)
-            remarks = self._get_cell_value(ws, i, 7)
-            
-            # 只保存有机械名称的记录
-            if machine_name:
-                machinery.append({
-                    "seqNo": seq_no,
-                    "machineName": machine_name,
-                    "quantity": quantity,
-                    "tonnage": tonnage,
-                    "usage": usage,
-                    "shift": shift,
-                    "remarks": remarks
-                })
-        return machinery
-    
-    def _parse_problem_feedbacks(self, ws, start_row: int, end_row: int) -> List[Dict]:
-        """解析问题反馈（区域四 -> 问题数据）"""
-        problems = []
-        in_target_area = False  # 是否进入目标区域（四）
+            elif section == '四':
+                # 问题反馈：支持两种格式
+                # 1. 纯数字格式（2、3、4...）- 10-19日之后的格式
+                # 2. "1.x"格式（1.1、1.2...）- 10-19日的格式
+                # 跳过表头行和子标题行（序号为"1"）
+                if name not in ('问题描述', '问题反馈', '序号', '需求描述') and seq_no != '1':
+                    is_numeric = seq_no.isdigit()
+                    is_sub_problem = seq_no.startswith('1.') and len(seq_no) > 2
+                    if is_numeric or is_sub_problem:
+                        problems.append(self._problem_feedback_from_row(row))
+                
+                # 需求描述：从子标题（序号为"2"且内容为"需求描述"）之后开始
+                if seq_no == '2' and name in ('需求描述', '需求'):
+                    in_requirements_section = True
+                elif in_requirements_section and name not in ('需求描述', '问题反馈', '序号'):
+                    requirements.append(self._requirement_from_row(row))
         
-        for i in range(start_row, end_row + 1):
-            problem_no = self._get_cell_value(ws, i, 1)
-            description = self._get_cell_value(ws, i, 2)
-            
-            # 检测区域标题
-            if problem_no == '四':
-                in_target_area = True
-                continue  # 跳过标题行
-            
-            # 遇到下一个区域标题，停止解析
-            if problem_no in ['五', '六'] and in_target_area:
-                break
-            
-            # 只在目标区域内解析数据
-            if not in_target_area:
-                continue
-            
-            # 跳过表头行和子标题行
-            if description in ['问题描述', '问题反馈', '序号', '需求描述']:
-                continue
-            
-            # 跳过子标题行（序号为"1"）
-            if problem_no == '1':
-                continue
-            
-            reason = self._get_cell_value(ws, i, 4)
-            impact = self._get_cell_value(ws, i, 5)
-            progress = self._get_cell_value(ws, i, 6)
-            
-            # ✅ 修改：支持两种格式
-            # 1. 纯数字格式（2、3、4...）- 10-19日之后的格式
-            # 2. "1.x"格式（1.1、1.2...）- 10-19日的格式
-            is_numeric = problem_no.isdigit() and problem_no != '1'
-            is_sub_problem = problem_no.startswith('1.') and len(problem_no) > 2
-            
-            if description and (is_numeric or is_sub_problem):
-                problems.append({
-                    "problemNo": problem_no,
-                    "description": description,
-                    "reason": reason,
-                    "impact": impact,
-                    "progress": progress
-                })
-        return problems
+        return {
+            "task_progress_list": tasks,
+            "tomorrow_plans": plans,
+            "worker_reports": workers,
+            "machinery_rentals": machinery,
+            "problem_feedbacks": problems,
+            "requirements": requirements
+        }
     
-    def _parse_requirements(self, ws, start_row: int, end_row: int) -> List[Dict]:
-        """解析需求描述（区域四 -> 子区域2）"""
-        requirements = []
-        in_target_area = False  # 是否进入目标区域（四）
-        in_requirements_section = False  # 是否进入需求描述子区域（2）
-        
-        for i in range(start_row, end_row + 1):
-            req_no = self._get_cell_value(ws, i, 1)
-            description = self._get_cell_value(ws, i, 2)
-            
-            # 检测区域标题
-            if req_no == '四':
-                in_target_area = True
-                continue  # 跳过标题行
-            
-            # 遇到下一个区域标题，停止解析
-            if req_no in ['五', '六'] and in_target_area:
-                break
-            
-            # 只在目标区域内解析数据
-            if not in_target_area:
-                continue
-            
-            # 检测需求描述子标题（序号为"2"且内容为"需求描述"）
-            if req_no == '2' and description in ['需求描述', '需求']:
-                in_requirements_section = True
-                continue  # 跳过子标题行
-            
-            # 只在需求描述子区域内解析数据
-            if not in_requirements_section:
-                continue
-            
-            # 跳过表头行
-            if description in ['需求描述', '问题反馈', '序号']:
-                continue
-            
-            urgency_level = self._get_cell_value(ws, i, 4)
-            expected_time = self._get_cell_value(ws, i, 6)
-            
-            # 保存有需求描述的记录（任何有内容的行）
-            if description:
-                requirements.append({
-                    "requirementNo": req_no,
-                    "description": description,
-                    "urgencyLevel": urgency_level,
-                    "expectedTime": expected_time
-                })
-        return requirements
+    @staticmethod
+    def _task_progress_from_row(row: tuple) -> TaskProgress:
+        """逐项进度汇报行"""
+        return TaskProgress(
+            task_no=row[0],
+            task_name=row[1],
+            planned_progress=row[2],
+            actual_progress=row[4],
+            deviation_reason=row[5],
+            impact_measures=row[6]
+        )
     
-    def parse_all_sheets(self) -> List[Dict[str, Any]]:
-        """解析所有工作表"""
-        all_reports = []
-        for sheet_name in self.workbook.sheetnames:
+    @staticmethod
+    def _tomorrow_plan_from_row(row: tuple) -> TomorrowPlan:
+        """明日工作计划行"""
+        return TomorrowPlan(
+            plan_no=row[0],
+            task_name=row[1],
+            goal=row[2],
+            responsible_person=row[4],
+            required_resources=row[5],
+            remarks=row[6]
+        )
+    
+    @staticmethod
+    def _worker_report_from_row(row: tuple) -> WorkerReport:
+        """各工种工作汇报行"""
+        return WorkerReport(
+            seq_no=row[0],
+            name=row[1],
+            job_type=row[2],
+            worker_type=row[3],
+            work_content=row[4],
+            work_hours=row[6]
+        )
+    
+    @staticmethod
+    def _machinery_rental_from_row(row: tuple) -> MachineryRental:
+        """机械租赁情况行"""
+        return MachineryRental(
+            seq_no=row[0],
+            machine_name=row[1],
+            quantity=row[2],
+            tonnage=row[3],
+            usage=row[4],
+            shift=row[5],
+            remarks=row[6]
+        )
+    
+    @staticmethod
+    def _problem_feedback_from_row(row: tuple) -> ProblemFeedback:
+        """问题反馈行"""
+        return ProblemFeedback(
+            problem_no=row[0],
+            description=row[1],
+            reason=row[3],
+            impact=row[4],
+            progress=row[5]
+        )
+    
+    @staticmethod
+    def _requirement_from_row(row: tuple) -> Requirement:
+        """需求描述行"""
+        return Requirement(
+            requirement_no=row[0],
+            description=row[1],
+            urgency_level=row[3],
+            expected_time=row[5]
+        )
+    
+    def iter_sheets(self, sheet_names: List[str] = None) -> Iterator[DailyReport]:
+        """
+        逐个解析工作表，每解析完一个工作表产出一个日报（解析失败的工作表会被跳过）
+        :param sheet_names: 只解析指定的工作表（按给定顺序），不指定则解析全部
+        :return: 日报迭代器
+        """
+        for sheet_name in (sheet_names if sheet_names is not None else self.workbook.sheetnames):
             try:
                 report = self.parse_sheet(sheet_name)
-                all_reports.append(report)
-                print(f"✓ 成功解析工作表: {sheet_name}")
             except Exception as e:
-                print(f"✗ 解析工作表 {sheet_name} 失败: {str(e)}")
-        return all_reports
+                logger.warning("✗ 解析工作表 %s 失败: %s", sheet_name, e)
+                continue
+            logger.debug("✓ 成功解析工作表: %s", sheet_name)
+            yield report
     
-    def generate_sql_insert(self, report_data: Dict[str, Any], project_id: int, reporter_id: int) -> str:
+    def parse_all_sheets(self, sheet_names: List[str] = None) -> List[DailyReport]:
+        """
+        解析所有工作表
+        :param sheet_names: 只解析指定的工作表（按给定顺序），不指定则解析全部
+        :return: 解析后的日报列表
+        """
+        return list(self.iter_sheets(sheet_names))
+    
+    @staticmethod
+    def generate_sql_insert(report: DailyReport, project_id: int, reporter_id: int) -> str:
         """
         生成SQL插入语句
-        :param report_data: 报告数据
+        :param report: 日报
         :param project_id: 项目ID
         :param reporter_id: 填报人ID
         :return: SQL插入语句
         """
+        report_data = report.to_dict()
+        
         # 转换JSON字段
         task_progress_list = json.dumps(report_data["taskProgressList"], ensure_ascii=False)
         tomorrow_plans = json.dumps(report_data["tomorrowPlans"], ensure_ascii=False)
@@ -385,57 +363,85 @@ INSERT INTO project_daily_reports (
 
 def main():
     """主函数"""
-    if len(sys.argv) < 2:
-        print("使用方法: python parse_daily_report_excel.py <excel文件路径> [输出JSON文件路径]")
-        print("示例: python parse_daily_report_excel.py docs/assets/淮安日报2025.10.19.xlsx output.json")
-        sys.exit(1)
+    import argparse
+    from services.logging_config import setup_logging
+    from services.parse_service import ParseService
+    
+    arg_parser = argparse.ArgumentParser(
+        description="解析项目日报Excel文件，生成可保存到数据库的JSON数据",
+        epilog="示例: python parse_daily_report_excel.py docs/assets/淮安日报2025.10.19.xlsx output.json"
+    )
+    arg_parser.add_argument('paths', nargs='+',
+                            help='Excel文件路径（可指定多个）；最后一个以.json结尾的参数作为输出JSON文件路径')
+    arg_parser.add_argument('-o', '--output', help='输出JSON文件路径')
+    arg_parser.add_argument('-j', '--workers', type=int, default=None,
+                            help='并行解析的进程数，默认使用CPU核数')
+    arg_parser.add_argument('--no-cache', action='store_true',
+                            help='不使用解析缓存（~/.molten_salt_uploader/parse_cache），强制重新解析')
+    args = arg_parser.parse_args()
+    setup_logging(log_file=None)
     
-    excel_path = sys.argv[1]
-    output_path = sys.argv[2] if len(sys.argv) > 2 else None
+    # 兼容旧用法：<excel文件路径> [输出JSON文件路径]
+    excel_paths = list(args.paths)
+    output_path = args.output
+    if output_path is None and len(excel_paths) > 1 and excel_paths[-1].lower().endswith('.json'):
+        output_path = excel_paths.pop()
     
-    print(f"开始解析Excel文件: {excel_path}")
+    print(f"开始解析Excel文件: {', '.join(excel_paths)}")
     print("=" * 80)
     
     try:
-        parser = DailyReportExcelParser(excel_path)
+        # 多进程并行解析所有文件（只读流式模式），结果顺序与文件顺序一致
+        all_reports = []
+        failed_count = 0
+        for result in ParseService(max_workers=args.workers, use_cache=not args.no_cache).parse_files(excel_paths):
+            if result['error']:
+                failed_count += 1
+                print(f"✗ 文件 {result['filePath']} 解析失败: {result['error']}")
+                continue
+            all_reports.extend(result['reports'])
         
-        # 解析所有工作表
-        all_reports = parser.parse_all_sheets()
+        if not all_reports:
+            print("错误: 没有解析到有效数据")
+            sys.exit(1)
         
         print("=" * 80)
         print(f"解析完成！共解析 {len(all_reports)} 个工作表")
         
         # 输出统计信息
         for report in all_reports:
-            print(f"\n日期: {report['reportDate']}")
-            print(f"  - 项目名称: {report['reporterName']}")
-            print(f"  - 整体进度: {report['overallProgress']}")
-            print(f"  - 进度描述: {report['progressDescription']}")
-            print(f"  - 任务数量: {len(report['taskProgressList'])}")
-            print(f"  - 明日计划: {len(report['tomorrowPlans'])}")
-            print(f"  - 工作人员: {len(report['workerReports'])}")
-            print(f"  - 现场总人数: {report['onSitePersonnelCount']}")
-            print(f"  - 机械租赁: {len(report['machineryRentals'])}")
-            print(f"  - 问题反馈: {len(report['problemFeedbacks'])}")
-            print(f"  - 需求数量: {len(report['requirements'])}")
+            print(f"\n日期: {report.report_date}")
+            print(f"  - 项目名称: {report.reporter_name}")
+            print(f"  - 整体进度: {report.overall_progress}")
+            print(f"  - 进度描述: {report.progress_description}")
+            print(f"  - 任务数量: {len(report.task_progress_list)}")
+            print(f"  - 明日计划: {len(report.tomorrow_plans)}")
+            print(f"  - 工作人员: {len(report.worker_reports)}")
+            print(f"  - 现场总人数: {report.on_site_personnel_count}")
+            print(f"  - 机械租赁: {len(report.machinery_rentals)}")
+            print(f"  - 问题反馈: {len(report.problem_feedbacks)}")
+            print(f"  - 需求数量: {len(report.requirements)}")
         
         # 保存到JSON文件
         if output_path:
             with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(all_reports, f, ensure_ascii=False, indent=2)
+                json.dump([report.to_dict() for report in all_reports], f, ensure_ascii=False, indent=2)
             print(f"\n✓ 数据已保存到: {output_path}")
         else:
             # 输出第一个报告的详细JSON
             print("\n" + "=" * 80)
             print("第一个报告的详细数据（JSON格式）:")
             print("=" * 80)
-            print(json.dumps(all_reports[0], ensure_ascii=False, indent=2))
+            print(json.dumps(all_reports[0].to_dict(), ensure_ascii=False, indent=2))
         
         # 生成示例SQL
         print("\n" + "=" * 80)
         print("示例SQL插入语句（使用第一个报告）:")
         print("=" * 80)
-        print(parser.generate_sql_insert(all_reports[0], project_id=1, reporter_id=1))
+        print(DailyReportExcelParser.generate_sql_insert(all_reports[0], project_id=1, reporter_id=1))
+        
+        if failed_count:
+            sys.exit(1)
         
     except Exception as e:
         print(f"错误: {str(e)}")
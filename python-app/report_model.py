@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+日报数据模型
+解析结果使用带 __slots__ 的数据类保存（不为每个对象创建 __dict__、不重复保存字段名），
+工种、班次、序号等重复出现的短字符串在创建时驻留（sys.intern），同一个值只保存一份；
+与JSON（解析缓存、命令行输出、指纹）之间通过 to_dict / from_dict 按驼峰字段名转换
+"""
+
+import sys
+from dataclasses import dataclass, replace
+from typing import Any, Dict, List, Optional
+
+# 不超过该长度的字符串在创建对象时驻留（工种、班次、序号等短字符串重复率高，长描述几乎不重复）
+INTERN_MAX_LENGTH = 32
+
+
+def intern_text(value: Any) -> Any:
+    """
+    驻留短字符串（其他值原样返回）
+
+    :param value: 字段值
+    :return: 驻留后的字符串或原值
+    """
+    if type(value) is str and len(value) <= INTERN_MAX_LENGTH:
+        return sys.intern(value)
+    return value
+
+
+def _camel_case(name: str) -> str:
+    """下划线字段名转驼峰（task_progress_list -> taskProgressList）"""
+    head, *rest = name.split('_')
+    return head + ''.join(part.title() for part in rest)
+
+
+class _Record:
+    """数据类基类：按 __slots__ 转换字典、驻留短字符串、紧凑序列化（pickle）"""
+
+    __slots__ = ()
+
+    # 子类中为对象列表的字段：{字段名: 元素类型}
+    _LIST_FIELDS: Dict[str, type] = {}
+
+    # from_dict 时缺少字段的默认值（未列出的字段默认为None）
+    _DEFAULTS: Dict[str, Any] = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._KEYS = tuple(_camel_case(name) for name in cls.__slots__)
+
+    def __post_init__(self):
+        for name in self.__slots__:
+            if name not in self._LIST_FIELDS:
+                object.__setattr__(self, name, intern_text(getattr(self, name)))
+
+    def __reduce__(self):
+        # 按位置参数重建（经 __init__ 重新驻留），比默认的 (类, 字段字典) 更紧凑
+        return type(self), tuple(getattr(self, name) for name in self.__slots__)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        转换为字典（驼峰字段名，字段顺序与解析器原有输出一致）
+
+        :return: 可直接JSON序列化的字典
+        """
+        data = {}
+        for name, key in zip(self.__slots__, self._KEYS):
+            value = getattr(self, name)
+            if name in self._LIST_FIELDS:
+                value = [item.to_dict() for item in value]
+            data[key] = value
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]):
+        """
+        从字典（驼峰字段名）创建对象，缺少的字段使用默认值
+
+        :param data: 字典
+        :return: 数据对象
+        """
+        values = []
+        for name, key in zip(cls.__slots__, cls._KEYS):
+            item_type = cls._LIST_FIELDS.get(name)
+            if item_type is not None:
+                values.append([item_type.from_dict(item) for item in data.get(key) or []])
+            else:
+                values.append(data.get(key, cls._DEFAULTS.get(name)))
+        return cls(*values)
+
+
+@dataclass
+class TaskProgress(_Record):
+    """逐项进度汇报"""
+
+    __slots__ = ('task_no', 'task_name', 'planned_progress', 'actual_progress',
+                 'deviation_reason', 'impact_measures')
+
+    task_no: str
+    task_name: str
+    planned_progress: str
+    actual_progress: str
+    deviation_reason: str
+    impact_measures: str
+
+
+@dataclass
+class TomorrowPlan(_Record):
+    """明日工作计划"""
+
+    __slots__ = ('plan_no', 'task_name', 'goal', 'responsible_person', 'required_resources', 'remarks')
+
+    plan_no: str
+    task_name: str
+    goal: str
+    responsible_person: str
+    required_resources: str
+    remarks: str
+
+
+@dataclass
+class WorkerReport(_Record):
+    """各工种工作汇报"""
+
+    __slots__ = ('seq_no', 'name', 'job_type', 'worker_type', 'work_content', 'work_hours')
+
+    seq_no: str
+    name: str
+    job_type: str
+    worker_type: str
+    work_content: str
+    work_hours: str
+
+
+@dataclass
+class MachineryRental(_Record):
+    """机械租赁情况"""
+
+    __slots__ = ('seq_no', 'machine_name', 'quantity', 'tonnage', 'usage', 'shift', 'remarks')
+
+    seq_no: str
+    machine_name: str
+    quantity: str
+    tonnage: str
+    usage: str
+    shift: str
+    remarks: str
+
+
+@dataclass
+class ProblemFeedback(_Record):
+    """问题反馈"""
+
+    __slots__ = ('problem_no', 'description', 'reason', 'impact', 'progress')
+
+    problem_no: str
+    description: str
+    reason: str
+    impact: str
+    progress: str
+
+
+@dataclass
+class Requirement(_Record):
+    """需求描述"""
+
+    __slots__ = ('requirement_no', 'description', 'urgency_level', 'expected_time')
+
+    requirement_no: str
+    description: str
+    urgency_level: str
+    expected_time: str
+
+
+@dataclass
+class DailyReport(_Record):
+    """日报（一个工作表的解析结果）"""
+
+    __slots__ = ('report_date', 'reporter_name', 'overall_progress', 'progress_description',
+                 'task_progress_list', 'tomorrow_plans', 'worker_reports', 'machinery_rentals',
+                 'problem_feedbacks', 'requirements', 'weather', 'temperature',
+                 'on_site_personnel_count', 'remarks')
+
+    _LIST_FIELDS = {
+        'task_progress_list': TaskProgress,
+        'tomorrow_plans': TomorrowPlan,
+        'worker_reports': WorkerReport,
+        'machinery_rentals': MachineryRental,
+        'problem_feedbacks': ProblemFeedback,
+        'requirements': Requirement
+    }
+
+    _DEFAULTS = {
+        'report_date': '',
+        'reporter_name': '',
+        'overall_progress': 'normal',
+        'progress_description': '',
+        'on_site_personnel_count': 0
+    }
+
+    report_date: str
+    reporter_name: str
+    overall_progress: str
+    progress_description: str
+    task_progress_list: List[TaskProgress]
+    tomorrow_plans: List[TomorrowPlan]
+    worker_reports: List[WorkerReport]
+    machinery_rentals: List[MachineryRental]
+    problem_feedbacks: List[ProblemFeedback]
+    requirements: List[Requirement]
+    weather: Optional[str]
+    temperature: Optional[str]
+    on_site_personnel_count: int
+    remarks: Optional[str]
+
+    def with_date(self, report_date: str) -> 'DailyReport':
+        """
+        复制日报并修改日期（各明细列表共享，不复制）
+
+        :param report_date: 新日期
+        :return: 新日报
+        """
+        return replace(self, report_date=report_date)
+
+
+def as_daily_report(report) -> DailyReport:
+    """
+    统一为 DailyReport（兼容从JSON文件读取的字典）
+
+    :param report: DailyReport 或解析结果字典
+    :return: DailyReport
+    """
+    return report if isinstance(report, DailyReport) else DailyReport.from_dict(report)
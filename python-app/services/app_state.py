@@ -5,6 +5,10 @@
 单例模式，存储全局共享的数据
 """
 
+import logging
+
+logger = logging.getLogger(__name__)
+
 
 class AppState:
     """应用全局状态管理类（单例）"""
@@ -29,7 +33,7 @@ class AppState:
     def set_project_info(self, project_info: dict):
         """设置项目信息"""
         self._project_info = project_info
-        print(f"📦 全局状态：项目信息已更新 - {project_info.get('name', '未知项目') if project_info else 'None'}")
+        logger.info("📦 全局状态：项目信息已更新 - %s", project_info.get('name', '未知项目') if project_info else 'None')
     
     def get_project_info(self) -> dict:
         """获取项目信息"""
@@ -38,7 +42,7 @@ class AppState:
     def set_user_info(self, user_info: dict):
         """设置用户信息"""
         self._user_info = user_info
-        print(f"👤 全局状态：用户信息已更新 - {user_info.get('username', '未知用户') if user_info else 'None'}")
+        logger.info("👤 全局状态：用户信息已更新 - %s", user_info.get('username', '未知用户') if user_info else 'None')
     
     def get_user_info(self) -> dict:
         """获取用户信息"""
@@ -48,7 +52,7 @@ class AppState:
         """清空所有状态"""
         self._project_info = None
         self._user_info = None
-        print("🧹 全局状态：已清空")
+        logger.info("🧹 全局状态：已清空")
     
     def has_project_info(self) -> bool:
         """是否有项目信息"""
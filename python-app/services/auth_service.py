@@ -9,10 +9,17 @@ import warnings
 # 忽略urllib3的OpenSSL警告
 warnings.filterwarnings('ignore', message='urllib3 v2 only supports OpenSSL 1.1.1+')
 
+import logging
 import re
 import requests
 from typing import Optional, Dict
 
+from services.http_session import get_session
+from services.json_codec import loads
+from services.logging_config import LazyJson
+
+logger = logging.getLogger(__name__)
+
 
 class AuthService:
     """认证服务类"""
@@ -75,55 +82,39 @@ class AuthService:
             }
             login_type = "用户名"
         
-        # 打印日志
-        print("\n" + "="*60)
-        print("【登录请求】")
-        print(f"URL: {login_url}")
-        print(f"登录类型: {login_type}")
-        print(f"登录账号: {username}")
-        print(f"密码: {'*' * len(password)}")
-        print(f"请求数据: {data}")
-        print("="*60 + "\n")
+        logger.info("【登录请求】%s（%s: %s）", login_url, login_type, username)
+        logger.debug("请求数据: %s", LazyJson(data))
         
         try:
             # 发送登录请求
-            response = requests.post(
+            response = get_session(self.api_base_url).post(
                 login_url,
                 json=data,
                 timeout=10,
                 headers={"Content-Type": "application/json"}
             )
             
-            # 打印响应日志
-            print("\n" + "="*60)
-            print("【登录响应】")
-            print(f"状态码: {response.status_code}")
-            print(f"响应头: {dict(response.headers)}")
-            print(f"响应内容: {response.text[:500]}")  # 只打印前500字符
-            print("="*60 + "\n")
+            logger.debug("【登录响应】状态码: %s", response.status_code)
+            logger.debug("响应头: %s", response.headers)
+            logger.debug("响应内容: %s", LazyJson(response.text))
             
             # 检查响应状态
             if response.status_code != 200:
                 error_msg = self._extract_error_message(response)
-                print(f"\n❌ HTTP状态码错误: {response.status_code}")
-                print(f"错误信息: {error_msg}\n")
+                logger.error("❌ HTTP状态码错误: %s，错误信息: %s", response.status_code, error_msg)
                 raise Exception(error_msg)
             
             # 解析响应
             try:
-                result = response.json()
-                print(f"\n✅ JSON解析成功")
-                print(f"响应结构: {result}\n")
+                result = loads(response.content)
             except ValueError as e:
-                print(f"\n❌ JSON解析失败")
-                print(f"原始响应: {response.text}\n")
+                logger.error("❌ JSON解析失败，原始响应: %s", LazyJson(response.text))
                 raise ValueError(f'服务器响应格式错误：{str(e)}')
             
             # 检查响应码（后端成功码为1）
             if result.get('code') != 1:
                 error_msg = result.get('msg', result.get('message', '登录失败'))
-                print(f"\n❌ 业务状态码错误: {result.get('code')}")
-                print(f"错误信息: {error_msg}\n")
+                logger.error("❌ 业务状态码错误: %s，错误信息: %s", result.get('code'), error_msg)
                 raise Exception(error_msg)
             
             # 提取数据
@@ -132,17 +123,12 @@ class AuthService:
             self.token = data.get('token')
             self.refresh_token = data.get('refreshToken')
             
-            print(f"\n✅ 登录成功")
-            print(f"用户ID: {user_data.get('id')}")
-            print(f"用户名: {user_data.get('username')}")
-            print(f"姓名: {user_data.get('name')}")
-            print(f"角色: {user_data.get('role')}")
-            print(f"Token: {self.token[:30] if self.token else 'None'}...")
-            print(f"RefreshToken: {self.refresh_token[:30] if self.refresh_token else 'None'}...\n")
+            logger.info("✅ 登录成功: %s（ID: %s，姓名: %s，角色: %s）",
+                        user_data.get('username'), user_data.get('id'),
+                        user_data.get('name'), user_data.get('role'))
             
             if not self.token:
-                print(f"\n❌ Token缺失")
-                print(f"返回数据: {data}\n")
+                logger.error("❌ Token缺失，返回数据: %s", LazyJson(data))
                 raise Exception('服务器未返回Token')
             
             # 返回用户信息（包含完整的用户数据）
@@ -159,24 +145,19 @@ class AuthService:
             }
             
         except requests.exceptions.Timeout as e:
-            print(f"\n❌ 连接超时")
-            print(f"详细信息: {str(e)}\n")
+            logger.error("❌ 连接超时: %s", e)
             raise Exception('连接超时，请检查服务器地址')
         except requests.exceptions.ConnectionError as e:
-            print(f"\n❌ 连接错误")
-            print(f"详细信息: {str(e)}\n")
+            logger.error("❌ 连接错误: %s", e)
             raise Exception('无法连接到服务器，请检查服务器地址和网络')
         except requests.exceptions.RequestException as e:
-            print(f"\n❌ 网络请求异常")
-            print(f"详细信息: {str(e)}\n")
+            logger.error("❌ 网络请求异常: %s", e)
             raise Exception(f'网络请求失败：{str(e)}')
         except ValueError as e:
             # JSON解析错误（已在上面处理）
             raise Exception(f'服务器响应格式错误：{str(e)}')
         except Exception as e:
-            print(f"\n❌ 未知错误")
-            print(f"异常类型: {type(e).__name__}")
-            print(f"异常信息: {str(e)}\n")
+            logger.error("❌ 登录失败: %s: %s", type(e).__name__, e)
             # 如果异常信息为空，提供默认信息
             error_msg = str(e) if str(e) else '登录失败，请检查用户名和密码'
             raise Exception(error_msg)
@@ -189,7 +170,7 @@ class AuthService:
         :return: 错误信息
         """
         try:
-            result = response.json()
+            result = loads(response.content)
             # 优先使用 msg 字段，兼容 message 字段
             error_msg = result.get('msg', result.get('message', ''))
             if error_msg:
@@ -257,26 +238,19 @@ class AuthService:
         # 构建刷新URL
         refresh_url = f"{self.api_base_url}/api/v1/auth/refresh"
         
-        print("\n" + "="*60)
-        print("【Token刷新请求】")
-        print(f"URL: {refresh_url}")
-        print(f"RefreshToken: {self.refresh_token[:30] if self.refresh_token else 'None'}...")
-        print("="*60 + "\n")
+        logger.info("【Token刷新请求】%s", refresh_url)
         
         try:
             # 发送刷新请求
-            response = requests.post(
+            response = get_session(self.api_base_url).post(
                 refresh_url,
                 json={"refreshToken": self.refresh_token},
                 timeout=10,
                 headers={"Content-Type": "application/json"}
             )
             
-            print("\n" + "="*60)
-            print("【Token刷新响应】")
-            print(f"状态码: {response.status_code}")
-            print(f"响应内容: {response.text[:500]}")
-            print("="*60 + "\n")
+            logger.debug("【Token刷新响应】状态码: %s", response.status_code)
+            logger.debug("响应内容: %s", LazyJson(response.text))
             
             # 检查响应状态
             if response.status_code != 200:
@@ -285,7 +259,7 @@ class AuthService:
             
             # 解析响应
             try:
-                result = response.json()
+                result = loads(response.content)
             except ValueError as e:
                 raise ValueError(f'服务器响应格式错误：{str(e)}')
             
@@ -303,8 +277,7 @@ class AuthService:
             if new_refresh_token:
                 self.refresh_token = new_refresh_token
             
-            print(f"\n✅ Token刷新成功")
-            print(f"新Token: {self.token[:30] if self.token else 'None'}...\n")
+            logger.info("✅ Token刷新成功")
             
             if not self.token:
                 raise Exception('服务器未返回新Token')
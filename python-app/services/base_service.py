@@ -9,22 +9,43 @@ import warnings
 # 忽略urllib3的OpenSSL警告
 warnings.filterwarnings('ignore', message='urllib3 v2 only supports OpenSSL 1.1.1+')
 
+import logging
+import time
 import requests
 from typing import Optional, Dict, Any
 
+from services.http_session import get_session
+from services.json_codec import loads
+from services.logging_config import LazyJson
+from services.payload_stream import (
+    STREAM_REJECTED_STATUS_CODES, JsonStreamBody, is_stream_supported, mark_stream_unsupported
+)
+from services.request_compression import (
+    REJECTED_STATUS_CODES, choose_encoding, compress as compress_body, compress_json, encode_json,
+    is_request_body_rejected, mark_unsupported
+)
+from services.retry_policy import DEFAULT_RETRY_POLICY, RetryPolicy
+
+logger = logging.getLogger(__name__)
+
 
 class BaseService:
     """基础服务类"""
     
-    def __init__(self, api_base_url: str = None, token: str = None):
+    def __init__(self, api_base_url: str = None, token: str = None,
+                 session: requests.Session = None, retry_policy: RetryPolicy = None):
         """
         初始化基础服务
         
         :param api_base_url: API基础URL
         :param token: 认证Token
+        :param session: HTTP会话，默认使用服务层共享的连接池会话
+        :param retry_policy: 重试策略，默认使用服务层共享的策略（指数退避 + 重试预算）
         """
         self.api_base_url = api_base_url.rstrip('/') if api_base_url else None
         self.token = token
+        self.session = session or get_session(self.api_base_url)
+        self.retry_policy = retry_policy or DEFAULT_RETRY_POLICY
     
     def _get_headers(self, custom_headers: Dict = None, include_token: bool = True) -> Dict:
         """
@@ -49,7 +70,8 @@ class BaseService:
         return headers
     
     def get(self, endpoint: str, params: Dict = None, 
-            include_token: bool = True, timeout: int = 10) -> requests.Response:
+            include_token: bool = True, timeout: int = 10,
+            retry: bool = True) -> requests.Response:
         """
         发送GET请求
         
@@ -57,6 +79,7 @@ class BaseService:
         :param params: 查询参数
         :param include_token: 是否包含token
         :param timeout: 超时时间（秒）
+        :param retry: 是否按重试策略自动重试
         :return: 响应对象
         """
         if not self.api_base_url:
@@ -65,27 +88,24 @@ class BaseService:
         url = f"{self.api_base_url}{endpoint}"
         headers = self._get_headers(include_token=include_token)
         
-        print(f"\n[GET] {url}")
-        print(f"Headers: {self._safe_log_headers(headers)}")
-        if params:
-            print(f"Params: {params}")
+        logger.debug("[GET] %s Headers: %s Params: %s", url, self._safe_log_headers(headers), params)
         
         try:
-            response = requests.get(
-                url,
+            return self._send(
+                'GET', url, idempotent=True, retry=retry,
                 params=params,
                 headers=headers,
                 timeout=timeout
             )
-            print(f"Response: {response.status_code}")
-            return response
         except requests.exceptions.RequestException as e:
-            print(f"Request failed: {str(e)}")
+            logger.warning("Request failed: %s", e)
             raise
     
     def post(self, endpoint: str, data: Dict = None, json_data: Dict = None,
              include_token: bool = True, timeout: int = 10, 
-             custom_headers: Dict = None) -> requests.Response:
+             custom_headers: Dict = None, compress: bool = False,
+             retry: bool = True, idempotent: bool = False,
+             stream: bool = False) -> requests.Response:
         """
         发送POST请求
         
@@ -95,6 +115,13 @@ class BaseService:
         :param include_token: 是否包含token
         :param timeout: 超时时间（秒）
         :param custom_headers: 自定义请求头
+        :param compress: 是否压缩JSON请求体（Content-Encoding: gzip/zstd），
+                         服务器不支持时自动退回不压缩
+        :param retry: 是否按重试策略自动重试
+        :param idempotent: 重复发送是否安全（服务器会去重或覆盖）；
+                           非幂等请求只在连接未建立或服务器明确拒绝（429/503）时重试
+        :param stream: 是否逐条序列化JSON请求体的 reports 列表并分块传输，
+                       服务器不接受时自动改为发送完整请求体
         :return: 响应对象
         """
         if not self.api_base_url:
@@ -103,27 +130,110 @@ class BaseService:
         url = f"{self.api_base_url}{endpoint}"
         headers = self._get_headers(custom_headers=custom_headers, include_token=include_token)
         
-        print(f"\n[POST] {url}")
-        print(f"Headers: {self._safe_log_headers(headers)}")
+        logger.debug("[POST] %s Headers: %s", url, self._safe_log_headers(headers))
         if json_data:
-            print(f"JSON Data: {self._safe_log_data(json_data)}")
+            logger.debug("JSON Data: %s", LazyJson(json_data))
         
         try:
-            response = requests.post(
-                url,
+            if stream and json_data is not None and data is None:
+                response = self._post_stream(url, json_data, headers, timeout, retry, idempotent, compress)
+                if response is not None:
+                    return response
+            
+            if compress and json_data is not None and data is None:
+                response = self._post_compressed(url, json_data, headers, timeout, retry, idempotent)
+                if response is not None:
+                    return response
+            
+            return self._send(
+                'POST', url, idempotent=idempotent, retry=retry,
                 data=data,
                 json=json_data,
                 headers=headers,
                 timeout=timeout
             )
-            print(f"Response: {response.status_code}")
-            return response
         except requests.exceptions.RequestException as e:
-            print(f"Request failed: {str(e)}")
+            logger.warning("Request failed: %s", e)
             raise
     
+    def _post_compressed(self, url: str, json_data: Dict, headers: Dict, timeout: int,
+                         retry: bool, idempotent: bool) -> Optional[requests.Response]:
+        """
+        发送压缩的JSON请求体
+        
+        服务器拒绝压缩请求（415，或错误信息表明请求体无法解码的400，见 is_request_body_rejected）时
+        改为不压缩重发一次，不压缩的请求未被拒绝时，记录该主机不支持此编码，之后的请求不再压缩。
+        
+        :return: 响应对象，请求体过小或没有可用编码时返回None（由调用方按普通方式发送）
+        """
+        body, encoding, raw_size = compress_json(url, json_data)
+        if encoding is None:
+            return None
+        
+        logger.debug("Content-Encoding: %s（%.1f KB → %.1f KB）", encoding, raw_size / 1024, len(body) / 1024)
+        compressed_headers = dict(headers, **{'Content-Encoding': encoding})
+        response = self._send('POST', url, idempotent=idempotent, retry=retry,
+                              data=body, headers=compressed_headers, timeout=timeout)
+        if not is_request_body_rejected(response, REJECTED_STATUS_CODES):
+            return response
+        
+        logger.warning("⚠️  服务器拒绝%s压缩请求（HTTP %s），改为不压缩重发", encoding, response.status_code)
+        plain_response = self._send('POST', url, idempotent=idempotent, retry=retry,
+                                    json=json_data, headers=headers, timeout=timeout)
+        if not is_request_body_rejected(plain_response, REJECTED_STATUS_CODES):
+            mark_unsupported(url, encoding)
+        return plain_response
+    
+    def _post_stream(self, url: str, json_data: Dict, headers: Dict, timeout: int,
+                     retry: bool, idempotent: bool, compress: bool) -> Optional[requests.Response]:
+        """
+        以分块传输方式发送流式JSON请求体（边序列化边压缩）
+        
+        服务器拒绝分块传输的请求（411/413/415，或错误信息表明请求体无法读取的400，见 is_request_body_rejected；
+        数据校验失败的400直接返回，不重发）时，先以相同编码发送完整请求体：未被拒绝说明不接受分块传输，
+        记录该主机之后不再流式发送；仍被拒绝时改为不压缩发送，未被拒绝说明不接受该压缩编码，记录该编码。
+        
+        :return: 响应对象，已知主机不接受分块传输时返回None（由调用方发送完整请求体）
+        """
+        if not is_stream_supported(url):
+            return None
+        
+        encoding = choose_encoding(url) if compress else None
+        body = JsonStreamBody(json_data, encoding=encoding)
+        stream_headers = dict(headers, **{'Content-Encoding': encoding}) if encoding else headers
+        response = self._send('POST', url, idempotent=idempotent, retry=retry,
+                              data=body, headers=stream_headers, timeout=timeout)
+        if not is_request_body_rejected(response, STREAM_REJECTED_STATUS_CODES):
+            logger.debug("Transfer-Encoding: chunked%s（%.1f KB → %.1f KB）",
+                         f", Content-Encoding: {encoding}" if encoding else '',
+                         body.raw_size / 1024, body.sent_size / 1024)
+            return response
+        
+        logger.warning("⚠️  服务器拒绝分块传输的请求（HTTP %s），改为发送完整请求体重发", response.status_code)
+        # 与分块请求只差传输方式（编码相同），据此判断被拒绝的是分块传输还是压缩编码
+        if encoding:
+            full_response = self._send('POST', url, idempotent=idempotent, retry=retry,
+                                       data=compress_body(encode_json(json_data), encoding),
+                                       headers=stream_headers, timeout=timeout)
+        else:
+            full_response = self._send('POST', url, idempotent=idempotent, retry=retry,
+                                       json=json_data, headers=headers, timeout=timeout)
+        if not is_request_body_rejected(full_response, STREAM_REJECTED_STATUS_CODES):
+            mark_stream_unsupported(url)
+            return full_response
+        if not encoding:
+            return full_response
+        
+        logger.warning("⚠️  服务器拒绝%s压缩请求（HTTP %s），改为不压缩重发", encoding, full_response.status_code)
+        plain_response = self._send('POST', url, idempotent=idempotent, retry=retry,
+                                    json=json_data, headers=headers, timeout=timeout)
+        if not is_request_body_rejected(plain_response, REJECTED_STATUS_CODES):
+            mark_unsupported(url, encoding)
+        return plain_response
+    
     def put(self, endpoint: str, data: Dict = None, json_data: Dict = None,
-            include_token: bool = True, timeout: int = 10) -> requests.Response:
+            include_token: bool = True, timeout: int = 10,
+            retry: bool = True) -> requests.Response:
         """
         发送PUT请求
         
@@ -132,6 +242,7 @@ class BaseService:
         :param json_data: JSON数据
         :param include_token: 是否包含token
         :param timeout: 超时时间（秒）
+        :param retry: 是否按重试策略自动重试
         :return: 响应对象
         """
         if not self.api_base_url:
@@ -140,31 +251,29 @@ class BaseService:
         url = f"{self.api_base_url}{endpoint}"
         headers = self._get_headers(include_token=include_token)
         
-        print(f"\n[PUT] {url}")
-        print(f"Headers: {self._safe_log_headers(headers)}")
+        logger.debug("[PUT] %s Headers: %s", url, self._safe_log_headers(headers))
         
         try:
-            response = requests.put(
-                url,
+            return self._send(
+                'PUT', url, idempotent=True, retry=retry,
                 data=data,
                 json=json_data,
                 headers=headers,
                 timeout=timeout
             )
-            print(f"Response: {response.status_code}")
-            return response
         except requests.exceptions.RequestException as e:
-            print(f"Request failed: {str(e)}")
+            logger.warning("Request failed: %s", e)
             raise
     
     def delete(self, endpoint: str, include_token: bool = True, 
-               timeout: int = 10) -> requests.Response:
+               timeout: int = 10, retry: bool = True) -> requests.Response:
         """
         发送DELETE请求
         
         :param endpoint: API端点（相对路径）
         :param include_token: 是否包含token
         :param timeout: 超时时间（秒）
+        :param retry: 是否按重试策略自动重试
         :return: 响应对象
         """
         if not self.api_base_url:
@@ -173,21 +282,79 @@ class BaseService:
         url = f"{self.api_base_url}{endpoint}"
         headers = self._get_headers(include_token=include_token)
         
-        print(f"\n[DELETE] {url}")
-        print(f"Headers: {self._safe_log_headers(headers)}")
+        logger.debug("[DELETE] %s Headers: %s", url, self._safe_log_headers(headers))
         
         try:
-            response = requests.delete(
-                url,
+            return self._send(
+                'DELETE', url, idempotent=True, retry=retry,
                 headers=headers,
                 timeout=timeout
             )
-            print(f"Response: {response.status_code}")
-            return response
         except requests.exceptions.RequestException as e:
-            print(f"Request failed: {str(e)}")
+            logger.warning("Request failed: %s", e)
             raise
     
+    def _send(self, method: str, url: str, idempotent: bool, retry: bool = True,
+              **kwargs) -> requests.Response:
+        """
+        发送请求，按重试策略自动重试临时故障
+        
+        重试前按指数退避（全抖动）等待，服务器返回 Retry-After 时按其等待；
+        超出重试次数或重试预算时，返回最后一次响应或抛出最后一次异常。
+        
+        :param method: 请求方法
+        :param url: 完整URL
+        :param idempotent: 请求是否幂等
+        :param retry: 是否重试
+        :return: 响应对象
+        """
+        policy = self.retry_policy
+        policy.budget.record_request()
+        attempt = 1
+        while True:
+            try:
+                response = self.session.request(method, url, **kwargs)
+            except requests.exceptions.RequestException as e:
+                if not retry or not policy.should_retry_exception(e, idempotent):
+                    raise
+                delay = self._retry_delay(attempt, f"{type(e).__name__}")
+                if delay is None:
+                    raise
+            else:
+                logger.debug("Response: %s %s", response.status_code, url)
+                if not retry or not policy.should_retry_response(response, idempotent):
+                    return response
+                delay = self._retry_delay(attempt, f"HTTP {response.status_code}", response)
+                if delay is None:
+                    return response
+            
+            time.sleep(delay)
+            attempt += 1
+    
+    def _retry_delay(self, attempt: int, reason: str,
+                     response: requests.Response = None) -> Optional[float]:
+        """
+        计算下一次重试前的等待时间
+        
+        :param attempt: 已发送次数
+        :param reason: 失败原因（用于日志）
+        :param response: 触发重试的响应
+        :return: 等待秒数，不再重试时返回None
+        """
+        policy = self.retry_policy
+        if attempt >= policy.max_attempts:
+            logger.warning("⚠️  %s，已达最大重试次数（%d 次）", reason, policy.max_attempts)
+            return None
+        delay = policy.retry_delay(attempt, response)
+        if delay is None:
+            logger.warning("⚠️  %s，服务器要求等待时间过长，不再重试", reason)
+            return None
+        if not policy.budget.try_spend():
+            logger.warning("⚠️  %s，重试预算已用完，不再重试", reason)
+            return None
+        logger.warning("⚠️  %s，%.1f 秒后第 %d 次重试", reason, delay, attempt)
+        return delay
+    
     def _safe_log_headers(self, headers: Dict) -> Dict:
         """
         安全记录请求头（隐藏敏感信息）
@@ -200,19 +367,6 @@ class BaseService:
             safe_headers['token'] = f"{safe_headers['token'][:20]}..."
         return safe_headers
     
-    def _safe_log_data(self, data: Dict) -> str:
-        """
-        安全记录数据（隐藏敏感信息）
-        
-        :param data: 原始数据
-        :return: 安全的数据字符串（用于日志）
-        """
-        if isinstance(data, dict) and 'password' in data:
-            safe_data = data.copy()
-            safe_data['password'] = '******'
-            return str(safe_data)
-        return str(data)
-    
     def parse_response(self, response: requests.Response, 
                       expected_code: int = 1) -> Dict:
         """
@@ -230,7 +384,7 @@ class BaseService:
         
         # 解析JSON
         try:
-            result = response.json()
+            result = loads(response.content)
         except ValueError as e:
             raise ValueError(f'响应格式错误：{str(e)}')
         
@@ -249,7 +403,7 @@ class BaseService:
         :return: 错误信息
         """
         try:
-            result = response.json()
+            result = loads(response.content)
             return result.get('msg', result.get('message', ''))
         except:
             if response.status_code == 401:
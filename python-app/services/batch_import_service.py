@@ -0,0 +1,396 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+批量导入服务
+把日报分批调用批量导入API（每批不超过100条），多批并发发送并合并导入结果
+"""
+
+import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, Dict, List, Optional, Tuple
+
+from convert_to_api_format import convert_to_api_format
+from report_model import DailyReport
+from services.base_service import BaseService
+from services.logging_config import LazyJson
+from services.upload_index import UploadedReportIndex, normalize_report_date, report_fingerprint
+from services.upload_journal import (
+    BATCH_FAILED, BATCH_SENDING, BATCH_SUCCEEDED, UploadJournal
+)
+
+logger = logging.getLogger(__name__)
+
+# 批量导入API
+BATCH_IMPORT_ENDPOINT = '/api/v1/daily-reports/batch-import'
+
+# 每批日报数量（接口文档建议单次不超过100条，每条约50~100ms）
+DEFAULT_BATCH_SIZE = 100
+
+# 同时发送的批次数
+DEFAULT_MAX_CONCURRENCY = 3
+
+# 单批请求超时时间（秒）
+BATCH_TIMEOUT = 60
+
+
+def split_batches(api_data: Dict, batch_size: int = DEFAULT_BATCH_SIZE) -> List[Dict]:
+    """
+    把API格式的数据拆分为多批，每批保留相同的项目、填报人和覆盖选项
+
+    :param api_data: convert_to_api_format 的输出
+    :param batch_size: 每批日报数量
+    :return: 每批的API请求体列表
+    """
+    if batch_size < 1:
+        raise ValueError('每批日报数量必须大于0')
+
+    reports = api_data.get('reports', [])
+    header = {key: value for key, value in api_data.items() if key != 'reports'}
+    return [
+        dict(header, reports=reports[start:start + batch_size])
+        for start in range(0, len(reports), batch_size)
+    ]
+
+
+def is_batch_retry_safe(batch: Dict) -> bool:
+    """
+    判断一批日报重复发送是否安全（用于决定读取超时等不确定失败后能否自动重试）
+
+    服务器按 (projectId, reportDate) 识别日报：覆盖模式下重发会以相同数据覆盖，结果与第一次相同。
+    非覆盖模式下，若丢失响应的第一次请求实际已导入，重发时这些日报会被跳过或报"已存在"，
+    不会记入已上传日报索引，之后每次增量上传都会重新发送，因此不自动重发。
+    缺少项目或日报日期时服务器无法识别重复，也不自动重发。
+
+    :param batch: 单批API请求体
+    :return: 是否可以安全重发
+    """
+    if not batch.get('overwriteExisting') or not batch.get('projectId'):
+        return False
+    return all(report.get('reportDate') for report in batch.get('reports', []))
+
+
+def empty_import_result() -> Dict:
+    """构造空的导入结果"""
+    return {
+        'totalCount': 0,
+        'successCount': 0,
+        'failedCount': 0,
+        'skippedCount': 0,
+        'successReports': [],
+        'failedReports': []
+    }
+
+
+def merge_import_results(results: List[Dict]) -> Dict:
+    """
+    合并多批的导入结果（按批次顺序拼接明细）
+
+    :param results: 每批的导入结果列表
+    :return: 合并后的导入结果
+    """
+    merged = empty_import_result()
+    for result in results:
+        for key in ('totalCount', 'successCount', 'failedCount', 'skippedCount'):
+            merged[key] += result.get(key, 0) or 0
+        merged['successReports'].extend(result.get('successReports') or [])
+        merged['failedReports'].extend(result.get('failedReports') or [])
+    return merged
+
+
+def build_import_groups(
+    reports: List[DailyReport],
+    project_id: int,
+    reporter_id: int,
+    overwrite_existing: bool = False,
+    modified_reports: List[DailyReport] = None
+) -> List[Tuple[Dict, Dict[str, str]]]:
+    """
+    把解析后的日报转换为API格式，并计算各日报的内容指纹
+
+    已修改的日报（之前上传过、内容有变化）单独一组，总是以覆盖模式发送。
+
+    :param reports: 新增的日报（按 overwrite_existing 发送）
+    :param project_id: 项目ID
+    :param reporter_id: 填报人ID
+    :param overwrite_existing: 新增日报是否覆盖已存在的记录
+    :param modified_reports: 已修改的日报（覆盖发送）
+    :return: [(API请求数据, {日期(YYYY-MM-DD): 指纹})] 列表，跳过空组
+    """
+    groups = []
+    for group_reports, overwrite in ((reports, overwrite_existing), (modified_reports, True)):
+        if not group_reports:
+            continue
+        fingerprints = {
+            normalize_report_date(report.report_date): report_fingerprint(report)
+            for report in group_reports
+        }
+        api_data = convert_to_api_format(group_reports, project_id, reporter_id, overwrite)
+        groups.append((api_data, fingerprints))
+    return groups
+
+
+class BatchImportService(BaseService):
+    """批量导入服务类"""
+
+    def __init__(self, api_base_url: str = None, token: str = None,
+                 batch_size: int = DEFAULT_BATCH_SIZE,
+                 max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+                 compress: bool = True, journal: UploadJournal = None,
+                 uploaded_index: UploadedReportIndex = None, stream: bool = True):
+        """
+        初始化批量导入服务
+
+        :param api_base_url: API基础URL
+        :param token: 认证Token
+        :param batch_size: 每批日报数量
+        :param max_concurrency: 同时发送的批次数
+        :param compress: 是否压缩请求体（服务器不支持时自动退回不压缩）
+        :param journal: 上传日志，指定后记录各批状态，中断后可继续上传
+        :param uploaded_index: 已上传日报索引，指定后记录每批成功上传的日报日期和内容指纹
+        :param stream: 是否逐条序列化请求体并分块传输（不生成完整的请求体，服务器不接受时自动改为完整发送）
+        """
+        super().__init__(api_base_url, token)
+        self.batch_size = batch_size
+        self.max_concurrency = max(1, max_concurrency)
+        self.compress = compress
+        self.journal = journal
+        self.uploaded_index = uploaded_index
+        self.stream = stream
+
+    def import_reports(
+        self,
+        api_data: Dict,
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+        fingerprints: Dict[str, str] = None
+    ) -> Dict:
+        """
+        分批并发导入日报
+
+        单批失败时该批的日报全部记入failedReports，不影响其他批次；
+        所有批次都失败时抛出异常。
+
+        :param api_data: convert_to_api_format 的输出
+        :param progress_callback: 进度回调函数，参数为 (已完成日报数, 日报总数)，每完成一批调用一次
+        :param fingerprints: 日报内容指纹 {日期(YYYY-MM-DD): 指纹}，成功后记入已上传日报索引
+        :return: 合并后的导入结果，额外包含：
+                 - batchCount: 批次数
+                 - failedBatchCount: 请求失败的批次数
+                 - uploadId: 上传日志中的上传ID（未启用上传日志时为None）
+        :raises Exception: 所有批次都失败时抛出异常
+        """
+        batches = split_batches(api_data, self.batch_size)
+        upload_id = None
+        if self.journal and batches:
+            # 各批日报的指纹随批次记入上传日志，继续上传时仍能记入已上传日报索引
+            fingerprints = fingerprints or {}
+            batch_fingerprints = [
+                {date: fingerprints[date] for date in
+                 (normalize_report_date(report.get('reportDate')) for report in batch['reports'])
+                 if date in fingerprints}
+                for batch in batches
+            ]
+            upload_id = self.journal.start_upload(self.api_base_url, api_data, batches, batch_fingerprints)
+        return self._run_batches(list(enumerate(batches)), progress_callback, upload_id, fingerprints)
+
+    def import_groups(
+        self,
+        groups: List[Tuple[Dict, Dict[str, str]]],
+        progress_callback: Optional[Callable[[int, int], None]] = None
+    ) -> Dict:
+        """
+        依次导入多组日报（如新增日报和需要覆盖的已修改日报）并合并结果
+
+        某一组所有批次都失败时该组的日报全部记入failedReports，不影响其他组已导入的结果；
+        所有组都失败时抛出异常。
+
+        :param groups: build_import_groups 的输出
+        :param progress_callback: 进度回调函数，参数为 (已完成日报数, 所有组的日报总数)
+        :return: 合并后的导入结果（同 import_reports，uploadId 为最后一个成功的组的上传ID）
+        :raises Exception: 所有组都失败时抛出异常
+        """
+        total = sum(len(api_data.get('reports', [])) for api_data, _ in groups)
+        results = []
+        errors = []
+        upload_id = None
+        done_before = 0
+        for api_data, fingerprints in groups:
+            def on_group_progress(done: int, _group_total: int, offset: int = done_before):
+                if progress_callback:
+                    progress_callback(offset + done, total)
+
+            try:
+                result = self.import_reports(api_data, on_group_progress, fingerprints)
+                upload_id = result['uploadId'] or upload_id
+            except Exception as e:
+                logger.error("✗ 第 %d/%d 组日报上传失败: %s", len(results) + 1, len(groups), e)
+                errors.append(e)
+                batch_count = len(split_batches(api_data, self.batch_size))
+                result = self._failed_batch_result(api_data, str(e))
+                result.update(batchCount=batch_count, failedBatchCount=batch_count)
+            results.append(result)
+            done_before += len(api_data.get('reports', []))
+
+        if errors and len(errors) == len(groups):
+            raise errors[0]
+
+        merged = merge_import_results(results)
+        merged.update(
+            batchCount=sum(result['batchCount'] for result in results),
+            failedBatchCount=sum(result['failedBatchCount'] for result in results),
+            uploadId=upload_id
+        )
+        return merged
+
+    def resume_upload(
+        self,
+        upload_id: str,
+        progress_callback: Optional[Callable[[int, int], None]] = None
+    ) -> Dict:
+        """
+        继续上传日志中未完成的批次（待发送、发送中断或请求失败的批次）
+
+        返回结果合并了之前已成功批次的导入结果。
+
+        :param upload_id: 上传ID
+        :param progress_callback: 进度回调函数，参数为 (已完成日报数, 本次需上传的日报总数)
+        :return: 合并后的导入结果（同 import_reports）
+        :raises Exception: 未启用上传日志、上传正在其他程序中进行或本次所有批次都失败时抛出异常
+        """
+        if not self.journal:
+            raise Exception('未启用上传日志，无法继续上传')
+        if not self.journal.claim_upload(upload_id):
+            raise Exception('该上传不存在或正在其他程序中进行')
+
+        pending = self.journal.load_unfinished_batches(upload_id)
+        fingerprints = self.journal.load_fingerprints(upload_id)
+        logger.info("↻ 继续上传 %s：剩余 %d 批未完成", upload_id, len(pending))
+        return self._run_batches(pending, progress_callback, upload_id, fingerprints)
+
+    def _run_batches(
+        self,
+        numbered_batches: List[tuple],
+        progress_callback: Optional[Callable[[int, int], None]],
+        upload_id: Optional[str],
+        fingerprints: Dict[str, str] = None
+    ) -> Dict:
+        """
+        并发发送各批次并合并结果
+
+        :param numbered_batches: [(批次序号, 请求体)] 列表
+        :param progress_callback: 进度回调函数
+        :param upload_id: 上传ID（未启用上传日志时为None）
+        :param fingerprints: 日报内容指纹（继续上传时从上传日志读取，旧版本的上传日志中没有指纹）
+        :return: 合并后的导入结果
+        """
+        results = {}
+        if self.journal and upload_id:
+            # 继续上传时合并之前已成功的批次
+            results.update(self.journal.load_results(upload_id))
+
+        total = sum(len(batch['reports']) for _, batch in numbered_batches)
+        batch_count = len(results) + len(numbered_batches)
+        errors = {}
+        done = 0
+        if numbered_batches:
+            concurrency = min(self.max_concurrency, len(numbered_batches))
+            logger.info("📦 共 %d 条日报，分 %d 批上传（每批最多 %d 条，并发 %d 批）",
+                        total, len(numbered_batches), self.batch_size, concurrency)
+
+            with ThreadPoolExecutor(max_workers=concurrency) as executor:
+                futures = {
+                    executor.submit(self._import_batch, batch, upload_id, batch_no): (batch_no, batch)
+                    for batch_no, batch in numbered_batches
+                }
+                for future in as_completed(futures):
+                    batch_no, batch = futures[future]
+                    try:
+                        results[batch_no] = future.result()
+                        self._record_uploaded(batch, results[batch_no], fingerprints)
+                        logger.info("✓ 第 %d/%d 批上传完成：成功 %s 条，失败 %s 条，跳过 %s 条",
+                                    batch_no + 1, batch_count, results[batch_no]['successCount'],
+                                    results[batch_no]['failedCount'], results[batch_no]['skippedCount'])
+                    except Exception as e:
+                        errors[batch_no] = str(e)
+                        results[batch_no] = self._failed_batch_result(batch, str(e))
+                        logger.error("✗ 第 %d/%d 批上传失败: %s", batch_no + 1, batch_count, e)
+
+                    done += len(batch['reports'])
+                    if progress_callback:
+                        progress_callback(done, total)
+
+        if self.journal and upload_id:
+            self.journal.finish_upload(upload_id)
+
+        if numbered_batches and len(errors) == len(numbered_batches):
+            raise Exception(next(iter(errors.values())))
+
+        merged = merge_import_results([results[batch_no] for batch_no in sorted(results)])
+        merged.update(batchCount=batch_count, failedBatchCount=len(errors), uploadId=upload_id)
+        return merged
+
+    def _import_batch(self, batch: Dict, upload_id: str = None, batch_no: int = 0) -> Dict:
+        """
+        调用一次批量导入API，并在上传日志中记录批次状态
+
+        :param batch: 单批API请求体
+        :param upload_id: 上传ID（未启用上传日志时为None）
+        :param batch_no: 批次序号
+        :return: 单批导入结果
+        """
+        journal = self.journal if upload_id else None
+        if journal:
+            journal.mark_batch(upload_id, batch_no, BATCH_SENDING)
+
+        try:
+            response = self.post(
+                BATCH_IMPORT_ENDPOINT,
+                json_data=batch,
+                include_token=True,
+                timeout=BATCH_TIMEOUT,
+                compress=self.compress,
+                stream=self.stream,
+                idempotent=is_batch_retry_safe(batch)
+            )
+
+            # 原始响应只在DEBUG级别输出（一条日志记录，避免并发时与其他批次的日志交错）
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("📥 第 %d 批服务器原始响应: %s", batch_no + 1, LazyJson(response.text, indent=2))
+
+            data = self.parse_response(response, expected_code=1)
+        except Exception as e:
+            if journal:
+                journal.mark_batch(upload_id, batch_no, BATCH_FAILED, error=str(e))
+            raise
+
+        result = empty_import_result()
+        for key in result:
+            if data.get(key) is not None:
+                result[key] = data[key]
+        if journal:
+            journal.mark_batch(upload_id, batch_no, BATCH_SUCCEEDED, result=result)
+        return result
+
+    def _record_uploaded(self, batch: Dict, result: Dict, fingerprints: Dict[str, str] = None):
+        """把本批成功上传的日报日期和内容指纹记入已上传日报索引"""
+        if not self.uploaded_index:
+            return
+        report_dates = [
+            report.get('reportDate') for report in result.get('successReports', [])
+            if isinstance(report, dict)
+        ]
+        self.uploaded_index.record(self.api_base_url, batch.get('projectId'), report_dates, fingerprints)
+
+    @staticmethod
+    def _failed_batch_result(batch: Dict, reason: str) -> Dict:
+        """请求失败的批次：该批日报全部记为失败"""
+        failed_reports = [
+            {'reportDate': report.get('reportDate', ''), 'reason': reason}
+            for report in batch['reports']
+        ]
+        result = empty_import_result()
+        result.update(
+            totalCount=len(failed_reports),
+            failedCount=len(failed_reports),
+            failedReports=failed_reports
+        )
+        return result
@@ -5,19 +5,26 @@
 处理登录状态保存、账号密码记住等功能
 """
 
-import json
+import logging
 import os
 from typing import Optional, Dict
 from pathlib import Path
 
+from services.json_codec import dumps, loads
+
+logger = logging.getLogger(__name__)
+
 
 class ConfigService:
     """配置管理服务类"""
     
+    # 配置文件存储路径（用户主目录），解析缓存等本地数据也存放在该目录下
+    CONFIG_DIR = Path.home() / '.molten_salt_uploader'
+    
     def __init__(self):
         """初始化配置服务"""
         # 配置文件存储路径（用户主目录）
-        self.config_dir = Path.home() / '.molten_salt_uploader'
+        self.config_dir = self.CONFIG_DIR
         self.config_file = self.config_dir / 'config.json'
         
         # 确保配置目录存在
@@ -35,9 +42,9 @@ class ConfigService:
         if self.config_file.exists():
             try:
                 with open(self.config_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+                    return loads(f.read())
             except Exception as e:
-                print(f"⚠️  加载配置文件失败: {e}")
+                logger.warning("⚠️  加载配置文件失败: %s", e)
                 return {}
         return {}
     
@@ -45,10 +52,10 @@ class ConfigService:
         """保存配置文件"""
         try:
             with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(self._config, f, ensure_ascii=False, indent=2)
-            print(f"✅ 配置已保存到: {self.config_file}")
+                f.write(dumps(self._config, indent=2))
+            logger.info("✅ 配置已保存到: %s", self.config_file)
         except Exception as e:
-            print(f"❌ 保存配置文件失败: {e}")
+            logger.error("❌ 保存配置文件失败: %s", e)
     
     def save_login_info(self, server_url: str, username: str, 
                         password: str = None, remember_password: bool = False):
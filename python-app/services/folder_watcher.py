@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+监视目录服务
+定期扫描共享目录，文件写入完成（大小和修改时间稳定、xlsx压缩包完整）后放入有界队列，
+由后台线程依次解析上传，处理结果记录在入库台账中
+"""
+
+import logging
+import os
+import queue
+import threading
+import time
+import zipfile
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+from services.ingest_ledger import INGEST_FAILED, INGEST_SUCCEEDED, IngestLedger
+from services.parse_cache import file_digest
+
+logger = logging.getLogger(__name__)
+
+# 监视的Excel文件扩展名
+WATCH_SUFFIXES = ('.xlsx', '.xlsm')
+
+# 扫描间隔（秒）
+DEFAULT_POLL_INTERVAL = 2.0
+
+# 文件最后一次修改后至少等待的时间（秒），避免处理仍在写入的文件
+DEFAULT_SETTLE_SECONDS = 3.0
+
+# 等待处理的文件数上限（队列满时暂不入队，下次扫描再检查）
+DEFAULT_MAX_QUEUE = 16
+
+# 处理失败的文件，文件未变化时的重试间隔（秒）
+DEFAULT_RETRY_AFTER = 300.0
+
+
+def is_workbook_complete(path: str) -> bool:
+    """
+    检查xlsx文件是否写入完整（压缩包的中央目录在文件末尾，复制未完成时无法识别）
+
+    :param path: 文件路径
+    :return: 是否为完整的压缩包
+    """
+    try:
+        return zipfile.is_zipfile(path)
+    except OSError:
+        return False
+
+
+class FolderWatcher:
+    """监视目录类"""
+
+    def __init__(
+        self,
+        folders: List[str],
+        ingest: Callable[[str], Dict],
+        ledger: IngestLedger = None,
+        recursive: bool = False,
+        interval: float = DEFAULT_POLL_INTERVAL,
+        settle_seconds: float = DEFAULT_SETTLE_SECONDS,
+        max_queue: int = DEFAULT_MAX_QUEUE,
+        retry_after: float = DEFAULT_RETRY_AFTER,
+        on_result: Optional[Callable[[str, Dict], None]] = None
+    ):
+        """
+        初始化监视目录
+
+        :param folders: 监视的目录列表
+        :param ingest: 处理单个文件的函数，返回上传结果，失败时抛出异常
+        :param ledger: 入库台账，默认 ~/.molten_salt_uploader/ingest_ledger.db
+        :param recursive: 是否包含子目录
+        :param interval: 扫描间隔（秒）
+        :param settle_seconds: 文件最后一次修改后至少等待的时间（秒）
+        :param max_queue: 等待处理的文件数上限
+        :param retry_after: 处理失败的文件的重试间隔（秒）
+        :param on_result: 每处理完一个文件的回调，参数为 (文件路径, 台账记录)
+        """
+        self.folders = [Path(folder) for folder in folders]
+        self.ingest = ingest
+        self.ledger = ledger or IngestLedger()
+        self.recursive = recursive
+        self.interval = interval
+        self.settle_seconds = settle_seconds
+        self.retry_after = retry_after
+        self.on_result = on_result
+        self._queue = queue.Queue(maxsize=max(1, max_queue))
+        self._observed: Dict[str, Tuple[int, int]] = {}  # 上次扫描时的 (大小, 修改时间)
+        self._pending = set()  # 已入队或正在处理的文件
+        self._pending_lock = threading.Lock()
+        self._stop_event = threading.Event()
+
+    def stop(self):
+        """停止监视（正在处理的文件处理完后退出）"""
+        self._stop_event.set()
+
+    def run(self):
+        """开始监视（阻塞直到调用 stop）"""
+        logger.info("👀 开始监视: %s（每 %g 秒扫描一次）",
+                    ', '.join(str(folder) for folder in self.folders), self.interval)
+        worker = threading.Thread(target=self._work, name='folder-watcher-worker', daemon=True)
+        worker.start()
+        try:
+            while not self._stop_event.is_set():
+                try:
+                    self.scan()
+                except Exception as e:
+                    logger.warning("⚠️  扫描目录失败: %s", e)
+                self._stop_event.wait(self.interval)
+        finally:
+            self._stop_event.set()
+            worker.join()
+            logger.info("👋 已停止监视")
+
+    def scan(self) -> int:
+        """
+        扫描一次目录，把写入完成且需要处理的文件放入队列
+
+        :return: 本次入队的文件数
+        """
+        now = time.time()
+        seen = {}
+        queued = 0
+        for path in self._iter_files():
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            state = (stat.st_size, stat.st_mtime_ns)
+            previous = self._observed.get(path)
+            seen[path] = state
+
+            # 防抖：大小和修改时间在两次扫描间没有变化，且距最后修改已超过等待时间
+            if previous != state or now - stat.st_mtime_ns / 1e9 < self.settle_seconds:
+                continue
+            with self._pending_lock:
+                if path in self._pending:
+                    continue
+            if not self.ledger.needs_ingest(path, stat.st_size, stat.st_mtime_ns, self.retry_after):
+                continue
+            if not is_workbook_complete(path):
+                continue
+
+            with self._pending_lock:
+                try:
+                    self._queue.put_nowait((path, stat.st_size, stat.st_mtime_ns))
+                except queue.Full:
+                    break  # 队列已满，剩余文件下次扫描再入队
+                self._pending.add(path)
+            queued += 1
+
+        # 已删除的文件不再跟踪
+        self._observed = seen
+        return queued
+
+    def _iter_files(self):
+        """遍历监视目录中的Excel文件（跳过Excel打开文件时生成的临时锁文件）"""
+        for folder in self.folders:
+            candidates = folder.rglob('*') if self.recursive else folder.glob('*')
+            for candidate in candidates:
+                if candidate.suffix.lower() in WATCH_SUFFIXES and not candidate.name.startswith('~$'):
+                    yield str(candidate)
+
+    def _work(self):
+        """后台线程：依次处理队列中的文件"""
+        while not self._stop_event.is_set():
+            try:
+                path, size, mtime_ns = self._queue.get(timeout=0.5)
+            except queue.Empty:
+                continue
+            try:
+                self._process(path, size, mtime_ns)
+            finally:
+                with self._pending_lock:
+                    self._pending.discard(path)
+
+    def _process(self, path: str, size: int, mtime_ns: int):
+        """
+        处理单个文件并记录到台账
+
+        内容与上次成功处理时相同（只是修改时间变化）的文件不重复上传。
+
+        :param path: 文件路径
+        :param size: 入队时的文件大小
+        :param mtime_ns: 入队时的修改时间（纳秒）
+        """
+        previous = self.ledger.get(path)
+        try:
+            digest = file_digest(path)
+            if previous and previous['status'] == INGEST_SUCCEEDED and previous['digest'] == digest:
+                logger.info("⏭️  文件内容未变化，跳过: %s", path)
+                self.ledger.record(path, size, mtime_ns, digest, INGEST_SUCCEEDED, previous['result'])
+            else:
+                logger.info("📥 开始处理: %s", path)
+                result = self.ingest(path)
+                self.ledger.record(path, size, mtime_ns, digest, INGEST_SUCCEEDED, result)
+                logger.info("✓ 处理完成: %s", path)
+        except Exception as e:
+            logger.error("✗ 处理失败: %s: %s", path, e)
+            self.ledger.record(path, size, mtime_ns, previous['digest'] if previous else None,
+                               INGEST_FAILED, error=str(e))
+
+        if self.on_result:
+            self.on_result(path, self.ledger.get(path))
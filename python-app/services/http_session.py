@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+HTTP会话管理
+服务层共享的requests.Session，按主机复用TCP/TLS连接（keep-alive连接池）
+"""
+
+import warnings
+# 忽略urllib3的OpenSSL警告
+warnings.filterwarnings('ignore', message='urllib3 v2 only supports OpenSSL 1.1.1+')
+
+import atexit
+import threading
+from typing import Optional
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+# 每个主机连接池保持的最大连接数（不小于分批上传的并发数）
+DEFAULT_POOL_MAXSIZE = 10
+
+# 连接池已满时是否阻塞等待空闲连接（False时临时新建连接，用完即关闭）
+DEFAULT_POOL_BLOCK = False
+
+_lock = threading.Lock()
+_session: Optional[requests.Session] = None
+_mounted_hosts = set()
+_pool_maxsize = DEFAULT_POOL_MAXSIZE
+_pool_block = DEFAULT_POOL_BLOCK
+
+
+def configure_session(pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+                      pool_block: bool = DEFAULT_POOL_BLOCK):
+    """
+    配置连接池大小（关闭现有会话，下次请求时按新配置创建）
+
+    :param pool_maxsize: 每个主机保持的最大连接数
+    :param pool_block: 连接池已满时是否阻塞等待
+    """
+    global _pool_maxsize, _pool_block
+    with _lock:
+        _pool_maxsize = max(1, pool_maxsize)
+        _pool_block = pool_block
+    close_session()
+
+
+def get_session(base_url: str = None) -> requests.Session:
+    """
+    获取共享的HTTP会话
+
+    首次访问某个主机时为其挂载独立的连接池适配器，同一主机的请求复用连接。
+
+    :param base_url: 请求的基础URL（用于按主机挂载连接池）
+    :return: requests会话
+    """
+    global _session
+    with _lock:
+        if _session is None:
+            _session = requests.Session()
+            # 未挂载主机的请求也走连接池
+            adapter = HTTPAdapter(pool_maxsize=_pool_maxsize, pool_block=_pool_block)
+            _session.mount('http://', adapter)
+            _session.mount('https://', adapter)
+
+        prefix = _host_prefix(base_url)
+        if prefix and prefix not in _mounted_hosts:
+            _session.mount(prefix, HTTPAdapter(
+                pool_connections=1,
+                pool_maxsize=_pool_maxsize,
+                pool_block=_pool_block
+            ))
+            _mounted_hosts.add(prefix)
+        return _session
+
+
+def close_session():
+    """关闭共享的HTTP会话，释放所有连接"""
+    global _session
+    with _lock:
+        session, _session = _session, None
+        _mounted_hosts.clear()
+    if session is not None:
+        session.close()
+
+
+def _host_prefix(base_url: Optional[str]) -> Optional[str]:
+    """提取主机前缀（scheme://host:port/），无法识别时返回None"""
+    if not base_url:
+        return None
+    parts = urlsplit(base_url)
+    if parts.scheme not in ('http', 'https') or not parts.netloc:
+        return None
+    return f"{parts.scheme}://{parts.netloc.lower()}/"
+
+
+# 程序退出时关闭连接
+atexit.register(close_session)
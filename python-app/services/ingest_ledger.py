@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+文件入库台账
+在本地SQLite数据库中记录监视目录中每个工作簿的处理结果（文件大小、修改时间、内容摘要和上传结果），
+监视程序重启后不会重复处理未变化的文件
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from services.config_service import ConfigService
+
+# 台账数据库（与配置文件同目录）
+DEFAULT_LEDGER_PATH = ConfigService.CONFIG_DIR / 'ingest_ledger.db'
+
+# 处理状态
+INGEST_SUCCEEDED = 'succeeded'  # 解析完成且所有日报上传成功或跳过（有日报上传失败时记为失败）
+INGEST_FAILED = 'failed'        # 解析或上传失败，文件变化或超过重试间隔后重新处理
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    path TEXT PRIMARY KEY,
+    size INTEGER,
+    mtime_ns INTEGER,
+    digest TEXT,
+    status TEXT,
+    result TEXT,
+    error TEXT,
+    attempts INTEGER,
+    updated_at REAL
+);
+"""
+
+
+class IngestLedger:
+    """文件入库台账类（线程安全）"""
+
+    def __init__(self, db_path: str = None):
+        """
+        初始化文件入库台账
+
+        :param db_path: 数据库文件路径，默认 ~/.molten_salt_uploader/ingest_ledger.db
+        """
+        self.db_path = Path(db_path) if db_path else DEFAULT_LEDGER_PATH
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        with self._lock, self._conn:
+            self._conn.executescript(_SCHEMA)
+
+    def close(self):
+        """关闭数据库连接"""
+        with self._lock:
+            self._conn.close()
+
+    def get(self, path: str) -> Optional[Dict]:
+        """
+        获取文件的处理记录
+
+        :param path: 文件路径
+        :return: 记录字典，没有时返回None，包含：
+                 - path / size / mtimeNs / digest / status / error / attempts / updatedAt
+                 - result: 上传结果
+        """
+        with self._lock:
+            row = self._conn.execute("SELECT * FROM files WHERE path = ?", (path,)).fetchone()
+        if row is None:
+            return None
+        return {
+            'path': row['path'],
+            'size': row['size'],
+            'mtimeNs': row['mtime_ns'],
+            'digest': row['digest'],
+            'status': row['status'],
+            'result': json.loads(row['result']) if row['result'] else None,
+            'error': row['error'],
+            'attempts': row['attempts'],
+            'updatedAt': row['updated_at']
+        }
+
+    def needs_ingest(self, path: str, size: int, mtime_ns: int, retry_after: float) -> bool:
+        """
+        判断文件是否需要处理：没有处理过、自上次处理后有变化（大小或修改时间不同），
+        或上次处理失败且已超过重试间隔
+
+        :param path: 文件路径
+        :param size: 文件大小
+        :param mtime_ns: 修改时间（纳秒）
+        :param retry_after: 处理失败后的重试间隔（秒）
+        :return: 是否需要处理
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT size, mtime_ns, status, updated_at FROM files WHERE path = ?", (path,)
+            ).fetchone()
+        if row is None or row['size'] != size or row['mtime_ns'] != mtime_ns:
+            return True
+        return row['status'] == INGEST_FAILED and time.time() - row['updated_at'] >= retry_after
+
+    def record(self, path: str, size: int, mtime_ns: int, digest: str, status: str,
+               result: Dict = None, error: str = None):
+        """
+        记录文件的处理结果
+
+        :param path: 文件路径
+        :param size: 处理时的文件大小
+        :param mtime_ns: 处理时的修改时间（纳秒）
+        :param digest: 文件内容摘要
+        :param status: 处理状态
+        :param result: 上传结果
+        :param error: 错误信息
+        """
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT INTO files VALUES (?, ?, ?, ?, ?, ?, ?, 1, ?) "
+                "ON CONFLICT(path) DO UPDATE SET size = excluded.size, mtime_ns = excluded.mtime_ns, "
+                "digest = excluded.digest, status = excluded.status, result = excluded.result, "
+                "error = excluded.error, attempts = files.attempts + 1, updated_at = excluded.updated_at",
+                (path, size, mtime_ns, digest, status,
+                 json.dumps(result, ensure_ascii=False) if result is not None else None,
+                 error, time.time())
+            )
+
+    def list_records(self, status: str = None) -> List[Dict]:
+        """
+        列出处理记录（按处理时间倒序）
+
+        :param status: 只列出该状态的记录
+        :return: 记录列表（同 get）
+        """
+        sql = "SELECT path FROM files"
+        params = []
+        if status is not None:
+            sql += " WHERE status = ?"
+            params.append(status)
+        sql += " ORDER BY updated_at DESC"
+        with self._lock:
+            paths = [row['path'] for row in self._conn.execute(sql, params).fetchall()]
+        return [record for record in map(self.get, paths) if record]
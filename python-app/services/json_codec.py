@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+JSON编解码
+统一的JSON序列化/解析入口：安装了orjson或ujson时优先使用（比标准库快数倍），否则使用标准库json。
+输出均为不转义中文的紧凑格式（等同 ensure_ascii=False, separators=(',', ':')），
+快速库无法处理的数据（如超过64位的整数、非字符串键）自动退回标准库
+"""
+
+import json
+import os
+from typing import Any, Callable, Tuple
+
+try:
+    import orjson
+except ImportError:  # 可选依赖
+    orjson = None
+
+try:
+    import ujson
+except ImportError:  # 可选依赖
+    ujson = None
+
+# 指定JSON库的环境变量（orjson/ujson/json），未安装时忽略
+JSON_BACKEND_ENV = 'MOLTEN_SALT_JSON_BACKEND'
+
+
+def available_backends() -> Tuple[str, ...]:
+    """
+    获取本机可用的JSON库（按优先级排列）
+
+    :return: 库名称元组
+    """
+    backends = []
+    if orjson is not None:
+        backends.append('orjson')
+    if ujson is not None:
+        backends.append('ujson')
+    backends.append('json')
+    return tuple(backends)
+
+
+def _default_backend() -> str:
+    """默认使用的JSON库：环境变量指定且已安装时使用指定的库，否则使用优先级最高的库"""
+    requested = os.environ.get(JSON_BACKEND_ENV, '').strip().lower()
+    backends = available_backends()
+    return requested if requested in backends else backends[0]
+
+
+DEFAULT_BACKEND = _default_backend()
+
+
+def dumps(obj: Any, indent: int = None, default: Callable = None, backend: str = None) -> str:
+    """
+    序列化为JSON字符串（不转义中文）
+
+    :param obj: 要序列化的数据
+    :param indent: 缩进空格数，None 表示紧凑格式
+    :param default: 无法序列化的对象的转换函数
+    :param backend: JSON库，默认 DEFAULT_BACKEND
+    :return: JSON字符串
+    """
+    backend = backend or DEFAULT_BACKEND
+    if backend == 'orjson' and indent in (None, 2):
+        try:
+            return _orjson_dumps(obj, indent, default).decode('utf-8')
+        except TypeError:  # orjson.JSONEncodeError
+            pass
+    elif backend == 'ujson':
+        try:
+            return _ujson_dumps(obj, indent, default)
+        except (TypeError, OverflowError):
+            pass
+    return _stdlib_dumps(obj, indent, default)
+
+
+def dumps_bytes(obj: Any, indent: int = None, default: Callable = None, backend: str = None) -> bytes:
+    """
+    序列化为UTF-8编码的JSON（用作请求体，orjson直接输出bytes，省去一次编码）
+
+    :param obj: 要序列化的数据
+    :param indent: 缩进空格数，None 表示紧凑格式
+    :param default: 无法序列化的对象的转换函数
+    :param backend: JSON库，默认 DEFAULT_BACKEND
+    :return: UTF-8编码的JSON
+    """
+    backend = backend or DEFAULT_BACKEND
+    if backend == 'orjson' and indent in (None, 2):
+        try:
+            return _orjson_dumps(obj, indent, default)
+        except TypeError:
+            pass
+    return dumps(obj, indent, default, backend).encode('utf-8')
+
+
+def loads(data, backend: str = None) -> Any:
+    """
+    解析JSON
+
+    :param data: JSON字符串或UTF-8编码的bytes
+    :param backend: JSON库，默认 DEFAULT_BACKEND
+    :return: 解析结果
+    :raises ValueError: JSON格式错误时抛出异常
+    """
+    backend = backend or DEFAULT_BACKEND
+    if backend == 'orjson':
+        return orjson.loads(data)
+    if backend == 'ujson':
+        return ujson.loads(data)
+    return json.loads(data)
+
+
+def _orjson_dumps(obj: Any, indent: int, default: Callable) -> bytes:
+    """orjson序列化（只支持2空格缩进）"""
+    return orjson.dumps(obj, default=default, option=orjson.OPT_INDENT_2 if indent else 0)
+
+
+def _ujson_dumps(obj: Any, indent: int, default: Callable) -> str:
+    """ujson序列化"""
+    return ujson.dumps(obj, ensure_ascii=False, escape_forward_slashes=False,
+                       indent=indent or 0, default=default)
+
+
+def _stdlib_dumps(obj: Any, indent: int, default: Callable) -> str:
+    """标准库序列化"""
+    separators = (',', ':') if indent is None else (',', ': ')
+    return json.dumps(obj, ensure_ascii=False, indent=indent, separators=separators, default=default)
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+日志配置
+统一配置控制台和滚动日志文件，按级别过滤；请求体、响应体等大块数据只在DEBUG级别
+且确实输出时才序列化，并截断到固定长度、隐藏密码等敏感字段
+"""
+
+import logging
+import os
+import sys
+from logging.handlers import RotatingFileHandler
+from typing import Any
+
+from services.config_service import ConfigService
+from services.json_codec import dumps, loads
+
+# 日志文件（与配置文件同目录）
+LOG_DIR = ConfigService.CONFIG_DIR / 'logs'
+LOG_FILE = LOG_DIR / 'uploader.log'
+
+# 单个日志文件上限和保留的历史文件数
+LOG_MAX_BYTES = 5 * 1024 * 1024
+LOG_BACKUP_COUNT = 3
+
+# 日志级别环境变量（如 MOLTEN_SALT_LOG_LEVEL=DEBUG 时输出请求体和原始响应）
+LOG_LEVEL_ENV = 'MOLTEN_SALT_LOG_LEVEL'
+DEFAULT_LOG_LEVEL = 'INFO'
+
+# 日志中请求体、响应体的最大字符数
+DEFAULT_PAYLOAD_LIMIT = 2000
+
+# 日志中隐藏的字段
+SENSITIVE_KEYS = ('password', 'token', 'refreshToken')
+
+CONSOLE_FORMAT = '%(message)s'
+FILE_FORMAT = '%(asctime)s %(levelname)-7s [%(threadName)s] %(name)s: %(message)s'
+
+_configured = False
+
+
+def setup_logging(level: str = None, console_stream=None, log_file=LOG_FILE):
+    """
+    配置日志（重复调用时只调整级别）
+
+    :param level: 日志级别名称，默认读取环境变量 MOLTEN_SALT_LOG_LEVEL，未设置时为INFO
+    :param console_stream: 控制台输出流，默认标准输出
+    :param log_file: 日志文件路径，None 表示不写文件
+    """
+    global _configured
+    level_name = (level or os.environ.get(LOG_LEVEL_ENV) or DEFAULT_LOG_LEVEL).upper()
+    root = logging.getLogger()
+    root.setLevel(getattr(logging, level_name, logging.INFO))
+    if _configured:
+        return
+
+    console_handler = logging.StreamHandler(console_stream or sys.stdout)
+    console_handler.setFormatter(logging.Formatter(CONSOLE_FORMAT))
+    root.addHandler(console_handler)
+
+    if log_file:
+        try:
+            log_file.parent.mkdir(parents=True, exist_ok=True)
+            file_handler = RotatingFileHandler(
+                log_file, maxBytes=LOG_MAX_BYTES, backupCount=LOG_BACKUP_COUNT, encoding='utf-8'
+            )
+            file_handler.setFormatter(logging.Formatter(FILE_FORMAT))
+            root.addHandler(file_handler)
+        except OSError as e:
+            root.warning("⚠️  无法写入日志文件 %s: %s", log_file, e)
+
+    # 第三方库只记录警告
+    for name in ('urllib3', 'charset_normalizer'):
+        logging.getLogger(name).setLevel(logging.WARNING)
+    _configured = True
+
+
+def mask_sensitive(data: Any) -> Any:
+    """
+    隐藏字典中的密码、Token等敏感字段（不修改原数据）
+
+    :param data: 原始数据
+    :return: 用于日志的数据
+    """
+    if isinstance(data, dict):
+        return {
+            key: '******' if key in SENSITIVE_KEYS and value else mask_sensitive(value)
+            for key, value in data.items()
+        }
+    if isinstance(data, list):
+        return [mask_sensitive(item) for item in data]
+    return data
+
+
+def truncate_text(text: str, limit: int = DEFAULT_PAYLOAD_LIMIT) -> str:
+    """
+    截断过长的日志文本
+
+    :param text: 原始文本
+    :param limit: 最大字符数
+    :return: 截断后的文本
+    """
+    if limit is None or len(text) <= limit:
+        return text
+    return f"{text[:limit]}...（共 {len(text)} 字符，已截断）"
+
+
+class LazyJson:
+    """
+    延迟序列化的日志参数：只在日志记录确实输出时才序列化、隐藏敏感字段并截断
+
+    用法：logger.debug("请求体: %s", LazyJson(json_data))
+    """
+
+    __slots__ = ('data', 'limit', 'indent')
+
+    def __init__(self, data: Any, limit: int = DEFAULT_PAYLOAD_LIMIT, indent: int = None):
+        """
+        :param data: 要记录的数据（字符串按JSON解析后重新格式化，解析失败时原样记录）
+        :param limit: 最大字符数，None 表示不截断
+        :param indent: JSON缩进
+        """
+        self.data = data
+        self.limit = limit
+        self.indent = indent
+
+    def __str__(self) -> str:
+        data = self.data
+        if isinstance(data, (bytes, bytearray)):
+            data = data.decode('utf-8', errors='replace')
+        if isinstance(data, str):
+            try:
+                data = loads(data)
+            except ValueError:
+                return truncate_text(data, self.limit)
+        try:
+            text = dumps(mask_sensitive(data), indent=self.indent, default=str)
+        except (TypeError, ValueError):
+            text = str(data)
+        return truncate_text(text, self.limit)
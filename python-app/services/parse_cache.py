@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+解析缓存
+按文件内容哈希和解析器版本缓存日报Excel的解析结果，避免重复解析同一工作簿
+
+缓存分两级：
+- 工作表缓存：按工作表内容计算键，工作簿被修改后只需重新解析有变化的工作表
+- 文件清单：按整个文件内容计算键，记录各工作表的缓存键，完全命中时无需打开工作簿
+"""
+
+import hashlib
+import logging
+import os
+import re
+import tempfile
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from parse_daily_report_excel import PARSER_VERSION
+from report_model import DailyReport
+from services.config_service import ConfigService
+from services.json_codec import dumps_bytes, loads
+
+logger = logging.getLogger(__name__)
+
+# 缓存目录（与配置文件同目录）
+DEFAULT_CACHE_DIR = ConfigService.CONFIG_DIR / 'parse_cache'
+
+# 缓存总大小上限（超出后按最近使用时间淘汰）
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+# 计算文件哈希时每次读取的字节数
+HASH_CHUNK_SIZE = 1024 * 1024
+
+# 工作表XML中引用共享字符串的单元格：<c ... t="s"><v>序号</v></c>
+_SHARED_STRING_CELL = re.compile(
+    rb'<(?:\w+:)?c\b[^>]*?\bt="s"[^>]*>\s*<(?:\w+:)?v>(\d+)</(?:\w+:)?v>'
+)
+
+
+def file_digest(file_path: str) -> str:
+    """
+    计算文件内容的缓存键（文件内容 + 解析器版本）
+
+    :param file_path: 文件路径
+    :return: 十六进制哈希字符串
+    """
+    digest = hashlib.sha256(f"parser-v{PARSER_VERSION}\0".encode('utf-8'))
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def sheet_digests(workbook, sheet_names: List[str]) -> Dict[str, str]:
+    """
+    计算工作表的缓存键（只读模式打开的工作簿）
+
+    缓存键由工作表名称（日报日期取自名称）、工作表XML、其引用的共享字符串、日期格式样式和解析器版本共同决定，
+    工作表内容不变时即使工作簿的其他工作表被修改，缓存键也保持不变。
+    非只读模式或openpyxl内部结构不可用时返回空字典（不使用工作表缓存）。
+
+    :param workbook: openpyxl只读工作簿
+    :param sheet_names: 工作表名称列表
+    :return: {工作表名称: 十六进制哈希字符串}
+    """
+    archive = getattr(workbook, '_archive', None)
+    if archive is None:
+        return {}
+
+    try:
+        # 单元格是否按日期解析取决于样式，工作簿级的日期格式变化会影响所有工作表
+        context = hashlib.sha256(f"parser-v{PARSER_VERSION}\0".encode('utf-8'))
+        context.update(repr((
+            sorted(getattr(workbook, '_date_formats', ())),
+            sorted(getattr(workbook, '_timedelta_formats', ())),
+            str(getattr(workbook, 'epoch', ''))
+        )).encode('utf-8'))
+        context_bytes = context.digest()
+
+        digests = {}
+        table_digest = None
+        for name in sheet_names:
+            ws = workbook[name]
+            xml = archive.read(ws._worksheet_path)
+            strings = ws._shared_strings
+
+            digest = hashlib.sha256(context_bytes)
+            # 日报日期取自工作表名称：内容相同的两个工作表或改名后的工作表不能共用缓存
+            digest.update(name.encode('utf-8'))
+            digest.update(b'\0')
+            matches = list(_SHARED_STRING_CELL.finditer(xml))
+            if len(matches) == xml.count(b't="s"') and all(int(m.group(1)) < len(strings) for m in matches):
+                # 用共享字符串内容代替其序号计入哈希：其他工作表新增文字导致序号变化时，
+                # 本表的缓存键保持不变
+                start = 0
+                for match in matches:
+                    digest.update(xml[start:match.start(1)])
+                    digest.update(b'\0')
+                    digest.update(str(strings[int(match.group(1))]).encode('utf-8'))
+                    digest.update(b'\0')
+                    start = match.end(1)
+                digest.update(xml[start:])
+            else:
+                # 无法可靠识别引用时退回整个共享字符串表
+                if table_digest is None:
+                    table_digest = hashlib.sha256(
+                        '\0'.join(str(s) for s in strings).encode('utf-8')
+                    ).digest()
+                digest.update(xml)
+                digest.update(table_digest)
+            digests[name] = digest.hexdigest()
+        return digests
+    except Exception as e:
+        logger.warning("⚠️  计算工作表缓存键失败，不使用工作表缓存: %s", e)
+        return {}
+
+
+class ParseCache:
+    """解析缓存类（基于本地JSON文件，可在多个进程间共享）"""
+
+    def __init__(self, cache_dir: str = None, max_bytes: int = DEFAULT_MAX_BYTES):
+        """
+        初始化解析缓存
+
+        :param cache_dir: 缓存目录，默认 ~/.molten_salt_uploader/parse_cache
+        :param max_bytes: 缓存总大小上限（字节）
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir else DEFAULT_CACHE_DIR
+        self.max_bytes = max_bytes
+        self.sheets_dir = self.cache_dir / 'sheets'
+        self.files_dir = self.cache_dir / 'files'
+
+    def get_sheet(self, key: str) -> Optional[DailyReport]:
+        """
+        读取工作表缓存
+
+        :param key: 工作表缓存键
+        :return: 解析后的日报，未命中返回None
+        """
+        data = self._read(self.sheets_dir / f"{key}.json")
+        return DailyReport.from_dict(data) if isinstance(data, dict) else None
+
+    def put_sheet(self, key: str, report: DailyReport):
+        """
+        写入工作表缓存
+
+        :param key: 工作表缓存键
+        :param report: 解析后的日报
+        """
+        self._write(self.sheets_dir / f"{key}.json", report.to_dict())
+
+    def get_file(self, key: str) -> Optional[List[DailyReport]]:
+        """
+        读取整个文件的缓存（文件清单及其引用的全部工作表缓存都存在才算命中）
+
+        :param key: 文件缓存键
+        :return: 解析后的日报列表，未命中返回None
+        """
+        manifest = self._read(self.files_dir / f"{key}.json")
+        if not manifest:
+            return None
+
+        reports = []
+        for sheet_key in manifest.get('sheetKeys', []):
+            report = self.get_sheet(sheet_key)
+            if report is None:
+                return None
+            reports.append(report)
+        return reports
+
+    def put_file(self, key: str, sheet_keys: List[str]):
+        """
+        写入文件清单
+
+        :param key: 文件缓存键
+        :param sheet_keys: 按工作表顺序排列的工作表缓存键
+        """
+        self._write(self.files_dir / f"{key}.json", {'sheetKeys': sheet_keys})
+
+    def evict(self) -> int:
+        """
+        按最近使用时间淘汰缓存，直到总大小不超过上限
+
+        :return: 淘汰的缓存文件数
+        """
+        entries = []
+        total = 0
+        for directory in (self.sheets_dir, self.files_dir):
+            if not directory.exists():
+                continue
+            for path in directory.glob('*.json'):
+                try:
+                    stat = path.stat()
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+                total += stat.st_size
+
+        removed = 0
+        entries.sort(key=lambda entry: entry[0])
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                path.unlink()
+            except OSError:
+                continue
+            total -= size
+            removed += 1
+
+        if removed:
+            logger.info("🧹 解析缓存已淘汰 %s 项", removed)
+        return removed
+
+    def clear(self):
+        """清空解析缓存"""
+        for directory in (self.sheets_dir, self.files_dir):
+            if not directory.exists():
+                continue
+            for path in directory.glob('*.json'):
+                try:
+                    path.unlink()
+                except OSError:
+                    pass
+
+    @staticmethod
+    def _read(path: Path):
+        """读取缓存文件，命中时刷新修改时间作为最近使用时间"""
+        try:
+            with open(path, 'rb') as f:
+                data = loads(f.read())
+        except (OSError, ValueError):
+            return None
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return data
+
+    @staticmethod
+    def _write(path: Path, data):
+        """原子写入缓存文件（先写临时文件再替换，避免并发读到半个文件）"""
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    f.write(dumps_bytes(data))
+                os.replace(tmp_path, path)
+            except Exception:
+                os.unlink(tmp_path)
+                raise
+        except Exception as e:
+            # 缓存写入失败不影响解析结果
+            logger.warning("⚠️  写入解析缓存失败: %s", e)
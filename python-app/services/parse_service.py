@@ -0,0 +1,337 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+解析服务
+使用进程池并行解析多个日报Excel文件（只读流式模式下可按工作表拆分），
+并通过解析缓存跳过未修改的文件和工作表
+"""
+
+import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from parse_daily_report_excel import DailyReportExcelParser
+from report_model import DailyReport
+from services.parse_cache import ParseCache, file_digest, sheet_digests
+
+logger = logging.getLogger(__name__)
+
+# 按工作表拆分任务时，每个任务至少包含的工作表数量
+# （每个任务都要重新打开工作簿，过小的任务得不偿失）
+MIN_SHEETS_PER_TASK = 4
+
+# 并行解析的最小文件总大小（字节）
+# 解析耗时约与文件大小成正比（约3毫秒/KB），而每个子进程（spawn）启动并导入 openpyxl 约0.25秒，
+# 按工作表拆分时主进程还要先打开工作簿读取工作表列表。待解析的文件合计小于该值（约150个工作表）时
+# 并行的额外开销超过节省的时间，直接串行解析
+PARALLEL_MIN_BYTES = 512 * 1024
+
+
+def list_sheet_names(excel_path: str) -> List[str]:
+    """
+    获取工作簿中的工作表名称（只读模式打开）
+
+    :param excel_path: Excel文件路径
+    :return: 工作表名称列表
+    """
+    with DailyReportExcelParser(excel_path, read_only=True) as parser:
+        return list(parser.workbook.sheetnames)
+
+
+def iter_workbook_entries(excel_path: str, sheet_names: Optional[List[str]] = None,
+                          read_only: bool = True, cache_dir: str = None) -> Iterator[tuple]:
+    """
+    逐个工作表解析工作簿，命中工作表缓存时直接使用缓存结果
+
+    :param excel_path: Excel文件路径
+    :param sheet_names: 要解析的工作表，不指定则解析全部
+    :param read_only: 是否使用只读流式模式（只有流式模式才能计算工作表缓存键）
+    :param cache_dir: 解析缓存目录，为None时不使用缓存
+    :return: 迭代器，每项为 (工作表名称, 工作表缓存键或None, 日报或None)，解析失败的工作表日报为None
+    """
+    cache = ParseCache(cache_dir) if cache_dir else None
+    with DailyReportExcelParser(excel_path, read_only=read_only) as parser:
+        names = list(sheet_names) if sheet_names is not None else list(parser.workbook.sheetnames)
+        keys = sheet_digests(parser.workbook, names) if cache else {}
+        for name in names:
+            key = keys.get(name)
+            report = cache.get_sheet(key) if key else None
+            if report is None:
+                report = next(parser.iter_sheets([name]), None)
+                if report is not None and key:
+                    cache.put_sheet(key, report)
+            yield name, key, report
+
+
+def parse_workbook_task(excel_path: str, sheet_names: Optional[List[str]] = None,
+                        read_only: bool = True, cache_dir: str = None) -> List[tuple]:
+    """
+    解析任务（在子进程中执行，必须是模块级函数）
+
+    :param excel_path: Excel文件路径
+    :param sheet_names: 要解析的工作表，不指定则解析全部
+    :param read_only: 是否使用只读流式模式
+    :param cache_dir: 解析缓存目录，为None时不使用缓存
+    :return: (工作表名称, 工作表缓存键, 日报) 列表
+    """
+    return list(iter_workbook_entries(excel_path, sheet_names, read_only, cache_dir))
+
+
+class ParseService:
+    """解析服务类"""
+
+    def __init__(self, max_workers: int = None, read_only: bool = True,
+                 use_cache: bool = True, cache: ParseCache = None):
+        """
+        初始化解析服务
+
+        :param max_workers: 最大进程数，默认使用CPU核数（超过CPU核数的进程无法同时运行，按CPU核数计）
+        :param read_only: 是否使用只读流式模式（只有流式模式才按工作表拆分任务和使用工作表缓存）
+        :param use_cache: 是否使用解析缓存
+        :param cache: 解析缓存，默认使用 ~/.molten_salt_uploader/parse_cache
+        """
+        cpu_count = os.cpu_count() or 1
+        self.max_workers = min(max_workers or cpu_count, cpu_count)
+        self.read_only = read_only
+        self.cache = (cache or ParseCache()) if use_cache else None
+
+    def parse_files(self, file_paths: List[str]) -> List[Dict]:
+        """
+        并行解析多个Excel文件
+
+        结果顺序与输入文件顺序一致，每个文件内的日报顺序与工作表顺序一致。
+        单个文件解析失败不影响其他文件，错误信息记录在该文件的结果中。
+
+        :param file_paths: Excel文件路径列表
+        :return: 每个文件的解析结果列表，每项包含：
+                 - filePath: 文件路径
+                 - reports: 解析后的日报列表
+                 - error: 错误信息（成功时为None）
+        """
+        results = [{'filePath': path, 'reports': [], 'error': None} for path in file_paths]
+        for part in self.iter_parse(file_paths):
+            result = results[part['fileIndex']]
+            if part['error']:
+                # 文件解析失败时丢弃该文件已解析的部分
+                result['error'] = part['error']
+                result['reports'] = []
+            else:
+                result['reports'].extend(part['reports'])
+        return results
+
+    def parse_reports(self, file_paths: List[str]) -> List[DailyReport]:
+        """
+        并行解析多个Excel文件，直接返回所有日报（按文件顺序合并）
+
+        :param file_paths: Excel文件路径列表
+        :return: 解析后的日报列表
+        :raises Exception: 任意文件解析失败时抛出异常
+        """
+        all_reports = []
+        for result in self.parse_files(file_paths):
+            if result['error']:
+                raise Exception(f"文件 {result['filePath']} 解析失败：{result['error']}")
+            all_reports.extend(result['reports'])
+        return all_reports
+
+    def iter_parse(self, file_paths: List[str]) -> Iterator[Dict]:
+        """
+        逐步解析多个Excel文件，按文件顺序、工作表顺序依次产出解析结果
+
+        串行解析时每解析完一个工作表产出一次，并行解析时每完成一个任务产出一次，
+        整个文件命中缓存时一次产出该文件的全部日报。
+        调用方可以随时停止迭代（关闭迭代器）来取消解析，尚未开始的任务会被取消。
+        同一文件出错后只产出一次错误，不再产出该文件的后续结果。
+
+        :param file_paths: Excel文件路径列表
+        :return: 迭代器，每项包含：
+                 - fileIndex: 文件序号
+                 - filePath: 文件路径
+                 - reports: 本次解析出的日报列表
+                 - error: 错误信息（成功时为None）
+        """
+        file_keys = {}
+        tasks, workers = self._plan_tasks(file_paths, file_keys)
+        failed = set()
+        # 各文件已解析工作表的缓存键，全部解析完成后写入文件清单
+        manifests = {}
+        parse_tasks = [task for task in tasks if task[3] is None and task[4] is None]
+        if workers <= 1 or len(parse_tasks) <= 1:
+            yield from self._iter_serial(tasks, failed, manifests)
+        else:
+            consumed = 0
+            try:
+                for part in self._iter_parallel(tasks, failed, manifests, workers):
+                    consumed = part.pop('taskNo') + 1
+                    yield part
+            except (BrokenProcessPool, OSError) as e:
+                # 进程池不可用时（如受限环境），剩余任务退回串行解析
+                logger.warning("⚠️  进程池不可用，改为串行解析: %s", e)
+                yield from self._iter_serial(tasks[consumed:], failed, manifests)
+
+        self._save_manifests(file_keys, manifests, failed)
+
+    def _plan_tasks(self, file_paths: List[str], file_keys: Dict[int, str]) -> Tuple[List[tuple], int]:
+        """
+        拆分解析任务
+
+        整个文件命中缓存时直接生成已完成的任务；其余文件合计较小（见 PARALLEL_MIN_BYTES）时串行解析，
+        文件数不少于进程数时按文件拆分，否则在流式模式下把每个文件的工作表分成若干组，使所有进程都有任务可做。
+
+        :param file_paths: Excel文件路径列表
+        :param file_keys: 输出参数，记录各文件的缓存键 {文件序号: 缓存键}
+        :return: (任务列表, 使用的进程数)，任务列表每项为
+                 (文件序号, 文件路径, 工作表名称列表或None, 错误信息或None, 缓存的日报列表或None)，进程数为1时串行解析
+        """
+        tasks = []
+        pending = []
+        for index, path in enumerate(file_paths):
+            if self.cache:
+                try:
+                    file_keys[index] = file_digest(path)
+                except OSError as e:
+                    tasks.append((index, path, None, str(e), None))
+                    continue
+                reports = self.cache.get_file(file_keys[index])
+                if reports is not None:
+                    logger.info("⚡ 命中解析缓存: %s（%s 个工作表）", path, len(reports))
+                    tasks.append((index, path, None, None, reports))
+                    continue
+            pending.append((index, path))
+
+        file_count = len(pending)
+        workers = self._worker_count(pending)
+        if workers <= 1 or not self.read_only or file_count >= workers:
+            tasks.extend((index, path, None, None, None) for index, path in pending)
+        else:
+            # 每个文件可分到的进程数
+            workers_per_file = max(1, workers // max(1, file_count))
+            for index, path in pending:
+                try:
+                    sheet_names = list_sheet_names(path)
+                except Exception as e:
+                    tasks.append((index, path, None, str(e), None))
+                    continue
+
+                chunk_size = max(MIN_SHEETS_PER_TASK, -(-len(sheet_names) // workers_per_file))
+                chunks = [sheet_names[i:i + chunk_size] for i in range(0, len(sheet_names), chunk_size)]
+                for chunk in chunks or [[]]:
+                    tasks.append((index, path, chunk, None, None))
+
+        # 保持文件顺序（同一文件的任务已按工作表顺序排列，排序是稳定的）
+        tasks.sort(key=lambda task: task[0])
+        return tasks, workers
+
+    def _worker_count(self, pending: List[tuple]) -> int:
+        """
+        根据待解析文件的总大小决定使用的进程数
+
+        :param pending: 需要解析的 (文件序号, 文件路径) 列表
+        :return: 进程数（1表示串行解析）
+        """
+        if self.max_workers <= 1 or not pending:
+            return 1
+        total_bytes = 0
+        for _, path in pending:
+            try:
+                total_bytes += os.path.getsize(path)
+            except OSError:
+                pass  # 文件错误在解析时报告
+        if total_bytes < PARALLEL_MIN_BYTES:
+            return 1
+        # 每个进程至少分到 PARALLEL_MIN_BYTES / 2 的工作量，否则多启动的进程得不偿失
+        return max(1, min(self.max_workers, total_bytes * 2 // PARALLEL_MIN_BYTES))
+
+    @staticmethod
+    def _part(index: int, path: str, reports: List[DailyReport], error: str = None) -> Dict:
+        """构造一次解析产出"""
+        return {'fileIndex': index, 'filePath': path, 'reports': reports, 'error': error}
+
+    @staticmethod
+    def _record_entry(manifests: Dict, index: int, key: Optional[str], report: Optional[DailyReport]):
+        """记录工作表缓存键（有工作表解析失败或无缓存键时，该文件不写入文件清单）"""
+        sheet_keys = manifests.setdefault(index, [])
+        if sheet_keys is None:
+            return
+        if key is None or report is None:
+            manifests[index] = None
+        else:
+            sheet_keys.append(key)
+
+    def _save_manifests(self, file_keys: Dict[int, str], manifests: Dict, failed: set):
+        """写入完整解析的文件清单，并淘汰超出大小上限的缓存"""
+        if not self.cache:
+            return
+        for index, sheet_keys in manifests.items():
+            if sheet_keys is not None and index not in failed and index in file_keys:
+                self.cache.put_file(file_keys[index], sheet_keys)
+        self.cache.evict()
+
+    @property
+    def _cache_dir(self) -> Optional[str]:
+        """传给解析任务的缓存目录（子进程中重新创建缓存对象）"""
+        return str(self.cache.cache_dir) if self.cache else None
+
+    def _iter_serial(self, tasks: List[tuple], failed: set, manifests: Dict) -> Iterator[Dict]:
+        """在当前进程中依次执行任务，每解析完一个工作表产出一次"""
+        for index, path, sheet_names, error, cached in tasks:
+            if index in failed:
+                continue
+            if error:
+                failed.add(index)
+                yield self._part(index, path, [], error)
+                continue
+            if cached is not None:
+                yield self._part(index, path, cached)
+                continue
+            try:
+                entries = iter_workbook_entries(path, sheet_names, self.read_only, self._cache_dir)
+                for _, key, report in entries:
+                    self._record_entry(manifests, index, key, report)
+                    if report is not None:
+                        yield self._part(index, path, [report])
+            except Exception as e:
+                failed.add(index)
+                yield self._part(index, path, [], str(e))
+
+    def _iter_parallel(self, tasks: List[tuple], failed: set, manifests: Dict, workers: int) -> Iterator[Dict]:
+        """使用进程池并行执行任务，按提交顺序产出结果（附带任务序号taskNo）"""
+        parse_count = sum(1 for task in tasks if task[3] is None and task[4] is None)
+        # 使用 spawn 启动子进程：界面线程（Qt）和上传线程运行时 fork 可能继承被占用的锁导致子进程卡死，
+        # 各平台行为也与 Windows/macOS 一致
+        executor = ProcessPoolExecutor(max_workers=min(workers, parse_count),
+                                       mp_context=multiprocessing.get_context('spawn'))
+        try:
+            futures = [
+                executor.submit(parse_workbook_task, path, sheet_names, self.read_only, self._cache_dir)
+                if error is None and cached is None else None
+                for _, path, sheet_names, error, cached in tasks
+            ]
+            for task_no, ((index, path, _, error, cached), future) in enumerate(zip(tasks, futures)):
+                if index in failed:
+                    continue
+                reports = cached
+                if future is not None:
+                    try:
+                        entries = future.result()
+                    except BrokenProcessPool:
+                        raise
+                    except Exception as e:
+                        error = str(e)
+                    else:
+                        for _, key, report in entries:
+                            self._record_entry(manifests, index, key, report)
+                        reports = [report for _, _, report in entries if report is not None]
+                if error:
+                    failed.add(index)
+                    part = self._part(index, path, [], error)
+                else:
+                    part = self._part(index, path, reports)
+                part['taskNo'] = task_no
+                yield part
+        finally:
+            # 停止迭代（取消）或出错时，取消尚未开始的任务
+            executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+流式请求体
+批量导入请求体按日报逐条序列化、边序列化边压缩，以分块传输（Transfer-Encoding: chunked）发送，
+不在内存中生成完整的JSON字符串、UTF-8请求体和压缩后的请求体；
+服务器不接受分块传输时记录该主机，之后改为发送完整请求体
+"""
+
+import threading
+import zlib
+from typing import Dict, Iterator
+from urllib.parse import urlsplit
+
+from services.json_codec import dumps
+from services.request_compression import GZIP_LEVEL, ZSTD_LEVEL, zstandard
+
+# 攒够该字节数再压缩/发送一块（避免每条日报一个小分块）
+STREAM_CHUNK_BYTES = 64 * 1024
+
+# 服务器不接受分块传输的请求体时可能返回的HTTP状态码
+# （411 需要Content-Length；部分网关对未知长度的请求体返回400/413/415）
+STREAM_REJECTED_STATUS_CODES = (400, 411, 413, 415)
+
+_lock = threading.Lock()
+_unsupported_hosts = set()
+
+
+def iter_json_pieces(json_data: Dict, list_key: str = 'reports') -> Iterator[str]:
+    """
+    逐段序列化JSON对象：先输出其他字段，再逐条输出列表字段中的元素
+
+    拼接结果与 request_compression.encode_json(json_data) 解析后相同（列表字段移到最后）。
+
+    :param json_data: JSON对象（如单批批量导入请求体）
+    :param list_key: 逐条输出的列表字段
+    :return: JSON文本片段迭代器
+    """
+    header = {key: value for key, value in json_data.items() if key != list_key}
+    head = dumps(header)
+    yield f'{head[:-1]}{"," if header else ""}{dumps(list_key)}:['
+    for index, item in enumerate(json_data.get(list_key) or []):
+        yield f',{dumps(item)}' if index else dumps(item)
+    yield ']}'
+
+
+def stream_compressor(encoding: str):
+    """
+    创建流式压缩器
+
+    :param encoding: 编码名称（gzip/zstd）
+    :return: 具有 compress(data) 和 flush() 方法的压缩器
+    """
+    if encoding == 'gzip':
+        # wbits=31：输出带gzip头和校验尾的数据，与 gzip.compress 兼容
+        return zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, 31)
+    if encoding == 'zstd' and zstandard is not None:
+        return zstandard.ZstdCompressor(level=ZSTD_LEVEL).compressobj()
+    raise ValueError(f'不支持的压缩编码: {encoding}')
+
+
+class JsonStreamBody:
+    """
+    流式JSON请求体（可重复迭代：每次迭代重新序列化，重试时可再次发送）
+
+    作为 requests 的 data 参数时，请求以分块传输方式发送。
+    """
+
+    def __init__(self, json_data: Dict, encoding: str = None, list_key: str = 'reports',
+                 chunk_bytes: int = STREAM_CHUNK_BYTES):
+        """
+        :param json_data: JSON对象
+        :param encoding: 压缩编码（gzip/zstd），None 表示不压缩
+        :param list_key: 逐条序列化的列表字段
+        :param chunk_bytes: 每次压缩/发送的最小字节数
+        """
+        self.json_data = json_data
+        self.encoding = encoding
+        self.list_key = list_key
+        self.chunk_bytes = chunk_bytes
+        self.raw_size = 0  # 最近一次迭代的未压缩字节数
+        self.sent_size = 0  # 最近一次迭代实际发送的字节数
+
+    def __iter__(self) -> Iterator[bytes]:
+        compressor = stream_compressor(self.encoding) if self.encoding else None
+        self.raw_size = self.sent_size = 0
+        buffer = []
+        buffered = 0
+        for piece in iter_json_pieces(self.json_data, self.list_key):
+            data = piece.encode('utf-8')
+            buffer.append(data)
+            buffered += len(data)
+            if buffered >= self.chunk_bytes:
+                chunk = self._emit(b''.join(buffer), compressor)
+                buffer.clear()
+                buffered = 0
+                if chunk:
+                    yield chunk
+
+        chunk = self._emit(b''.join(buffer), compressor)
+        if compressor is not None:
+            tail = compressor.flush()
+            self.sent_size += len(tail)
+            chunk += tail
+        if chunk:
+            yield chunk
+
+    def _emit(self, data: bytes, compressor) -> bytes:
+        """压缩一块数据并统计大小"""
+        self.raw_size += len(data)
+        chunk = compressor.compress(data) if compressor is not None else data
+        self.sent_size += len(chunk)
+        return chunk
+
+
+def is_stream_supported(url: str) -> bool:
+    """
+    主机是否接受分块传输的请求体（本次运行内未被拒绝过）
+
+    :param url: 请求URL
+    :return: 是否可以流式发送
+    """
+    with _lock:
+        return _host(url) not in _unsupported_hosts
+
+
+def mark_stream_unsupported(url: str):
+    """
+    记录主机不接受分块传输的请求体（本次运行内改为发送完整请求体）
+
+    :param url: 请求URL
+    """
+    with _lock:
+        _unsupported_hosts.add(_host(url))
+
+
+def _host(url: str) -> str:
+    """提取主机（scheme://host:port）"""
+    parts = urlsplit(url)
+    return f"{parts.scheme}://{parts.netloc.lower()}"
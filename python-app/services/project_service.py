@@ -5,9 +5,12 @@
 处理项目相关API请求
 """
 
+import logging
 from typing import Dict
 from services.base_service import BaseService
 
+logger = logging.getLogger(__name__)
+
 
 class ProjectService(BaseService):
     """项目服务类"""
@@ -28,10 +31,6 @@ class ProjectService(BaseService):
         :return: 项目信息字典
         :raises Exception: 请求失败时抛出异常
         """
-        print("\n" + "="*60)
-        print("【获取项目信息】")
-        print("="*60 + "\n")
-        
         try:
             # 使用基础服务的GET方法，自动添加token
             response = self.get('/api/v1/projects/my-project', include_token=True)
@@ -39,16 +38,14 @@ class ProjectService(BaseService):
             # 使用基础服务的响应解析方法
             project_data = self.parse_response(response, expected_code=1)
             
-            print(f"\n✅ 获取项目信息成功")
-            print(f"项目ID: {project_data.get('id')}")
-            print(f"项目名称: {project_data.get('name')}")
-            print(f"项目类型: {project_data.get('typeDisplayName')}")
-            print(f"项目状态: {project_data.get('statusDisplayName')}")
-            print(f"项目经理: {project_data.get('manager')}\n")
+            logger.info("✅ 获取项目信息成功: %s（ID: %s，类型: %s，状态: %s，项目经理: %s）",
+                        project_data.get('name'), project_data.get('id'),
+                        project_data.get('typeDisplayName'), project_data.get('statusDisplayName'),
+                        project_data.get('manager'))
             
             return project_data
             
         except Exception as e:
-            print(f"❌ 获取项目信息失败: {str(e)}\n")
+            logger.error("❌ 获取项目信息失败: %s", e)
             raise
 
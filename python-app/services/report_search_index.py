@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+日报搜索索引
+解析后的日报按字段建立倒排索引（字段 -> 取值 -> 行号集合），日报追加时只索引新增的行；
+搜索时只扫描各字段的不重复取值（人员、机械等在一年的日报中反复出现，取值数远小于明细行数），
+命中取值的行号集合直接合并，不再逐个遍历日报和明细
+
+查询语法：空格分隔多个条件，同时满足；条件可加字段前缀，如
+    张伟                 任一字段包含"张伟"
+    人员:张伟 机械:汽车吊   当天有张伟且有汽车吊
+    问题:                有问题反馈的日报
+    日期:2025-03 进度:滞后  2025年3月进度滞后的日报
+"""
+
+from typing import Dict, Iterable, List, Optional, Set
+
+from report_model import DailyReport
+from services.upload_index import normalize_report_date
+
+# 索引字段
+FIELD_WORKER = 'worker'      # 人员姓名
+FIELD_MACHINE = 'machine'    # 机械名称
+FIELD_TASK = 'task'          # 任务名称（逐项进度汇报和明日工作计划）
+FIELD_PROBLEM = 'problem'    # 问题反馈（描述、原因、影响）
+FIELD_DATE = 'date'          # 日报日期（原文和 YYYY-MM-DD）
+FIELD_PROGRESS = 'progress'  # 整体进度状态（代码和中文）
+
+SEARCH_FIELDS = (FIELD_WORKER, FIELD_MACHINE, FIELD_TASK, FIELD_PROBLEM, FIELD_DATE, FIELD_PROGRESS)
+
+# 查询中的字段前缀
+FIELD_ALIASES = {
+    '人员': FIELD_WORKER,
+    '姓名': FIELD_WORKER,
+    '机械': FIELD_MACHINE,
+    '任务': FIELD_TASK,
+    '问题': FIELD_PROBLEM,
+    '日期': FIELD_DATE,
+    '进度': FIELD_PROGRESS
+}
+
+# 进度状态的中文（与预览表格一致）
+PROGRESS_NAMES = {'normal': '正常', 'delayed': '滞后', 'ahead': '超前'}
+
+
+def _normalize(text) -> str:
+    """统一取值和查询词（去空白、不区分大小写）"""
+    return str(text).strip().casefold()
+
+
+def report_terms(report: DailyReport) -> Dict[str, Set[str]]:
+    """
+    提取日报中需要索引的取值
+
+    :param report: 日报
+    :return: {字段: 取值集合}
+    """
+    terms = {
+        FIELD_WORKER: {worker.name for worker in report.worker_reports},
+        FIELD_MACHINE: {machine.machine_name for machine in report.machinery_rentals},
+        FIELD_TASK: {task.task_name for task in report.task_progress_list}
+                    | {plan.task_name for plan in report.tomorrow_plans},
+        FIELD_PROBLEM: {text for problem in report.problem_feedbacks
+                        for text in (problem.description, problem.reason, problem.impact)},
+        FIELD_DATE: {report.report_date, normalize_report_date(report.report_date)},
+        FIELD_PROGRESS: {report.overall_progress, PROGRESS_NAMES.get(report.overall_progress)}
+    }
+    return {
+        field: {value for value in (_normalize(value) for value in values if value) if value}
+        for field, values in terms.items()
+    }
+
+
+class ReportSearchIndex:
+    """日报倒排索引（行号与预览表格的行号一致，只支持在末尾追加）"""
+
+    def __init__(self):
+        self._postings: Dict[str, Dict[str, Set[int]]] = {}  # {字段: {取值: 行号集合}}
+        self._field_rows: Dict[str, Set[int]] = {}  # {字段: 该字段有取值的行号集合}
+        self._row_count = 0
+        self.clear()
+
+    @property
+    def row_count(self) -> int:
+        """已索引的行数"""
+        return self._row_count
+
+    def add_reports(self, reports: Iterable[DailyReport]):
+        """
+        在末尾追加日报（行号从当前行数开始）
+
+        :param reports: 日报列表
+        """
+        for report in reports:
+            row = self._row_count
+            for field, values in report_terms(report).items():
+                postings = self._postings[field]
+                for value in values:
+                    postings.setdefault(value, set()).add(row)
+                if values:
+                    self._field_rows[field].add(row)
+            self._row_count += 1
+
+    def clear(self):
+        """清空索引"""
+        self._postings = {field: {} for field in SEARCH_FIELDS}
+        self._field_rows = {field: set() for field in SEARCH_FIELDS}
+        self._row_count = 0
+
+    def search(self, query: str) -> Optional[Set[int]]:
+        """
+        搜索日报
+
+        :param query: 查询（语法见模块说明）
+        :return: 匹配的行号集合，查询为空时返回None（不筛选）
+        """
+        conditions = parse_query(query)
+        if not conditions:
+            return None
+
+        result = None
+        # 按命中行数从少到多求交集，交集为空时提前结束
+        for rows in sorted((self._match(field, text) for field, text in conditions), key=len):
+            result = rows if result is None else result & rows
+            if not result:
+                break
+        return result
+
+    def _match(self, field: Optional[str], text: str) -> Set[int]:
+        """单个条件命中的行号（field 为None时匹配任一字段）"""
+        fields = SEARCH_FIELDS if field is None else (field,)
+        rows = set()
+        for name in fields:
+            if not text:
+                rows |= self._field_rows[name]
+                continue
+            for value, value_rows in self._postings[name].items():
+                if text in value:
+                    rows |= value_rows
+        return rows
+
+
+def parse_query(query: str) -> List[tuple]:
+    """
+    解析查询
+
+    :param query: 查询字符串
+    :return: [(字段或None, 查询词), ...]，"问题:" 这样的空查询词表示该字段有取值
+    """
+    conditions = []
+    for token in (query or '').split():
+        field = None
+        for separator in (':', '：'):
+            prefix, found, rest = token.partition(separator)
+            if found and prefix in FIELD_ALIASES:
+                field, token = FIELD_ALIASES[prefix], rest
+                break
+        text = _normalize(token)
+        if field is None and not text:
+            continue
+        conditions.append((field, text))
+    return conditions
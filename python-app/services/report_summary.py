@@ -0,0 +1,303 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+日报汇总统计
+上传前汇总所有解析出的日报：各工种工时、各吨位机械台班、进度滞后天数、未关闭的问题。
+一次遍历把各工种工时、机械台班、任务进度等明细转换为按列存放的数值数组（array，
+分类字段编码为整数），再按编码分组求和；安装了 numpy 时分组求和使用 numpy.bincount，
+否则逐元素累加。汇总结果可导出为Excel（.xlsx）或JSON
+"""
+
+import re
+from array import array
+from typing import Dict, Iterable, List
+
+import openpyxl
+
+from report_model import DailyReport
+from services import json_codec
+from services.upload_index import normalize_report_date
+
+try:
+    import numpy
+except ImportError:  # 可选依赖
+    numpy = None
+
+# 数值字段中的数字（工时"8"/"8.5小时"、班次"0.5"、数量"2台"、进度"80%"）
+_NUMBER_PATTERN = re.compile(r'-?\d+(?:\.\d+)?')
+
+# 问题处理进度为以下内容时视为已关闭
+RESOLVED_KEYWORDS = ('已解决', '已完成', '已处理', '已关闭', '已落实')
+RESOLVED_VALUES = ('解决', '完成', '关闭', '处理完毕')
+
+# 未填写工种或吨位时的分类名称
+UNSPECIFIED = '未填写'
+
+# 导出Excel时的工作表：(工作表名称, 汇总结果中的列表字段, [(表头, 字段), ...])
+EXPORT_SHEETS = (
+    ('工种工时', 'manHoursByJobType', (('工种', 'jobType'), ('人次', 'workerDays'), ('工时', 'manHours'))),
+    ('机械台班', 'machineShiftsByTonnage', (('吨位', 'tonnage'), ('台次', 'machineDays'), ('台班', 'shifts'))),
+    ('进度滞后', 'delayedReports', (('日期', 'date'), ('进度描述', 'description'), ('滞后任务数', 'delayedTaskCount'))),
+    ('未关闭问题', 'openProblems', (('最近日期', 'date'), ('问题描述', 'description'), ('原因', 'reason'),
+                               ('影响', 'impact'), ('处理进度', 'progress'), ('出现天数', 'days'))),
+)
+
+
+def parse_number(value, default: float = 0.0) -> float:
+    """
+    提取字段中的数字
+
+    :param value: 字段值（字符串或数字）
+    :param default: 没有数字时的返回值
+    :return: 数值
+    """
+    if isinstance(value, (int, float)):
+        return float(value)
+    match = _NUMBER_PATTERN.search(str(value or ''))
+    return float(match.group()) if match else default
+
+
+def is_problem_resolved(progress: str) -> bool:
+    """
+    问题是否已关闭（按处理进度判断）
+
+    :param progress: 处理进度
+    :return: 已关闭时返回True
+    """
+    text = str(progress or '').strip()
+    return text in RESOLVED_VALUES or any(keyword in text for keyword in RESOLVED_KEYWORDS)
+
+
+class _Categories:
+    """分类字段编码（取值 -> 连续整数编号）"""
+
+    def __init__(self):
+        self.codes: Dict[str, int] = {}
+        self.names: List[str] = []
+
+    def code(self, value) -> int:
+        name = str(value or '').strip() or UNSPECIFIED
+        code = self.codes.get(name)
+        if code is None:
+            code = self.codes[name] = len(self.names)
+            self.names.append(name)
+        return code
+
+
+class ReportColumns:
+    """日报明细的列式数据（每类明细一组等长数组）"""
+
+    def __init__(self, reports: Iterable[DailyReport]):
+        """
+        :param reports: 日报列表（一次遍历转换为列式数据）
+        """
+        self.job_types = _Categories()
+        self.worker_job = array('q')      # 每个工作人员记录的工种编码
+        self.worker_hours = array('d')    # 每个工作人员记录的工时
+
+        self.tonnages = _Categories()
+        self.machine_tonnage = array('q')  # 每条机械记录的吨位编码
+        self.machine_count = array('d')    # 每条机械记录的数量（未填写按1台）
+        self.machine_shifts = array('d')   # 每条机械记录的台班（数量 × 班次）
+
+        self.task_report = array('q')      # 每条任务记录所属日报的序号
+        self.task_planned = array('d')     # 计划进度
+        self.task_actual = array('d')      # 实际进度
+
+        self.reports: List[DailyReport] = []
+        for report in reports:
+            self._add_report(report)
+
+    def _add_report(self, report: DailyReport):
+        """把一个日报的明细追加到各列"""
+        index = len(self.reports)
+        self.reports.append(report)
+
+        for worker in report.worker_reports:
+            self.worker_job.append(self.job_types.code(worker.job_type))
+            self.worker_hours.append(parse_number(worker.work_hours))
+
+        for machine in report.machinery_rentals:
+            quantity = parse_number(machine.quantity, 1.0)
+            self.machine_tonnage.append(self.tonnages.code(machine.tonnage))
+            self.machine_count.append(quantity)
+            self.machine_shifts.append(quantity * parse_number(machine.shift, 1.0))
+
+        for task in report.task_progress_list:
+            self.task_report.append(index)
+            self.task_planned.append(parse_number(task.planned_progress))
+            self.task_actual.append(parse_number(task.actual_progress))
+
+
+def group_sum(codes: array, values: array, size: int) -> List[float]:
+    """
+    按编码分组求和
+
+    :param codes: 编码数组（array('q')）
+    :param values: 数值数组（array('d')，与 codes 等长）
+    :param size: 编码个数
+    :return: 各编码的和（下标为编码）
+    """
+    if numpy is not None and codes:
+        sums = numpy.bincount(numpy.frombuffer(codes, dtype=numpy.int64),
+                              weights=numpy.frombuffer(values, dtype=numpy.float64), minlength=size)
+        return sums.tolist()
+    sums = [0.0] * size
+    for code, value in zip(codes, values):
+        sums[code] += value
+    return sums
+
+
+def group_count(codes: array, size: int) -> List[int]:
+    """
+    按编码计数
+
+    :param codes: 编码数组
+    :param size: 编码个数
+    :return: 各编码的出现次数（下标为编码）
+    """
+    if numpy is not None and codes:
+        return numpy.bincount(numpy.frombuffer(codes, dtype=numpy.int64), minlength=size).tolist()
+    counts = [0] * size
+    for code in codes:
+        counts[code] += 1
+    return counts
+
+
+def summarize_reports(reports: Iterable[DailyReport]) -> Dict:
+    """
+    汇总日报
+
+    :param reports: 日报列表
+    :return: 汇总结果字典：
+             reportCount、dateRange（[最早, 最晚]或None）、
+             manHoursByJobType（[{jobType, workerDays, manHours}]，按工时降序）、totalManHours、
+             machineShiftsByTonnage（[{tonnage, machineDays, shifts}]，按台班降序）、totalMachineShifts、
+             delayedDays、delayedReports（[{date, description, delayedTaskCount}]）、delayedTaskCount、
+             openProblemCount、openProblems（[{date, description, reason, impact, progress, days}]）
+    """
+    columns = ReportColumns(reports)
+
+    # 工种工时
+    job_count = len(columns.job_types.names)
+    hours = group_sum(columns.worker_job, columns.worker_hours, job_count)
+    worker_days = group_count(columns.worker_job, job_count)
+    man_hours = sorted(
+        ({'jobType': name, 'workerDays': worker_days[code], 'manHours': _round(hours[code])}
+         for code, name in enumerate(columns.job_types.names)),
+        key=lambda item: -item['manHours']
+    )
+
+    # 机械台班
+    tonnage_count = len(columns.tonnages.names)
+    shifts = group_sum(columns.machine_tonnage, columns.machine_shifts, tonnage_count)
+    machine_days = group_sum(columns.machine_tonnage, columns.machine_count, tonnage_count)
+    machine_shifts = sorted(
+        ({'tonnage': name, 'machineDays': _round(machine_days[code]), 'shifts': _round(shifts[code])}
+         for code, name in enumerate(columns.tonnages.names)),
+        key=lambda item: -item['shifts']
+    )
+
+    # 各日报中实际进度落后于计划的任务数
+    delayed_tasks = [0] * len(columns.reports)
+    for index, planned, actual in zip(columns.task_report, columns.task_planned, columns.task_actual):
+        if actual < planned:
+            delayed_tasks[index] += 1
+
+    delayed_reports = [
+        {'date': report.report_date, 'description': report.progress_description or '',
+         'delayedTaskCount': delayed_tasks[index]}
+        for index, report in enumerate(columns.reports) if report.overall_progress == 'delayed'
+    ]
+
+    open_problems = _open_problems(columns.reports)
+    dates = sorted(date for date in (normalize_report_date(report.report_date) for report in columns.reports)
+                   if len(date) == 10)
+
+    return {
+        'reportCount': len(columns.reports),
+        'dateRange': [dates[0], dates[-1]] if dates else None,
+        'manHoursByJobType': man_hours,
+        'totalManHours': _round(sum(columns.worker_hours)),
+        'machineShiftsByTonnage': machine_shifts,
+        'totalMachineShifts': _round(sum(columns.machine_shifts)),
+        'delayedDays': len(delayed_reports),
+        'delayedReports': delayed_reports,
+        'delayedTaskCount': sum(delayed_tasks),
+        'openProblemCount': len(open_problems),
+        'openProblems': open_problems
+    }
+
+
+def _open_problems(reports: List[DailyReport]) -> List[Dict]:
+    """
+    未关闭的问题：同一问题（描述相同）在多天日报中重复出现时，以日期最晚的一天的处理进度为准
+
+    :param reports: 日报列表
+    :return: 未关闭的问题列表（按最近日期降序）
+    """
+    latest: Dict[str, tuple] = {}  # {问题描述: (日期, 问题, 出现天数)}
+    for report in reports:
+        date = normalize_report_date(report.report_date)
+        for problem in report.problem_feedbacks:
+            key = str(problem.description or '').strip()
+            if not key:
+                continue
+            previous = latest.get(key)
+            if previous is None:
+                latest[key] = (date, problem, 1)
+            elif date >= previous[0]:
+                latest[key] = (date, problem, previous[2] + 1)
+            else:
+                latest[key] = (previous[0], previous[1], previous[2] + 1)
+
+    problems = [
+        {'date': date, 'description': problem.description, 'reason': problem.reason or '',
+         'impact': problem.impact or '', 'progress': problem.progress or '', 'days': days}
+        for date, problem, days in latest.values() if not is_problem_resolved(problem.progress)
+    ]
+    problems.sort(key=lambda item: item['date'], reverse=True)
+    return problems
+
+
+def _round(value: float):
+    """工时、台班保留两位小数，整数去掉小数部分"""
+    value = round(value, 2)
+    return int(value) if value == int(value) else value
+
+
+def export_summary(summary: Dict, output_path: str) -> str:
+    """
+    导出汇总结果（.json 导出JSON，其他扩展名导出Excel，每类汇总一个工作表）
+
+    :param summary: summarize_reports 的返回值
+    :param output_path: 输出文件路径
+    :return: 输出文件路径
+    """
+    if str(output_path).lower().endswith('.json'):
+        with open(output_path, 'w', encoding='utf-8') as f:
+            f.write(json_codec.dumps(summary, indent=2))
+        return output_path
+
+    workbook = openpyxl.Workbook(write_only=True)
+    overview = workbook.create_sheet('汇总')
+    date_range = summary['dateRange']
+    for row in (
+        ('日报数', summary['reportCount']),
+        ('日期范围', f"{date_range[0]} ~ {date_range[1]}" if date_range else '-'),
+        ('总工时', summary['totalManHours']),
+        ('机械台班合计', summary['totalMachineShifts']),
+        ('进度滞后天数', summary['delayedDays']),
+        ('滞后任务数（累计）', summary['delayedTaskCount']),
+        ('未关闭问题数', summary['openProblemCount'])
+    ):
+        overview.append(row)
+
+    for title, key, sheet_columns in EXPORT_SHEETS:
+        sheet = workbook.create_sheet(title)
+        sheet.append([header for header, _ in sheet_columns])
+        for item in summary[key]:
+            sheet.append([item[field] for _, field in sheet_columns])
+
+    workbook.save(output_path)
+    return output_path
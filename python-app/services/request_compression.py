@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+请求体压缩
+上传请求体按 Content-Encoding 压缩（gzip，安装了zstandard时优先zstd），
+并记录各主机不支持的编码，服务器拒绝压缩请求时自动退回不压缩
+"""
+
+import gzip
+import json
+import threading
+from typing import Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+from services.json_codec import dumps_bytes
+
+try:
+    import zstandard
+except ImportError:  # 可选依赖
+    zstandard = None
+
+# 小于该字节数的请求体不压缩（压缩收益抵不过开销）
+MIN_COMPRESS_BYTES = 1024
+
+# 压缩级别（兼顾速度和压缩率）
+GZIP_LEVEL = 6
+ZSTD_LEVEL = 3
+
+# 服务器不支持请求体压缩时可能返回的HTTP状态码
+# （415 不支持的媒体类型；未解压就按JSON解析时通常返回400）
+REJECTED_STATUS_CODES = (400, 415)
+
+# 400 响应的错误信息中表示请求体无法读取/解码（而不是请求数据校验失败）的关键词
+BODY_ERROR_KEYWORDS = (
+    'encoding', 'gzip', 'zstd', 'compress', 'chunked', 'transfer', 'content-length',
+    'parse error', 'json parse', 'unreadable', 'malformed', 'illegal character', 'unexpected character',
+    'request body', '请求体', '解压', '编码'
+)
+
+_lock = threading.Lock()
+_unsupported: Dict[str, set] = {}
+
+
+def available_encodings() -> Tuple[str, ...]:
+    """
+    获取本机可用的压缩编码（按优先级排列）
+
+    :return: 编码名称元组
+    """
+    return ('zstd', 'gzip') if zstandard is not None else ('gzip',)
+
+
+def compress(body: bytes, encoding: str) -> bytes:
+    """
+    压缩请求体
+
+    :param body: 原始请求体
+    :param encoding: 编码名称（gzip/zstd）
+    :return: 压缩后的请求体
+    """
+    if encoding == 'gzip':
+        return gzip.compress(body, compresslevel=GZIP_LEVEL)
+    if encoding == 'zstd' and zstandard is not None:
+        return zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(body)
+    raise ValueError(f'不支持的压缩编码: {encoding}')
+
+
+def encode_json(json_data) -> bytes:
+    """
+    序列化JSON请求体（UTF-8，不转义中文，比 \\uXXXX 转义更短）
+
+    :param json_data: JSON数据
+    :return: UTF-8编码的请求体
+    """
+    return dumps_bytes(json_data)
+
+
+def choose_encoding(url: str) -> Optional[str]:
+    """
+    选择该主机可用的压缩编码
+
+    :param url: 请求URL
+    :return: 编码名称，都不可用时返回None
+    """
+    host = _host(url)
+    with _lock:
+        unsupported = _unsupported.get(host, set())
+        for encoding in available_encodings():
+            if encoding not in unsupported:
+                return encoding
+    return None
+
+
+def mark_unsupported(url: str, encoding: str):
+    """
+    记录主机不支持某种压缩编码（本次运行内不再对该主机使用）
+
+    :param url: 请求URL
+    :param encoding: 编码名称
+    """
+    with _lock:
+        _unsupported.setdefault(_host(url), set()).add(encoding)
+
+
+def compress_json(url: str, json_data) -> Tuple[bytes, Optional[str], int]:
+    """
+    序列化并压缩JSON请求体
+
+    :param url: 请求URL（用于选择该主机支持的编码）
+    :param json_data: JSON数据
+    :return: (请求体, 编码名称, 压缩前字节数)，未压缩时编码名称为None
+    """
+    body = encode_json(json_data)
+    encoding = choose_encoding(url) if len(body) >= MIN_COMPRESS_BYTES else None
+    if encoding is None:
+        return body, None, len(body)
+    return compress(body, encoding), encoding, len(body)
+
+
+def is_request_body_rejected(response, status_codes: Tuple[int, ...]) -> bool:
+    """
+    判断服务器是否因为无法接收或解码请求体而拒绝请求（而不是请求数据本身有误）
+
+    411/413/415 等状态码直接视为拒绝；400 也是数据校验失败的状态码，
+    只有响应不是接口的JSON错误信息（如网关返回的错误页），或错误信息提到请求体解码、传输问题时才视为拒绝，
+    避免数据校验失败时以其他方式重复发送整批日报。
+
+    :param response: 响应对象
+    :param status_codes: 视为拒绝的状态码
+    :return: 请求体被拒绝时返回True
+    """
+    if response.status_code not in status_codes:
+        return False
+    if response.status_code != 400:
+        return True
+    text = (response.text or '')[:4096]
+    try:
+        data = json.loads(text)
+    except ValueError:
+        return True
+    if not isinstance(data, dict):
+        return True
+    message = str(data.get('msg') or data.get('message') or data.get('error') or '').lower()
+    return any(keyword in message for keyword in BODY_ERROR_KEYWORDS)
+
+
+def _host(url: str) -> str:
+    """提取主机（scheme://host:port）"""
+    parts = urlsplit(url)
+    return f"{parts.scheme}://{parts.netloc.lower()}"
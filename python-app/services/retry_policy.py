@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+重试策略
+指数退避（全抖动）重试，遵循服务器的 Retry-After，并用重试预算限制整体重试比例，
+避免网络故障时大量重试放大服务器压力
+"""
+
+import warnings
+# 忽略urllib3的OpenSSL警告
+warnings.filterwarnings('ignore', message='urllib3 v2 only supports OpenSSL 1.1.1+')
+
+import random
+import threading
+import time
+from collections import deque
+from email.utils import parsedate_to_datetime
+from typing import Optional
+
+import requests
+from urllib3.exceptions import NewConnectionError
+
+# 任何请求都可以重试的状态码（服务器明确表示未处理请求）
+RETRY_STATUS_ALWAYS = (429, 503)
+
+# 只有幂等请求才重试的状态码（网关错误，后端可能已经处理了请求）
+RETRY_STATUS_IDEMPOTENT = (502, 504)
+
+
+class RetryBudget:
+    """
+    重试预算（滑动时间窗口）
+
+    窗口内的重试次数不超过 最少重试次数 + 请求次数 × 重试比例，
+    服务器持续故障时停止重试，快速失败。
+    """
+
+    def __init__(self, ratio: float = 0.2, min_retries: int = 10, window: float = 60.0):
+        """
+        初始化重试预算
+
+        :param ratio: 允许的重试次数占请求次数的比例
+        :param min_retries: 窗口内至少允许的重试次数（请求较少时也能重试）
+        :param window: 统计窗口（秒）
+        """
+        self.ratio = ratio
+        self.min_retries = min_retries
+        self.window = window
+        self._requests = deque()
+        self._retries = deque()
+        self._lock = threading.Lock()
+
+    def record_request(self):
+        """记录一次请求（首次发送）"""
+        with self._lock:
+            self._requests.append(time.monotonic())
+
+    def try_spend(self) -> bool:
+        """
+        尝试消耗一次重试
+
+        :return: 是否允许重试
+        """
+        with self._lock:
+            now = time.monotonic()
+            for timestamps in (self._requests, self._retries):
+                while timestamps and now - timestamps[0] > self.window:
+                    timestamps.popleft()
+            if len(self._retries) >= self.min_retries + len(self._requests) * self.ratio:
+                return False
+            self._retries.append(now)
+            return True
+
+
+class RetryPolicy:
+    """重试策略类"""
+
+    def __init__(self, max_attempts: int = 4, base_delay: float = 0.5, max_delay: float = 8.0,
+                 max_retry_after: float = 60.0, budget: RetryBudget = None):
+        """
+        初始化重试策略
+
+        :param max_attempts: 最多发送次数（含首次）
+        :param base_delay: 退避基数（秒），第n次重试最多等待 base_delay × 2^(n-1)
+        :param max_delay: 单次退避的最长等待（秒）
+        :param max_retry_after: 遵循 Retry-After 时的最长等待（秒），超过则不重试
+        :param budget: 重试预算，默认每个策略独立的预算
+        """
+        self.max_attempts = max(1, max_attempts)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.max_retry_after = max_retry_after
+        self.budget = budget or RetryBudget()
+
+    def backoff(self, retry_no: int) -> float:
+        """
+        计算第n次重试前的等待时间（全抖动：0 ~ 指数上限之间的随机值）
+
+        :param retry_no: 重试序号（从1开始）
+        :return: 等待秒数
+        """
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2 ** (retry_no - 1))))
+
+    def should_retry_response(self, response: requests.Response, idempotent: bool) -> bool:
+        """
+        判断响应是否可以重试
+
+        :param response: 响应对象
+        :param idempotent: 请求是否幂等（重复发送不会重复处理）
+        :return: 是否可以重试
+        """
+        if response.status_code in RETRY_STATUS_ALWAYS:
+            return True
+        return idempotent and response.status_code in RETRY_STATUS_IDEMPOTENT
+
+    def should_retry_exception(self, error: Exception, idempotent: bool) -> bool:
+        """
+        判断请求异常是否可以重试
+
+        连接未建立（连接超时、连接被拒绝、域名解析失败）时服务器没有收到请求，总是可以重试；
+        读取超时或连接中断时服务器可能已经处理了请求，只有幂等请求才重试。
+
+        :param error: 请求异常
+        :param idempotent: 请求是否幂等
+        :return: 是否可以重试
+        """
+        if is_connect_failure(error):
+            return True
+        if isinstance(error, (requests.exceptions.Timeout, requests.exceptions.ConnectionError)):
+            return idempotent
+        return False
+
+    def retry_delay(self, retry_no: int, response: requests.Response = None) -> Optional[float]:
+        """
+        计算重试前的等待时间（优先遵循 Retry-After）
+
+        :param retry_no: 重试序号（从1开始）
+        :param response: 触发重试的响应（异常时为None）
+        :return: 等待秒数，Retry-After 超过上限时返回None（不重试）
+        """
+        retry_after = parse_retry_after(response) if response is not None else None
+        if retry_after is None:
+            return self.backoff(retry_no)
+        if retry_after > self.max_retry_after:
+            return None
+        return retry_after
+
+
+def is_connect_failure(error: Exception) -> bool:
+    """
+    判断异常是否发生在建立连接阶段（请求尚未发出）
+
+    :param error: 请求异常
+    :return: 是否为连接阶段失败
+    """
+    if isinstance(error, requests.exceptions.ConnectTimeout):
+        return True
+    if isinstance(error, requests.exceptions.ConnectionError) and error.args:
+        reason = getattr(error.args[0], 'reason', error.args[0])
+        return isinstance(reason, NewConnectionError)
+    return False
+
+
+def parse_retry_after(response: requests.Response) -> Optional[float]:
+    """
+    解析 Retry-After 响应头（秒数或HTTP日期）
+
+    :param response: 响应对象
+    :return: 等待秒数，没有或无法解析时返回None
+    """
+    value = response.headers.get('Retry-After') if response is not None else None
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at is None:
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+# 服务层默认的重试策略（共享重试预算）
+DEFAULT_RETRY_POLICY = RetryPolicy()
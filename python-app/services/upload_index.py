@@ -0,0 +1,272 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+已上传日报索引
+按服务器和项目记录已成功上传的日报日期（来自批量导入响应的successReports）及日报内容指纹，
+再次上传同一工作簿时只发送新增或内容有变化的日报
+"""
+
+import hashlib
+import json
+import logging
+import os
+import re
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set
+
+from report_model import DailyReport, as_daily_report
+from services.config_service import ConfigService
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+logger = logging.getLogger(__name__)
+
+# 索引文件（与配置文件同目录）
+DEFAULT_INDEX_PATH = ConfigService.CONFIG_DIR / 'uploaded_reports.json'
+
+# 日报相对已上传记录的状态
+REPORT_NEW = 'new'              # 未上传过
+REPORT_MODIFIED = 'modified'    # 已上传过，内容有变化（需覆盖上传）
+REPORT_UNCHANGED = 'unchanged'  # 已上传过，内容未变化（或上传时未记录指纹）
+
+# 已上传、但没有记录内容指纹的日报（如继续上传旧版本上传日志中的批次）：无法判断内容是否变化，按已修改处理
+UNKNOWN_FINGERPRINT = ''
+
+# 日期格式：2025.10.1 / 2025-10-01 / 2025/10/01 / 2025年10月1日
+_DATE_PATTERN = re.compile(r'^\s*(\d{4})\s*[.\-/年]\s*(\d{1,2})\s*[.\-/月]\s*(\d{1,2})\s*日?\s*$')
+
+
+def normalize_report_date(value) -> str:
+    """
+    统一日报日期格式（工作表名称与服务器返回的日期格式可能不同）
+
+    :param value: 日期字符串
+    :return: YYYY-MM-DD，无法识别时返回去空白的原字符串
+    """
+    text = str(value or '').strip()
+    match = _DATE_PATTERN.match(text)
+    if not match:
+        return text
+    year, month, day = match.groups()
+    return f"{year}-{int(month):02d}-{int(day):02d}"
+
+
+def report_fingerprint(report: DailyReport) -> str:
+    """
+    计算日报内容指纹（解析结果字典的稳定哈希，与字段顺序无关）
+
+    :param report: 解析后的日报（parse_sheet 的返回值）
+    :return: 十六进制哈希字符串
+    """
+    # 固定使用标准库序列化：换用其他JSON库时输出可能有细微差别，会使已记录的指纹全部失效
+    text = json.dumps(as_daily_report(report).to_dict(), sort_keys=True, ensure_ascii=False, separators=(',', ':'))
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+def classify_report(report: DailyReport, uploaded: Dict[str, Optional[str]]) -> str:
+    """
+    判断日报相对已上传记录的状态
+
+    :param report: 解析后的日报
+    :param uploaded: 已上传记录 {日期: 指纹}（get_fingerprints 的返回值），
+                     None 表示旧格式索引中只记录了上传时间的日期（视为未变化），
+                     UNKNOWN_FINGERPRINT 表示上传时未得到指纹（视为已修改）
+    :return: REPORT_NEW / REPORT_MODIFIED / REPORT_UNCHANGED
+    """
+    date = normalize_report_date(report.report_date)
+    if date not in uploaded:
+        return REPORT_NEW
+    fingerprint = uploaded[date]
+    if fingerprint is None or fingerprint == report_fingerprint(report):
+        return REPORT_UNCHANGED
+    return REPORT_MODIFIED
+
+
+@contextmanager
+def _file_lock(lock_path: Path):
+    """
+    跨进程互斥锁（锁文件加排他锁，进程退出时由系统释放）
+
+    :param lock_path: 锁文件路径
+    """
+    try:
+        lock_path.parent.mkdir(parents=True, exist_ok=True)
+        lock_file = open(lock_path, 'a+b')
+    except OSError as e:
+        # 无法创建锁文件时不加锁（与索引写入失败一样不影响上传）
+        logger.warning("⚠️  无法创建索引锁文件: %s", e)
+        yield
+        return
+
+    with lock_file:
+        if fcntl is not None:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+        else:
+            lock_file.seek(0)
+            while True:
+                try:
+                    # LK_LOCK 重试约10秒后仍未获得锁时抛出 OSError，继续等待
+                    msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:
+                    continue
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+            else:
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+class UploadedReportIndex:
+    """
+    已上传日报索引类（JSON文件）
+
+    界面、命令行和监视目录可能同时写入索引：读取-修改-写入期间持有跨进程文件锁（索引文件旁的 .lock 文件），
+    每次都在锁内重新读取索引再修改，不会覆盖其他进程的更新；读取不加锁（写入是原子替换）。
+    """
+
+    def __init__(self, index_path: str = None):
+        """
+        初始化已上传日报索引
+
+        :param index_path: 索引文件路径，默认 ~/.molten_salt_uploader/uploaded_reports.json
+        """
+        self.index_path = Path(index_path) if index_path else DEFAULT_INDEX_PATH
+        self._lock = threading.Lock()
+        self._lock_path = self.index_path.with_name(self.index_path.name + '.lock')
+
+    @staticmethod
+    def _key(server_url: str, project_id) -> str:
+        """索引键：服务器地址 + 项目ID"""
+        return f"{(server_url or '').rstrip('/')}|{project_id}"
+
+    def get_uploaded_dates(self, server_url: str, project_id) -> Set[str]:
+        """
+        获取项目已上传的日报日期
+
+        :param server_url: 服务器地址
+        :param project_id: 项目ID
+        :return: 日期集合（YYYY-MM-DD）
+        """
+        return set(self.get_fingerprints(server_url, project_id))
+
+    def get_fingerprints(self, server_url: str, project_id) -> Dict[str, Optional[str]]:
+        """
+        获取项目已上传日报的内容指纹
+
+        :param server_url: 服务器地址
+        :param project_id: 项目ID
+        :return: {日期(YYYY-MM-DD): 指纹}，旧格式索引（只记录了上传时间）的日期为None，
+                 上传时未得到指纹的日期为 UNKNOWN_FINGERPRINT
+        """
+        with self._lock:
+            project_dates = self._load().get(self._key(server_url, project_id), {})
+        return {date: self._entry_fingerprint(entry) for date, entry in project_dates.items()}
+
+    def record(self, server_url: str, project_id, report_dates: Iterable[str],
+               fingerprints: Dict[str, str] = None) -> int:
+        """
+        记录已成功上传的日报日期
+
+        :param server_url: 服务器地址
+        :param project_id: 项目ID
+        :param report_dates: 日报日期列表
+        :param fingerprints: 上传的日报内容指纹 {日期(YYYY-MM-DD): 指纹}，
+                             没有某日期的指纹时保留该日期原有的指纹
+        :return: 新记录的日期数
+        """
+        dates = {normalize_report_date(date) for date in report_dates if date}
+        dates.discard('')
+        if not dates:
+            return 0
+
+        fingerprints = fingerprints or {}
+        uploaded_at = time.strftime('%Y-%m-%d %H:%M:%S')
+        with self._lock, _file_lock(self._lock_path):
+            index = self._load()
+            project_dates = index.setdefault(self._key(server_url, project_id), {})
+            new_count = len(dates - project_dates.keys())
+            for date in dates:
+                fingerprint = fingerprints.get(date)
+                if fingerprint is None:
+                    fingerprint = self._entry_fingerprint(project_dates.get(date))
+                project_dates[date] = {'uploadedAt': uploaded_at, 'fingerprint': fingerprint}
+            self._save(index)
+        return new_count
+
+    def forget(self, server_url: str, project_id, report_dates: Iterable[str] = None):
+        """
+        删除已上传记录（服务器端数据被删除后使用）
+
+        :param server_url: 服务器地址
+        :param project_id: 项目ID
+        :param report_dates: 要删除的日期，不指定则删除该项目的全部记录
+        """
+        key = self._key(server_url, project_id)
+        with self._lock, _file_lock(self._lock_path):
+            index = self._load()
+            if report_dates is None:
+                index.pop(key, None)
+            else:
+                project_dates = index.get(key, {})
+                for date in report_dates:
+                    project_dates.pop(normalize_report_date(date), None)
+            self._save(index)
+
+    def diff(self, server_url: str, project_id, reports: List[DailyReport]) -> Dict[str, List[DailyReport]]:
+        """
+        按已上传记录把日报分为新增、已修改和未变化三组
+
+        :param server_url: 服务器地址
+        :param project_id: 项目ID
+        :param reports: 解析后的日报列表
+        :return: {REPORT_NEW: [...], REPORT_MODIFIED: [...], REPORT_UNCHANGED: [...]}
+        """
+        uploaded = self.get_fingerprints(server_url, project_id)
+        groups = {REPORT_NEW: [], REPORT_MODIFIED: [], REPORT_UNCHANGED: []}
+        for report in reports:
+            groups[classify_report(report, uploaded)].append(report)
+        return groups
+
+    @staticmethod
+    def _entry_fingerprint(entry) -> Optional[str]:
+        """读取索引项中的指纹（只记录了上传时间的旧格式为None，未记录指纹的为 UNKNOWN_FINGERPRINT）"""
+        if not isinstance(entry, dict):
+            return None
+        return entry.get('fingerprint') or UNKNOWN_FINGERPRINT
+
+    def _load(self) -> Dict:
+        """读取索引文件"""
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            return data if isinstance(data, dict) else {}
+        except (OSError, ValueError):
+            return {}
+
+    def _save(self, index: Dict):
+        """原子写入索引文件"""
+        try:
+            self.index_path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.index_path.parent, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    json.dump(index, f, indent=2, ensure_ascii=False)
+                os.replace(tmp_path, self.index_path)
+            except Exception:
+                os.unlink(tmp_path)
+                raise
+        except Exception as e:
+            # 索引写入失败不影响上传结果
+            logger.warning("⚠️  保存已上传日报索引失败: %s", e)
@@ -0,0 +1,375 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+上传日志
+在本地SQLite数据库中记录每次上传的各批日报、状态和服务器响应，
+程序崩溃或网络中断后可以只重传未完成的批次
+"""
+
+import json
+import os
+import sqlite3
+import sys
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from services.config_service import ConfigService
+
+# 上传日志数据库（与配置文件同目录）
+DEFAULT_JOURNAL_PATH = ConfigService.CONFIG_DIR / 'upload_journal.db'
+
+# 已完成的上传记录保留天数
+KEEP_DAYS = 30
+
+# 进行中的上传超过该时间（秒）没有更新任何批次状态时视为已中断
+# （单批最多4次请求、每次超时60秒，加上重试等待和退回完整发送，正常上传不会超过）
+RUNNING_STALE_SECONDS = 30 * 60
+
+# 批次状态
+BATCH_PENDING = 'pending'      # 尚未发送
+BATCH_SENDING = 'sending'      # 已发送、未收到响应（崩溃时服务器是否已接收未知，恢复时重传）
+BATCH_SUCCEEDED = 'succeeded'  # 服务器已处理（响应中的失败记录属于业务失败，不重传）
+BATCH_FAILED = 'failed'        # 请求失败（网络错误、HTTP错误等），恢复时重传
+
+# 上传状态
+UPLOAD_RUNNING = 'running'
+UPLOAD_COMPLETED = 'completed'
+UPLOAD_INCOMPLETE = 'incomplete'
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS uploads (
+    upload_id TEXT PRIMARY KEY,
+    server_url TEXT,
+    project_id INTEGER,
+    reporter_id INTEGER,
+    overwrite_existing INTEGER,
+    report_count INTEGER,
+    status TEXT,
+    created_at REAL,
+    updated_at REAL,
+    owner_pid INTEGER
+);
+CREATE TABLE IF NOT EXISTS batches (
+    upload_id TEXT,
+    batch_no INTEGER,
+    report_dates TEXT,
+    payload TEXT,
+    status TEXT,
+    result TEXT,
+    error TEXT,
+    updated_at REAL,
+    fingerprints TEXT,
+    PRIMARY KEY (upload_id, batch_no)
+);
+"""
+
+
+def is_process_alive(pid: Optional[int]) -> bool:
+    """
+    判断进程是否仍在运行
+
+    :param pid: 进程ID
+    :return: 进程存在时返回True
+    """
+    if not pid or pid <= 0:
+        return False
+    if sys.platform == 'win32':
+        # Windows 上 os.kill 会结束进程，改为查询进程退出码
+        import ctypes
+        process_query_limited_information = 0x1000
+        still_active = 259
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.OpenProcess(process_query_limited_information, False, pid)
+        if not handle:
+            return False
+        try:
+            exit_code = ctypes.c_ulong()
+            if not kernel32.GetExitCodeProcess(handle, ctypes.byref(exit_code)):
+                return True
+            return exit_code.value == still_active
+        finally:
+            kernel32.CloseHandle(handle)
+    try:
+        os.kill(pid, 0)
+    except PermissionError:
+        return True  # 进程存在，属于其他用户
+    except OSError:
+        return False
+    return True
+
+
+def is_upload_active(row) -> bool:
+    """
+    上传是否正在某个程序中进行（状态为running、所属进程仍在运行且最近有批次状态更新）
+
+    界面、命令行和监视目录共用上传日志，进行中的上传不能被其他程序继续上传，否则各批会被重复发送。
+
+    :param row: uploads 表的一行
+    :return: 正在进行时返回True
+    """
+    if row['status'] != UPLOAD_RUNNING:
+        return False
+    if time.time() - (row['updated_at'] or 0) > RUNNING_STALE_SECONDS:
+        return False
+    # 旧版本记录的上传没有进程ID，只按更新时间判断
+    return row['owner_pid'] is None or is_process_alive(row['owner_pid'])
+
+
+class UploadJournal:
+    """上传日志类（线程安全，可在并发上传的多个线程中使用）"""
+
+    def __init__(self, db_path: str = None):
+        """
+        初始化上传日志
+
+        :param db_path: 数据库文件路径，默认 ~/.molten_salt_uploader/upload_journal.db
+        """
+        self.db_path = Path(db_path) if db_path else DEFAULT_JOURNAL_PATH
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        with self._lock, self._conn:
+            self._conn.executescript(_SCHEMA)
+            # 旧版本创建的数据库没有日报内容指纹列
+            columns = {row['name'] for row in self._conn.execute("PRAGMA table_info(batches)")}
+            if 'fingerprints' not in columns:
+                self._conn.execute("ALTER TABLE batches ADD COLUMN fingerprints TEXT")
+            # 旧版本创建的数据库没有上传所属进程列
+            columns = {row['name'] for row in self._conn.execute("PRAGMA table_info(uploads)")}
+            if 'owner_pid' not in columns:
+                self._conn.execute("ALTER TABLE uploads ADD COLUMN owner_pid INTEGER")
+        self.prune()
+
+    def close(self):
+        """关闭数据库连接"""
+        with self._lock:
+            self._conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def start_upload(self, server_url: str, api_data: Dict, batches: List[Dict],
+                     batch_fingerprints: List[Dict[str, str]] = None) -> str:
+        """
+        记录一次新的上传（所有批次初始为待发送）
+
+        :param server_url: 服务器地址
+        :param api_data: 完整的API请求数据
+        :param batches: 拆分后的各批请求体
+        :param batch_fingerprints: 各批日报的内容指纹 [{日期(YYYY-MM-DD): 指纹}]，与 batches 一一对应，
+                                   继续上传时用于记入已上传日报索引
+        :return: 上传ID
+        """
+        upload_id = uuid.uuid4().hex
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT INTO uploads (upload_id, server_url, project_id, reporter_id, overwrite_existing, "
+                "report_count, status, created_at, updated_at, owner_pid) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (upload_id, server_url, api_data.get('projectId'), api_data.get('reporterId'),
+                 int(bool(api_data.get('overwriteExisting'))), len(api_data.get('reports', [])),
+                 UPLOAD_RUNNING, now, now, os.getpid())
+            )
+            self._conn.executemany(
+                "INSERT INTO batches (upload_id, batch_no, report_dates, payload, status, updated_at, fingerprints) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (upload_id, batch_no,
+                     json.dumps([r.get('reportDate', '') for r in batch['reports']], ensure_ascii=False),
+                     json.dumps(batch, ensure_ascii=False), BATCH_PENDING, now,
+                     json.dumps(batch_fingerprints[batch_no], ensure_ascii=False) if batch_fingerprints else None)
+                    for batch_no, batch in enumerate(batches)
+                ]
+            )
+        return upload_id
+
+    def mark_batch(self, upload_id: str, batch_no: int, status: str,
+                   result: Dict = None, error: str = None):
+        """
+        更新批次状态
+
+        :param upload_id: 上传ID
+        :param batch_no: 批次序号
+        :param status: 批次状态
+        :param result: 服务器返回的导入结果
+        :param error: 错误信息
+        """
+        now = time.time()
+        with self._lock, self._conn:
+            # 成功的批次不会再重传，清除请求体节省空间
+            self._conn.execute(
+                "UPDATE batches SET status = ?, result = ?, error = ?, updated_at = ?, "
+                "payload = CASE WHEN ? = ? THEN NULL ELSE payload END "
+                "WHERE upload_id = ? AND batch_no = ?",
+                (status, json.dumps(result, ensure_ascii=False) if result is not None else None,
+                 error, now, status, BATCH_SUCCEEDED, upload_id, batch_no)
+            )
+            # 同时更新上传的更新时间，其他程序据此判断上传仍在进行
+            self._conn.execute("UPDATE uploads SET updated_at = ? WHERE upload_id = ?", (now, upload_id))
+
+    def claim_upload(self, upload_id: str) -> bool:
+        """
+        继续上传前把上传标记为由本进程进行中
+
+        :param upload_id: 上传ID
+        :return: 成功标记时返回True；上传不存在或正在其他程序中进行时返回False
+        """
+        with self._lock, self._conn:
+            row = self._conn.execute("SELECT * FROM uploads WHERE upload_id = ?", (upload_id,)).fetchone()
+            if row is None or is_upload_active(row):
+                return False
+            # 只在读取后没有被其他程序修改时更新（其他程序同时继续上传时只有一个能成功）
+            cursor = self._conn.execute(
+                "UPDATE uploads SET status = ?, owner_pid = ?, updated_at = ? "
+                "WHERE upload_id = ? AND status = ? AND updated_at = ?",
+                (UPLOAD_RUNNING, os.getpid(), time.time(), upload_id, row['status'], row['updated_at'])
+            )
+            return cursor.rowcount == 1
+
+    def finish_upload(self, upload_id: str) -> str:
+        """
+        根据批次状态结束一次上传（全部批次成功为completed，否则为incomplete）
+
+        :param upload_id: 上传ID
+        :return: 上传状态
+        """
+        with self._lock, self._conn:
+            row = self._conn.execute(
+                "SELECT COUNT(*) FROM batches WHERE upload_id = ? AND status != ?",
+                (upload_id, BATCH_SUCCEEDED)
+            ).fetchone()
+            status = UPLOAD_COMPLETED if row[0] == 0 else UPLOAD_INCOMPLETE
+            self._conn.execute(
+                "UPDATE uploads SET status = ?, updated_at = ? WHERE upload_id = ?",
+                (status, time.time(), upload_id)
+            )
+        return status
+
+    def get_unfinished_upload(self, server_url: str = None, project_id: int = None) -> Optional[Dict]:
+        """
+        获取最近一次未完成的上传（包括崩溃时仍处于running状态的上传，不包括正在其他程序中进行的上传）
+
+        :param server_url: 只查找该服务器的上传
+        :param project_id: 只查找该项目的上传
+        :return: 上传信息，没有时返回None，包含：
+                 - uploadId / serverUrl / projectId / reporterId / overwriteExisting
+                 - reportCount: 日报总数
+                 - pendingCount: 未完成的日报数
+                 - createdAt: 创建时间戳
+        """
+        sql = "SELECT * FROM uploads WHERE status != ?"
+        params = [UPLOAD_COMPLETED]
+        if server_url is not None:
+            sql += " AND server_url = ?"
+            params.append(server_url)
+        if project_id is not None:
+            sql += " AND project_id = ?"
+            params.append(project_id)
+        sql += " ORDER BY created_at DESC"
+
+        with self._lock:
+            for row in self._conn.execute(sql, params).fetchall():
+                if is_upload_active(row):
+                    continue
+                pending_count = sum(
+                    len(json.loads(batch['report_dates']))
+                    for batch in self._conn.execute(
+                        "SELECT report_dates FROM batches WHERE upload_id = ? AND status != ?",
+                        (row['upload_id'], BATCH_SUCCEEDED)
+                    )
+                )
+                if pending_count:
+                    return {
+                        'uploadId': row['upload_id'],
+                        'serverUrl': row['server_url'],
+                        'projectId': row['project_id'],
+                        'reporterId': row['reporter_id'],
+                        'overwriteExisting': bool(row['overwrite_existing']),
+                        'reportCount': row['report_count'],
+                        'pendingCount': pending_count,
+                        'createdAt': row['created_at']
+                    }
+        return None
+
+    def load_unfinished_batches(self, upload_id: str) -> List[Tuple[int, Dict]]:
+        """
+        读取未完成的批次（待发送、发送中或请求失败）
+
+        :param upload_id: 上传ID
+        :return: [(批次序号, 请求体)] 列表
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT batch_no, payload FROM batches WHERE upload_id = ? AND status != ? "
+                "ORDER BY batch_no",
+                (upload_id, BATCH_SUCCEEDED)
+            ).fetchall()
+        return [(row['batch_no'], json.loads(row['payload'])) for row in rows]
+
+    def load_fingerprints(self, upload_id: str) -> Dict[str, str]:
+        """
+        读取未完成批次中日报的内容指纹
+
+        :param upload_id: 上传ID
+        :return: {日期(YYYY-MM-DD): 指纹}，旧版本记录的上传没有指纹时为空字典
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT fingerprints FROM batches WHERE upload_id = ? AND status != ?",
+                (upload_id, BATCH_SUCCEEDED)
+            ).fetchall()
+        fingerprints = {}
+        for row in rows:
+            if row['fingerprints']:
+                fingerprints.update(json.loads(row['fingerprints']))
+        return fingerprints
+
+    def load_results(self, upload_id: str) -> List[Tuple[int, Dict]]:
+        """
+        读取已成功批次的导入结果（按批次顺序）
+
+        :param upload_id: 上传ID
+        :return: [(批次序号, 导入结果)] 列表
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT batch_no, result FROM batches WHERE upload_id = ? AND status = ? "
+                "ORDER BY batch_no",
+                (upload_id, BATCH_SUCCEEDED)
+            ).fetchall()
+        return [(row['batch_no'], json.loads(row['result'])) for row in rows if row['result']]
+
+    def discard_upload(self, upload_id: str):
+        """
+        放弃一次上传（删除其记录）
+
+        :param upload_id: 上传ID
+        """
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM batches WHERE upload_id = ?", (upload_id,))
+            self._conn.execute("DELETE FROM uploads WHERE upload_id = ?", (upload_id,))
+
+    def prune(self, keep_days: int = KEEP_DAYS):
+        """
+        清理过期的已完成上传记录
+
+        :param keep_days: 保留天数
+        """
+        cutoff = time.time() - keep_days * 24 * 3600
+        with self._lock, self._conn:
+            self._conn.execute(
+                "DELETE FROM batches WHERE upload_id IN "
+                "(SELECT upload_id FROM uploads WHERE status = ? AND updated_at < ?)",
+                (UPLOAD_COMPLETED, cutoff)
+            )
+            self._conn.execute(
+                "DELETE FROM uploads WHERE status = ? AND updated_at < ?",
+                (UPLOAD_COMPLETED, cutoff)
+            )
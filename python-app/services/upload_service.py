@@ -9,15 +9,26 @@ import warnings
 # 忽略urllib3的OpenSSL警告
 warnings.filterwarnings('ignore', message='urllib3 v2 only supports OpenSSL 1.1.1+')
 
-import json
+import logging
 import tempfile
-from typing import Dict, Callable, Optional
+from typing import Dict, Callable, List, Optional, Tuple
 from pathlib import Path
 
 import requests
 
-from parse_daily_report_excel import DailyReportExcelParser
-from convert_to_api_format import convert_to_api_format
+from report_model import DailyReport
+from services.batch_import_service import (
+    BatchImportService, DEFAULT_BATCH_SIZE, DEFAULT_MAX_CONCURRENCY,
+    build_import_groups, empty_import_result
+)
+from services.upload_index import (
+    REPORT_MODIFIED, REPORT_NEW, REPORT_UNCHANGED, UploadedReportIndex
+)
+from services.json_codec import loads
+from services.upload_journal import UploadJournal
+from services.parse_service import ParseService
+
+logger = logging.getLogger(__name__)
 
 
 class UploadService:
@@ -39,7 +50,8 @@ class UploadService:
         project_id: int,
         reporter_id: int,
         overwrite_existing: bool = False,
-        progress_callback: Optional[Callable[[int], None]] = None
+        progress_callback: Optional[Callable[[int], None]] = None,
+        skip_uploaded: bool = True
     ) -> Dict:
         """
         上传日报Excel文件
@@ -49,7 +61,9 @@ class UploadService:
         :param reporter_id: 填报人ID
         :param overwrite_existing: 是否覆盖已存在的记录，默认False
         :param progress_callback: 进度回调函数
-        :return: 上传结果字典
+        :param skip_uploaded: 不覆盖时是否按本地索引增量上传：跳过已上传且内容未变化的日报，
+                              内容有变化的日报自动覆盖上传
+        :return: 上传结果字典（跳过的日报计入skippedCount）
         :raises Exception: 上传失败时抛出异常
         """
         # 检查登录状态
@@ -61,8 +75,8 @@ class UploadService:
             if progress_callback:
                 progress_callback(10)
             
-            parser = DailyReportExcelParser(excel_path)
-            all_reports = parser.parse_all_sheets()
+            # 多进程按工作表并行解析（只读流式模式）
+            all_reports = ParseService().parse_reports([excel_path])
             
             if not all_reports:
                 raise Exception('Excel文件中没有找到有效数据')
@@ -70,85 +84,120 @@ class UploadService:
             if progress_callback:
                 progress_callback(30)
             
-            # 2. 转换为API格式 (30-40%)
-            api_data = convert_to_api_format(all_reports, project_id, reporter_id, overwrite_existing)
+            # 2~3. 增量过滤、转换并分批上传 (30-100%)
+            return self.upload_reports(
+                all_reports, project_id, reporter_id, overwrite_existing,
+                progress_callback, skip_uploaded
+            )
+            
+        except Exception as e:
+            raise Exception(f'上传失败：{str(e)}')
+    
+    def upload_reports(
+        self,
+        reports: List[DailyReport],
+        project_id: int,
+        reporter_id: int,
+        overwrite_existing: bool = False,
+        progress_callback: Optional[Callable[[int], None]] = None,
+        skip_uploaded: bool = True,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY
+    ) -> Dict:
+        """
+        上传已解析的日报
+        
+        :param reports: 解析后的日报列表
+        :param project_id: 项目ID
+        :param reporter_id: 填报人ID
+        :param overwrite_existing: 是否覆盖已存在的记录，默认False
+        :param progress_callback: 进度回调函数（30%~100%）
+        :param skip_uploaded: 不覆盖时是否按本地索引增量上传：跳过已上传且内容未变化的日报，
+                              内容有变化的日报自动覆盖上传
+        :param batch_size: 每批日报数量
+        :param max_concurrency: 同时发送的批次数
+        :return: 上传结果字典（跳过的日报计入skippedCount），额外包含：
+                 - newCount / modifiedCount / unchangedCount: 新增、已修改、未变化（跳过）的日报数
+        :raises Exception: 上传失败时抛出异常
+        """
+        if not self.token or not self.api_base_url:
+            raise Exception('未登录，请先登录')
+        
+        # 不覆盖时按内容指纹增量上传：只发送新增和内容有变化的日报
+        new_reports = list(reports)
+        modified_reports = []
+        unchanged_reports = []
+        if skip_uploaded and not overwrite_existing:
+            groups = UploadedReportIndex().diff(self.api_base_url, project_id, reports)
+            new_reports = groups[REPORT_NEW]
+            modified_reports = groups[REPORT_MODIFIED]
+            unchanged_reports = groups[REPORT_UNCHANGED]
+            logger.info("🔍 增量上传：新增 %d 条，已修改 %d 条，未变化 %d 条（跳过）",
+                        len(new_reports), len(modified_reports), len(unchanged_reports))
+        
+        if not new_reports and not modified_reports:
+            if progress_callback:
+                progress_callback(100)
+            result = empty_import_result()
+            result.update(totalCount=len(unchanged_reports), skippedCount=len(unchanged_reports),
+                          batchCount=0, failedBatchCount=0, uploadId=None)
+        else:
+            # 转换为API格式 (30-40%)，已修改的日报单独一组覆盖上传
+            import_groups = build_import_groups(
+                new_reports, project_id, reporter_id, overwrite_existing, modified_reports
+            )
             
             if progress_callback:
                 progress_callback(40)
             
-            # 3. 调用批量导入API (40-100%)
-            result = self._call_batch_import_api(api_data, progress_callback)
+            # 分批调用批量导入API (40-100%)
+            result = self._call_batch_import_api(
+                import_groups, progress_callback, batch_size, max_concurrency
+            )
+            result['totalCount'] += len(unchanged_reports)
+            result['skippedCount'] += len(unchanged_reports)
             
             if progress_callback:
                 progress_callback(100)
-            
-            return result
-            
-        except Exception as e:
-            raise Exception(f'上传失败：{str(e)}')
+        
+        result.update(
+            newCount=len(new_reports),
+            modifiedCount=len(modified_reports),
+            unchangedCount=len(unchanged_reports)
+        )
+        return result
     
     def _call_batch_import_api(
         self,
-        api_data: Dict,
-        progress_callback: Optional[Callable[[int], None]] = None
+        import_groups: List[Tuple[Dict, Dict[str, str]]],
+        progress_callback: Optional[Callable[[int], None]] = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY
     ) -> Dict:
         """
-        调用批量导入API
+        分批并发调用批量导入API
         
-        :param api_data: API格式的数据
-        :param progress_callback: 进度回调函数
-        :return: 导入结果
+        :param import_groups: build_import_groups 的输出
+        :param progress_callback: 进度回调函数（40%~100%按已完成日报数计算）
+        :param batch_size: 每批日报数量
+        :param max_concurrency: 同时发送的批次数
+        :return: 合并后的导入结果
         """
         if not self.api_base_url or not self.token:
             raise Exception('未登录或登录已过期')
         
-        # 构建API URL
-        import_url = f"{self.api_base_url}/api/v1/daily-reports/batch-import"
-        
-        # 请求头
-        headers = {
-            'Authorization': f'Bearer {self.token}',
-            'Content-Type': 'application/json'
-        }
+        def on_batch_done(done: int, total: int):
+            if progress_callback and total:
+                progress_callback(40 + int(60 * done / total))
         
         try:
-            if progress_callback:
-                progress_callback(50)
-            
-            # 发送请求
-            response = requests.post(
-                import_url,
-                json=api_data,
-                headers=headers,
-                timeout=60
-            )
-            
-            if progress_callback:
-                progress_callback(80)
-            
-            # 检查响应
-            if response.status_code != 200:
-                error_msg = self._extract_error_message(response)
-                raise Exception(error_msg)
-            
-            # 解析响应
-            result = response.json()
-            
-            # 检查业务状态码
-            if result.get('code') != 200:
-                raise Exception(result.get('message', '导入失败'))
-            
-            # 返回导入结果
-            data = result.get('data', {})
-            return {
-                'totalCount': data.get('totalCount', 0),
-                'successCount': data.get('successCount', 0),
-                'failedCount': data.get('failedCount', 0),
-                'skippedCount': data.get('skippedCount', 0),
-                'successReports': data.get('successReports', []),
-                'failedReports': data.get('failedReports', [])
-            }
-            
+            with UploadJournal() as journal:
+                import_service = BatchImportService(
+                    self.api_base_url, self.token,
+                    batch_size=batch_size, max_concurrency=max_concurrency,
+                    journal=journal, uploaded_index=UploadedReportIndex()
+                )
+                return import_service.import_groups(import_groups, on_batch_done)
         except requests.exceptions.Timeout:
             raise Exception('请求超时，请重试')
         except requests.exceptions.ConnectionError:
@@ -156,6 +205,47 @@ class UploadService:
         except requests.exceptions.RequestException as e:
             raise Exception(f'网络请求失败：{str(e)}')
     
+    def get_unfinished_upload(self, project_id: int = None) -> Optional[Dict]:
+        """
+        获取上传日志中最近一次未完成的上传（当前服务器）
+        
+        :param project_id: 只查找该项目的上传
+        :return: 上传信息（见 UploadJournal.get_unfinished_upload），没有时返回None
+        """
+        server_url = self.api_base_url.rstrip('/') if self.api_base_url else None
+        with UploadJournal() as journal:
+            return journal.get_unfinished_upload(server_url, project_id)
+    
+    def resume_upload(
+        self,
+        upload_id: str,
+        progress_callback: Optional[Callable[[int], None]] = None
+    ) -> Dict:
+        """
+        继续上传日志中未完成的日报（只重传未完成的批次）
+        
+        :param upload_id: 上传ID
+        :param progress_callback: 进度回调函数
+        :return: 合并后的导入结果（包括之前已成功的批次）
+        :raises Exception: 上传失败时抛出异常
+        """
+        if not self.token or not self.api_base_url:
+            raise Exception('未登录，请先登录')
+        
+        def on_batch_done(done: int, total: int):
+            if progress_callback and total:
+                progress_callback(int(100 * done / total))
+        
+        try:
+            with UploadJournal() as journal:
+                import_service = BatchImportService(
+                    self.api_base_url, self.token,
+                    journal=journal, uploaded_index=UploadedReportIndex()
+                )
+                return import_service.resume_upload(upload_id, on_batch_done)
+        except Exception as e:
+            raise Exception(f'继续上传失败：{str(e)}')
+    
     def _extract_error_message(self, response) -> str:
         """
         从响应中提取错误信息
@@ -164,7 +254,7 @@ class UploadService:
         :return: 错误信息
         """
         try:
-            result = response.json()
+            result = loads(response.content)
             return result.get('message', f'HTTP {response.status_code}')
         except:
             if response.status_code == 401:
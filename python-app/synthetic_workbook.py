@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+合成日报工作簿生成工具
+功能：按 DailyReportExcelParser 识别的版式生成指定规模的日报Excel（每个工作表一天），
+用于解析和上传的性能测试；同一工作簿内各天使用同一批人员和机械，与实际日报一致
+
+版式（第1列为序号，第2列为内容）：
+    第1行         XX项目工作日报
+    一 项目整体进度（第3行第5列为进度描述）、逐项进度汇报（2.x）、明日工作计划（3.x）
+    二 各工种工作汇报（表头 + 每人一行）
+    三 机械租赁情况（表头 + 每台机械一行）
+    四 问题反馈（子标题1 + 1.x）、需求描述（子标题2 + 2.x）
+    五 其他
+"""
+
+import argparse
+import random
+from datetime import date, timedelta
+
+import openpyxl
+
+# 生成数据使用的取值
+SURNAMES = '张王李赵刘陈杨黄周吴徐孙马朱胡郭何高林罗'
+GIVEN_NAMES = '伟强磊军勇杰涛明超刚平辉鹏华飞鑫波宇浩凯'
+JOB_TYPES = ('电工', '焊工', '管工', '钳工', '起重工', '架子工', '保温工', '普工')
+WORKER_TYPES = ('正式', '劳务', '临时')
+MACHINE_NAMES = ('汽车吊', '履带吊', '挖掘机', '叉车', '高空作业车', '发电机')
+TONNAGES = ('8t', '25t', '50t', '80t', '130t')
+SHIFTS = ('1', '0.5', '2')
+URGENCY_LEVELS = ('一般', '紧急', '特急')
+PROGRESS_DESCRIPTIONS = ('项目整体进度正常', '受天气影响进度滞后1天', '进度超前计划2天')
+PROGRESS_WEIGHTS = (8, 1, 1)
+
+
+def generate_workbook(output_path: str, sheets: int = 31, tasks: int = 6, plans: int = 5,
+                      workers: int = 25, machinery: int = 6, problems: int = 3, requirements: int = 2,
+                      start_date: date = date(2025, 1, 1), project_name: str = '合成测试', seed: int = 0) -> str:
+    """
+    生成合成日报工作簿
+
+    :param output_path: 输出文件路径
+    :param sheets: 工作表（天）数
+    :param tasks: 每天的逐项进度汇报行数
+    :param plans: 每天的明日工作计划行数
+    :param workers: 每天的工作人员行数
+    :param machinery: 每天的机械租赁行数
+    :param problems: 每天的问题反馈行数
+    :param requirements: 每天的需求描述行数
+    :param start_date: 第一个工作表的日期（之后每个工作表加一天）
+    :param project_name: 项目名称（第1行标题）
+    :param seed: 随机数种子（相同参数和种子生成相同内容）
+    :return: 输出文件路径
+    """
+    rng = random.Random(seed)
+    crew = [
+        (f"{rng.choice(SURNAMES)}{rng.choice(GIVEN_NAMES)}{rng.choice(GIVEN_NAMES)}",
+         rng.choice(JOB_TYPES), rng.choice(WORKER_TYPES))
+        for _ in range(workers)
+    ]
+    fleet = [(rng.choice(MACHINE_NAMES), rng.choice(TONNAGES)) for _ in range(machinery)]
+
+    # 只写模式逐行追加，生成大工作簿时内存占用恒定
+    workbook = openpyxl.Workbook(write_only=True)
+    for day in range(sheets):
+        current = start_date + timedelta(days=day)
+        sheet = workbook.create_sheet(f"{current.year}.{current.month}.{current.day}")
+        for row in _sheet_rows(rng, project_name, crew, fleet, tasks, plans, problems, requirements):
+            sheet.append(row)
+    workbook.save(output_path)
+    return output_path
+
+
+def _sheet_rows(rng: random.Random, project_name: str, crew: list, fleet: list,
+                tasks: int, plans: int, problems: int, requirements: int) -> list:
+    """生成一个工作表（一天）的所有行"""
+    rows = [
+        [f"{project_name}项目工作日报"],
+        ['一', '项目整体进度'],
+        ['1', '整体进度', None, None, rng.choices(PROGRESS_DESCRIPTIONS, PROGRESS_WEIGHTS)[0]],
+        ['2', '逐项进度汇报', '计划进度', None, '实际进度', '偏差原因', '影响及措施'],
+    ]
+    for index in range(1, tasks + 1):
+        planned = rng.randint(10, 100)
+        rows.append([f"2.{index}", f"第{index}区管道安装", f"{planned}%", None,
+                     f"{max(0, planned - rng.randint(0, 10))}%", '无', '无'])
+
+    rows.append(['3', '明日工作计划', '目标', None, '负责人', '所需资源', '备注'])
+    for index in range(1, plans + 1):
+        rows.append([f"3.{index}", f"第{index}区管道安装", '完成焊接及探伤', None,
+                     rng.choice(crew)[0] if crew else '', rng.choice(MACHINE_NAMES), ''])
+
+    rows.append(['二', '各工种工作汇报'])
+    rows.append(['序号', '姓名', '工种', '人员类型', '工作内容', None, '工时'])
+    for index, (name, job_type, worker_type) in enumerate(crew, 1):
+        rows.append([index, name, job_type, worker_type, f"{job_type}作业", None, rng.choice((4, 8, 10))])
+
+    rows.append(['三', '机械租赁情况'])
+    rows.append(['序号', '机械名称', '数量', '吨位', '用途', '班次', '备注'])
+    for index, (machine_name, tonnage) in enumerate(fleet, 1):
+        rows.append([index, machine_name, 1, tonnage, '吊装', rng.choice(SHIFTS), ''])
+
+    rows.append(['四', '问题反馈'])
+    rows.append(['1', '问题描述', None, '原因', '影响', '处理进展'])
+    for index in range(1, problems + 1):
+        rows.append([f"1.{index}", f"第{index}区管道支架与设计不符", None, '现场尺寸偏差',
+                     '影响管道安装', rng.choice(('处理中', '已解决', '待处理'))])
+
+    rows.append(['2', '需求描述', None, '紧急程度', None, '期望时间'])
+    for index in range(1, requirements + 1):
+        rows.append([f"2.{index}", f"补充{rng.choice(MACHINE_NAMES)}一台", None,
+                     rng.choice(URGENCY_LEVELS), None, '明天'])
+
+    rows.append(['五', '其他'])
+    return rows
+
+
+def main():
+    """主函数"""
+    parser = argparse.ArgumentParser(description='生成合成日报工作簿（用于性能测试）')
+    parser.add_argument('output', help='输出Excel文件路径')
+    parser.add_argument('--sheets', type=int, default=31, help='工作表（天）数，默认31')
+    parser.add_argument('--tasks', type=int, default=6, help='每天的逐项进度汇报行数，默认6')
+    parser.add_argument('--plans', type=int, default=5, help='每天的明日工作计划行数，默认5')
+    parser.add_argument('--workers', type=int, default=25, help='每天的工作人员行数，默认25')
+    parser.add_argument('--machinery', type=int, default=6, help='每天的机械租赁行数，默认6')
+    parser.add_argument('--problems', type=int, default=3, help='每天的问题反馈行数，默认3')
+    parser.add_argument('--requirements', type=int, default=2, help='每天的需求描述行数，默认2')
+    parser.add_argument('--seed', type=int, default=0, help='随机数种子，默认0')
+    args = parser.parse_args()
+
+    generate_workbook(
+        args.output, sheets=args.sheets, tasks=args.tasks, plans=args.plans, workers=args.workers,
+        machinery=args.machinery, problems=args.problems, requirements=args.requirements, seed=args.seed
+    )
+    print(f"✓ 已生成: {args.output}（{args.sheets} 个工作表）")
+
+
+if __name__ == "__main__":
+    main()
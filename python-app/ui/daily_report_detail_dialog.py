@@ -3,27 +3,167 @@
 """
 日报详情对话框
 展示日报的完整详细信息
+对话框在预览界面中复用：切换日报只更新基本信息和当前选项卡，
+选项卡内容在第一次切换到该选项卡时创建，各日报的明细表格模型按日报缓存，
+来回查看同一批日报时不再重新创建表格
 """
 
+from collections import OrderedDict
+
 from PyQt6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
-    QTabWidget, QWidget, QTableWidget, QTableWidgetItem,
-    QTextEdit, QGroupBox, QScrollArea, QHeaderView, QSizePolicy
+    QTabWidget, QWidget, QTableView, QGroupBox, QScrollArea, QHeaderView, QSizePolicy
 )
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import QAbstractTableModel, QModelIndex, Qt, pyqtSignal
 from PyQt6.QtGui import QFont, QColor
+from report_model import DailyReport
 from services.app_state import AppState
 
+# 各明细表格的列：(表头, 明细对象字段)
+TASK_COLUMNS = (
+    ("序号", 'task_no'), ("任务名称", 'task_name'), ("计划进度", 'planned_progress'),
+    ("实际进度", 'actual_progress'), ("偏差原因", 'deviation_reason'), ("影响及措施", 'impact_measures')
+)
+PLAN_COLUMNS = (
+    ("序号", 'plan_no'), ("任务名称", 'task_name'), ("目标", 'goal'),
+    ("负责人", 'responsible_person'), ("所需资源", 'required_resources'), ("备注", 'remarks')
+)
+WORKER_COLUMNS = (
+    ("序号", 'seq_no'), ("姓名", 'name'), ("工种", 'job_type'),
+    ("类型", 'worker_type'), ("工作内容", 'work_content'), ("工时", 'work_hours')
+)
+MACHINERY_COLUMNS = (
+    ("序号", 'seq_no'), ("机械名称", 'machine_name'), ("数量", 'quantity'),
+    ("吨位", 'tonnage'), ("用途", 'usage'), ("班次", 'shift')
+)
+PROBLEM_COLUMNS = (
+    ("序号", 'problem_no'), ("问题描述", 'description'), ("原因", 'reason'),
+    ("影响", 'impact'), ("处理进度", 'progress')
+)
+REQUIREMENT_COLUMNS = (
+    ("序号", 'requirement_no'), ("需求描述", 'description'),
+    ("紧急程度", 'urgency_level'), ("期望时间", 'expected_time')
+)
+
+# 问题描述标红
+PROBLEM_DESCRIPTION_COLOR = QColor(244, 67, 54)
+
+# 进度状态显示文本
+PROGRESS_DISPLAY = {'normal': '正常🟢', 'delayed': '滞后🔴', 'ahead': '超前🔵'}
+
+# 缓存明细表格模型的日报数（超出时丢弃最久未查看的日报）
+DETAIL_CACHE_SIZE = 64
+
+
+class RecordTableModel(QAbstractTableModel):
+    """明细记录表格模型（只读，按列定义读取明细对象的字段）"""
+
+    def __init__(self, records: list, columns: tuple, highlight_column: int = None,
+                 highlight_color: QColor = None):
+        """
+        :param records: 明细对象列表（TaskProgress、WorkerReport 等）
+        :param columns: 列定义 ((表头, 字段), ...)
+        :param highlight_column: 需要着色的列号
+        :param highlight_color: 着色列的文字颜色
+        """
+        super().__init__()
+        self._records = records
+        self._headers = tuple(header for header, _ in columns)
+        self._fields = tuple(field for _, field in columns)
+        self._highlight_column = highlight_column
+        self._highlight_color = highlight_color
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._records)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._headers)
+
+    def headerData(self, section: int, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self._headers[section]
+        return super().headerData(section, orientation, role)
+
+    def data(self, index: QModelIndex, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.ItemDataRole.DisplayRole:
+            value = getattr(self._records[index.row()], self._fields[index.column()])
+            return None if value is None else str(value)
+        if role == Qt.ItemDataRole.ForegroundRole and index.column() == self._highlight_column:
+            return self._highlight_color
+        return None
+
+
+class _DetailSection:
+    """一个明细表格区域：有数据时显示表格，无数据时显示提示（可放在分组框中）"""
+
+    def __init__(self, field: str, columns: tuple, table: QTableView, no_data_label: QLabel,
+                 group: QGroupBox = None, highlight_column: int = None):
+        self.field = field  # DailyReport 中的明细列表字段
+        self.columns = columns
+        self.highlight_column = highlight_column
+        self.table = table
+        self.no_data_label = no_data_label
+        self.group = group
+
+    def show_model(self, model: RecordTableModel):
+        """
+        显示明细表格模型
+
+        :param model: 明细表格模型
+        """
+        has_data = model.rowCount() > 0
+        self.no_data_label.setVisible(not has_data)
+        self.table.setVisible(has_data)
+        self.table.setModel(model)
+        if has_data:
+            _fit_table(self.table)
+
+        if self.group is not None:
+            if has_data:
+                # ✅ 动态计算 QGroupBox 的高度
+                # 标题高度 + 内边距 + 表格高度
+                title_height = 30
+                padding_top_bottom = 20 + 10
+                group_height = title_height + padding_top_bottom + self.table.minimumHeight()
+            else:
+                group_height = 120
+            self.group.setMinimumHeight(group_height)
+            self.group.setMaximumHeight(group_height)
+
+
+def _fit_table(table: QTableView):
+    """设置列宽并按内容调整表格高度（表格不滚动，由外部滚动区域滚动）"""
+    for i in range(table.model().columnCount()):
+        table.setColumnWidth(i, 150)
+
+    # ✅ 按内容计算每一行的实际高度并求和，而不是用默认值
+    table.resizeRowsToContents()
+    header_height = table.horizontalHeader().sizeHint().height()
+    total_height = header_height + table.verticalHeader().length() + 2  # +2 for border
+    table.setMinimumHeight(total_height)
+
 
 class DailyReportDetailDialog(QDialog):
-    """日报详情对话框"""
+    """日报详情对话框（可复用，通过 set_report 切换显示的日报）"""
     
-    def __init__(self, report_data: dict, parent=None):
+    previous_requested = pyqtSignal()  # 查看上一条日报信号
+    next_requested = pyqtSignal()  # 查看下一条日报信号
+    
+    def __init__(self, report_data: DailyReport = None, parent=None):
         super().__init__(parent)
-        self.report_data = report_data
+        self.report_data = None
         self.app_state = AppState()  # 获取全局状态
         self.project_info = self.app_state.get_project_info()  # 获取项目信息
+        self._model_cache = OrderedDict()  # 明细表格模型缓存 {id(日报): (日报, {明细字段: 表格模型})}
+        self._current_models = {}  # 当前日报的明细表格模型 {明细字段: 表格模型}
+        self._tab_factories = []  # 各选项卡内容的创建函数（第一次切换到该选项卡时调用）
+        self._tab_sections = {}  # 已创建的选项卡 {选项卡序号: [_DetailSection, ...]}
+        self._stale_tabs = set()  # 已创建但显示的还是之前日报的选项卡
         self.setup_ui()
+        if report_data is not None:
+            self.set_report(report_data)
     
     def setup_ui(self):
         """初始化UI"""
@@ -51,8 +191,8 @@ class DailyReportDetailDialog(QDialog):
         layout.addWidget(basic_info)
         
         # 选项卡
-        tab_widget = QTabWidget()
-        tab_widget.setStyleSheet("""
+        self.tab_widget = QTabWidget()
+        self.tab_widget.setStyleSheet("""
             QTabWidget::pane {
                 border: none;
                 border-radius: 0px;
@@ -78,19 +218,59 @@ class DailyReportDetailDialog(QDialog):
                 background: #e3f2fd;
             }
         """)
-        tab_widget.setContentsMargins(0, 0, 0, 0)
-        
-        # 添加各个选项卡
-        tab_widget.addTab(self.create_task_progress_tab(), "📋 逐项进度汇报")
-        tab_widget.addTab(self.create_tomorrow_plans_tab(), "📅 明日工作计划")
-        tab_widget.addTab(self.create_worker_reports_tab(), "👷 各工种工作汇报")
-        tab_widget.addTab(self.create_machinery_tab(), "🚜 机械租赁情况")
-        tab_widget.addTab(self.create_problems_and_requirements_tab(), "⚠️ 问题反馈")
+        self.tab_widget.setContentsMargins(0, 0, 0, 0)
+        
+        # 添加各个选项卡（先放空白页，内容在第一次切换到该选项卡时创建）
+        tabs = (
+            ("📋 逐项进度汇报", self.create_task_progress_tab),
+            ("📅 明日工作计划", self.create_tomorrow_plans_tab),
+            ("👷 各工种工作汇报", self.create_worker_reports_tab),
+            ("🚜 机械租赁情况", self.create_machinery_tab),
+            ("⚠️ 问题反馈", self.create_problems_and_requirements_tab)
+        )
+        for title, factory in tabs:
+            page = QWidget()
+            page_layout = QVBoxLayout(page)
+            page_layout.setContentsMargins(0, 0, 0, 0)
+            self.tab_widget.addTab(page, title)
+            self._tab_factories.append(factory)
+        self.tab_widget.currentChanged.connect(self.show_tab)
+        
+        layout.addWidget(self.tab_widget)
+        
+        # 翻页和关闭按钮
+        button_layout = QHBoxLayout()
         
-        layout.addWidget(tab_widget)
+        nav_style = """
+            QPushButton {
+                background-color: #2196F3;
+                color: white;
+                border: none;
+                border-radius: 5px;
+                font-size: 14px;
+                font-weight: bold;
+            }
+            QPushButton:hover {
+                background-color: #1976D2;
+            }
+            QPushButton:disabled {
+                background-color: #BDBDBD;
+            }
+        """
+        self.previous_button = QPushButton("◀ 上一条")
+        self.previous_button.setMinimumSize(100, 40)
+        self.previous_button.clicked.connect(self.previous_requested)
+        self.previous_button.setStyleSheet(nav_style)
+        self.previous_button.setEnabled(False)
+        button_layout.addWidget(self.previous_button)
+        
+        self.next_button = QPushButton("下一条 ▶")
+        self.next_button.setMinimumSize(100, 40)
+        self.next_button.clicked.connect(self.next_requested)
+        self.next_button.setStyleSheet(nav_style)
+        self.next_button.setEnabled(False)
+        button_layout.addWidget(self.next_button)
         
-        # 关闭按钮
-        button_layout = QHBoxLayout()
         button_layout.addStretch()
         
         close_button = QPushButton("关闭")
@@ -120,8 +300,81 @@ class DailyReportDetailDialog(QDialog):
             }
         """)
     
+    def set_report(self, report_data: DailyReport):
+        """
+        显示日报（只刷新基本信息和当前选项卡，其他选项卡在切换到时刷新）
+        
+        :param report_data: 日报
+        """
+        self.report_data = report_data
+        self.project_info = self.app_state.get_project_info()
+        
+        # 缓存项中保存了日报本身，日报不会被回收，id 在缓存期间不会被复用
+        key = id(report_data)
+        entry = self._model_cache.get(key)
+        if entry is None:
+            entry = (report_data, {})
+            self._model_cache[key] = entry
+            while len(self._model_cache) > DETAIL_CACHE_SIZE:
+                self._model_cache.popitem(last=False)
+        else:
+            self._model_cache.move_to_end(key)
+        self._current_models = entry[1]
+        
+        self.setWindowTitle(f"日报详细信息 - {report_data.report_date or '-'}")
+        self.update_basic_info()
+        self._stale_tabs = set(self._tab_sections)
+        self.show_tab(self.tab_widget.currentIndex())
+    
+    def set_navigation_enabled(self, has_previous: bool, has_next: bool):
+        """
+        设置翻页按钮是否可用
+        
+        :param has_previous: 是否有上一条日报
+        :param has_next: 是否有下一条日报
+        """
+        self.previous_button.setEnabled(has_previous)
+        self.next_button.setEnabled(has_next)
+    
+    def clear_cache(self):
+        """清空明细表格模型缓存（预览数据清空时调用，当前显示的模型保留到切换日报）"""
+        self._model_cache.clear()
+    
+    def show_tab(self, index: int):
+        """
+        选项卡切换：第一次切换到时创建内容，显示的不是当前日报时刷新
+        
+        :param index: 选项卡序号
+        """
+        if index < 0:
+            return
+        
+        if index not in self._tab_sections:
+            content, sections = self._tab_factories[index]()
+            self.tab_widget.widget(index).layout().addWidget(content)
+            self._tab_sections[index] = sections
+        elif index not in self._stale_tabs:
+            return
+        self._stale_tabs.discard(index)
+        
+        if self.report_data is None:
+            return
+        for section in self._tab_sections[index]:
+            section.show_model(self._section_model(section))
+    
+    def _section_model(self, section: _DetailSection) -> RecordTableModel:
+        """获取当前日报某个明细区域的表格模型（已缓存时直接复用）"""
+        model = self._current_models.get(section.field)
+        if model is None:
+            model = RecordTableModel(
+                getattr(self.report_data, section.field), section.columns,
+                section.highlight_column, PROBLEM_DESCRIPTION_COLOR
+            )
+            self._current_models[section.field] = model
+        return model
+    
     def create_basic_info_panel(self):
-        """创建基本信息面板"""
+        """创建基本信息面板（内容由 update_basic_info 填充）"""
         group = QGroupBox("基本信息")
         group.setStyleSheet("""
             QGroupBox {
@@ -148,90 +401,112 @@ class DailyReportDetailDialog(QDialog):
         info_layout.setSpacing(8)
         
         # 日期和项目名称
-        row1 = QHBoxLayout()
-        row1.addWidget(self._create_info_label("📅 日期:", self.report_data.get('reportDate', '-')))
-        
-        # 项目信息（优先从全局状态获取）
-        reporter_name = self.report_data.get('reporterName', '-')  # ✅ 改为 reporterName
-        if self.project_info:
-            project_name = self.project_info.get('name', reporter_name)
-        else:
-            project_name = reporter_name
-        row1.addWidget(self._create_info_label("📁 项目:", project_name))
-        info_layout.addLayout(row1)
+        row1 = self._create_info_row(info_layout)
+        _, self.date_value = self._create_info_label(row1, "📅 日期:")
+        _, self.project_value = self._create_info_label(row1, "📁 项目:")
         
         # 项目详细信息（如果有）
-        if self.project_info:
-            row1_extra = QHBoxLayout()
-            project_type = self.project_info.get('typeDisplayName', '-')
-            project_status = self.project_info.get('statusDisplayName', '-')
-            row1_extra.addWidget(self._create_info_label("🏷️ 类型:", project_type))
-            row1_extra.addWidget(self._create_info_label("📊 状态:", project_status))
-            info_layout.addLayout(row1_extra)
+        self.project_extra_row = self._create_info_row(info_layout)
+        _, self.project_type_value = self._create_info_label(self.project_extra_row, "🏷️ 类型:")
+        _, self.project_status_value = self._create_info_label(self.project_extra_row, "📊 状态:")
         
         # 进度状态和描述
-        row2 = QHBoxLayout()
-        progress = self.report_data.get('overallProgress', 'normal')
-        progress_map = {'normal': '正常🟢', 'delayed': '滞后🔴', 'ahead': '超前🔵'}
-        progress_text = progress_map.get(progress, '正常🟢')
-        row2.addWidget(self._create_info_label("🎯 进度状态:", progress_text))
-        info_layout.addLayout(row2)
+        row2 = self._create_info_row(info_layout)
+        _, self.progress_value = self._create_info_label(row2, "🎯 进度状态:")
         
         # 进度描述
-        progress_desc = self.report_data.get('progressDescription', '-')
-        if progress_desc and progress_desc != '-':
-            desc_label = QLabel(f"📝 进度描述: {progress_desc}")
-            desc_label.setStyleSheet("color: #666666; font-size: 13px; padding: 5px;")
-            desc_label.setWordWrap(True)
-            info_layout.addWidget(desc_label)
+        self.desc_label = QLabel()
+        self.desc_label.setStyleSheet("color: #666666; font-size: 13px; padding: 5px;")
+        self.desc_label.setWordWrap(True)
+        info_layout.addWidget(self.desc_label)
         
         # 统计信息
-        row3 = QHBoxLayout()
-        task_count = len(self.report_data.get('taskProgressList', []))
-        worker_count = self.report_data.get('onSitePersonnelCount', 0)
-        machinery_count = len(self.report_data.get('machineryRentals', []))
-        problem_count = len(self.report_data.get('problemFeedbacks', []))
-        
-        row3.addWidget(self._create_info_label("📋 任务数:", str(task_count)))
-        row3.addWidget(self._create_info_label("👷 人员数:", str(worker_count)))
-        row3.addWidget(self._create_info_label("🚜 机械数:", str(machinery_count)))
-        row3.addWidget(self._create_info_label("⚠️ 问题数:", str(problem_count)))
-        info_layout.addLayout(row3)
+        row3 = self._create_info_row(info_layout)
+        _, self.task_count_value = self._create_info_label(row3, "📋 任务数:")
+        _, self.worker_count_value = self._create_info_label(row3, "👷 人员数:")
+        _, self.machinery_count_value = self._create_info_label(row3, "🚜 机械数:")
+        _, self.problem_count_value = self._create_info_label(row3, "⚠️ 问题数:")
         
         # 天气信息
-        weather = self.report_data.get('weather', '-')
-        temperature = self.report_data.get('temperature', '-')
-        if weather and weather != '-':
-            row4 = QHBoxLayout()
-            row4.addWidget(self._create_info_label("☀️ 天气:", weather))
-            if temperature and temperature != '-':
-                row4.addWidget(self._create_info_label("🌡️ 温度:", temperature))
-            info_layout.addLayout(row4)
+        self.weather_row = self._create_info_row(info_layout)
+        _, self.weather_value = self._create_info_label(self.weather_row, "☀️ 天气:")
+        self.temperature_field, self.temperature_value = self._create_info_label(self.weather_row, "🌡️ 温度:")
         
         # 项目管理信息（从全局状态获取）
-        if self.project_info:
-            row5 = QHBoxLayout()
-            manager = self.project_info.get('manager', '-')
-            completion_progress = self.project_info.get('completionProgress', 0)
-            row5.addWidget(self._create_info_label("👨‍💼 项目经理:", manager))
-            row5.addWidget(self._create_info_label("📈 项目完成度:", f"{completion_progress}%"))
-            info_layout.addLayout(row5)
-            
-            # 熔盐量信息
-            estimated_salt = self.project_info.get('estimatedSaltAmount', 0)
-            actual_salt = self.project_info.get('actualSaltAmount', 0)
-            if estimated_salt or actual_salt:
-                row6 = QHBoxLayout()
-                row6.addWidget(self._create_info_label("🎯 计划熔盐量:", f"{estimated_salt} 吨"))
-                row6.addWidget(self._create_info_label("✅ 实际熔盐量:", f"{actual_salt} 吨"))
-                info_layout.addLayout(row6)
+        self.manager_row = self._create_info_row(info_layout)
+        _, self.manager_value = self._create_info_label(self.manager_row, "👨‍💼 项目经理:")
+        _, self.completion_value = self._create_info_label(self.manager_row, "📈 项目完成度:")
+        
+        # 熔盐量信息
+        self.salt_row = self._create_info_row(info_layout)
+        _, self.estimated_salt_value = self._create_info_label(self.salt_row, "🎯 计划熔盐量:")
+        _, self.actual_salt_value = self._create_info_label(self.salt_row, "✅ 实际熔盐量:")
         
         layout.addLayout(info_layout)
         
         return group
     
-    def _create_info_label(self, title: str, value: str):
-        """创建信息标签"""
+    def update_basic_info(self):
+        """按当前日报和项目信息填充基本信息面板"""
+        report = self.report_data
+        project_info = self.project_info
+        
+        # 项目信息（优先从全局状态获取）
+        reporter_name = report.reporter_name or '-'  # ✅ 改为 reporterName
+        self.date_value.setText(report.report_date or '-')
+        self.project_value.setText(project_info.get('name', reporter_name) if project_info else reporter_name)
+        
+        self.project_extra_row.setVisible(bool(project_info))
+        if project_info:
+            self.project_type_value.setText(project_info.get('typeDisplayName', '-'))
+            self.project_status_value.setText(project_info.get('statusDisplayName', '-'))
+        
+        self.progress_value.setText(PROGRESS_DISPLAY.get(report.overall_progress, '正常🟢'))
+        
+        progress_desc = report.progress_description or '-'
+        self.desc_label.setVisible(progress_desc != '-')
+        self.desc_label.setText(f"📝 进度描述: {progress_desc}")
+        
+        self.task_count_value.setText(str(len(report.task_progress_list)))
+        self.worker_count_value.setText(str(report.on_site_personnel_count))
+        self.machinery_count_value.setText(str(len(report.machinery_rentals)))
+        self.problem_count_value.setText(str(len(report.problem_feedbacks)))
+        
+        weather = report.weather or '-'
+        temperature = report.temperature or '-'
+        self.weather_row.setVisible(weather != '-')
+        self.weather_value.setText(weather)
+        self.temperature_field.setVisible(temperature != '-')
+        self.temperature_value.setText(temperature)
+        
+        self.manager_row.setVisible(bool(project_info))
+        self.salt_row.setVisible(False)
+        if project_info:
+            self.manager_value.setText(project_info.get('manager', '-'))
+            self.completion_value.setText(f"{project_info.get('completionProgress', 0)}%")
+            
+            estimated_salt = project_info.get('estimatedSaltAmount', 0)
+            actual_salt = project_info.get('actualSaltAmount', 0)
+            self.salt_row.setVisible(bool(estimated_salt or actual_salt))
+            self.estimated_salt_value.setText(f"{estimated_salt} 吨")
+            self.actual_salt_value.setText(f"{actual_salt} 吨")
+    
+    def _create_info_row(self, info_layout: QVBoxLayout) -> QWidget:
+        """创建信息行（可整行隐藏）"""
+        row = QWidget()
+        row_layout = QHBoxLayout(row)
+        row_layout.setContentsMargins(0, 0, 0, 0)
+        info_layout.addWidget(row)
+        return row
+    
+    def _create_info_label(self, row: QWidget, title: str):
+        """
+        在信息行中创建信息标签
+        
+        :param row: 信息行
+        :param title: 标题
+        :return: (标签容器, 值标签)
+        """
         container = QWidget()
         layout = QHBoxLayout(container)
         layout.setContentsMargins(5, 2, 5, 2)
@@ -239,148 +514,41 @@ class DailyReportDetailDialog(QDialog):
         title_label = QLabel(title)
         title_label.setStyleSheet("color: #333333; font-weight: bold; font-size: 13px;")
         
-        value_label = QLabel(value)
+        value_label = QLabel()
         value_label.setStyleSheet("color: #666666; font-size: 13px;")
         
         layout.addWidget(title_label)
         layout.addWidget(value_label)
         layout.addStretch()
         
-        return container
+        row.layout().addWidget(container)
+        return container, value_label
     
     def create_task_progress_tab(self):
         """创建任务进度选项卡"""
-        # ✅ 创建滚动区域
-        scroll = QScrollArea()
-        scroll.setWidgetResizable(True)
-        scroll.setStyleSheet("QScrollArea { border: none; background-color: transparent; }")
-        
-        widget = QWidget()
-        layout = QVBoxLayout(widget)
-        layout.setContentsMargins(0, 0, 0, 0)
-        layout.setSpacing(0)
-        
-        tasks = self.report_data.get('taskProgressList', [])
-        
-        if not tasks:
-            no_data_label = QLabel("暂无任务进度数据")
-            no_data_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            no_data_label.setStyleSheet("color: #999999; font-size: 14px; padding: 50px;")
-            layout.addWidget(no_data_label)
-            scroll.setWidget(widget)
-            return scroll
-        
-        table = QTableWidget()
-        table.setRowCount(len(tasks))
-        table.setColumnCount(6)
-        table.setHorizontalHeaderLabels([
-            "序号", "任务名称", "计划进度", "实际进度", "偏差原因", "影响及措施"
-        ])
-        
-        # 设置表格样式
-        self._setup_table_style(table)
-        
-        # 填充数据
-        for row, task in enumerate(tasks):
-            table.setItem(row, 0, QTableWidgetItem(task.get('taskNo', '-')))
-            table.setItem(row, 1, QTableWidgetItem(task.get('taskName', '-')))
-            table.setItem(row, 2, QTableWidgetItem(task.get('plannedProgress', '-')))
-            table.setItem(row, 3, QTableWidgetItem(task.get('actualProgress', '-')))
-            table.setItem(row, 4, QTableWidgetItem(task.get('deviationReason', '-')))
-            table.setItem(row, 5, QTableWidgetItem(task.get('impactMeasures', '-')))
-        
-        layout.addWidget(table)
-        scroll.setWidget(widget)
-        return scroll
+        return self._create_table_tab('task_progress_list', TASK_COLUMNS, "暂无任务进度数据")
     
     def create_tomorrow_plans_tab(self):
         """创建明日计划选项卡"""
-        # ✅ 创建滚动区域
-        scroll = QScrollArea()
-        scroll.setWidgetResizable(True)
-        scroll.setStyleSheet("QScrollArea { border: none; background-color: transparent; }")
-        
-        widget = QWidget()
-        layout = QVBoxLayout(widget)
-        layout.setContentsMargins(0, 0, 0, 0)
-        layout.setSpacing(0)
-        
-        plans = self.report_data.get('tomorrowPlans', [])
-        
-        if not plans:
-            no_data_label = QLabel("暂无明日计划数据")
-            no_data_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            no_data_label.setStyleSheet("color: #999999; font-size: 14px; padding: 50px;")
-            layout.addWidget(no_data_label)
-            scroll.setWidget(widget)
-            return scroll
-        
-        table = QTableWidget()
-        table.setRowCount(len(plans))
-        table.setColumnCount(6)
-        table.setHorizontalHeaderLabels([
-            "序号", "任务名称", "目标", "负责人", "所需资源", "备注"
-        ])
-        
-        self._setup_table_style(table)
-        
-        for row, plan in enumerate(plans):
-            table.setItem(row, 0, QTableWidgetItem(plan.get('planNo', '-')))
-            table.setItem(row, 1, QTableWidgetItem(plan.get('taskName', '-')))
-            table.setItem(row, 2, QTableWidgetItem(plan.get('goal', '-')))
-            table.setItem(row, 3, QTableWidgetItem(plan.get('responsiblePerson', '-')))
-            table.setItem(row, 4, QTableWidgetItem(plan.get('requiredResources', '-')))
-            table.setItem(row, 5, QTableWidgetItem(plan.get('remarks', '-')))
-        
-        layout.addWidget(table)
-        scroll.setWidget(widget)
-        return scroll
+        return self._create_table_tab('tomorrow_plans', PLAN_COLUMNS, "暂无明日计划数据")
     
     def create_worker_reports_tab(self):
         """创建人员报告选项卡"""
-        # ✅ 创建滚动区域
-        scroll = QScrollArea()
-        scroll.setWidgetResizable(True)
-        scroll.setStyleSheet("QScrollArea { border: none; background-color: transparent; }")
-        
-        widget = QWidget()
-        layout = QVBoxLayout(widget)
-        layout.setContentsMargins(0, 0, 0, 0)
-        layout.setSpacing(0)
-        
-        workers = self.report_data.get('workerReports', [])
-        
-        if not workers:
-            no_data_label = QLabel("暂无人员报告数据")
-            no_data_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            no_data_label.setStyleSheet("color: #999999; font-size: 14px; padding: 50px;")
-            layout.addWidget(no_data_label)
-            scroll.setWidget(widget)
-            return scroll
-        
-        table = QTableWidget()
-        table.setRowCount(len(workers))
-        table.setColumnCount(6)
-        table.setHorizontalHeaderLabels([
-            "序号", "姓名", "工种", "类型", "工作内容", "工时"
-        ])
-        
-        self._setup_table_style(table)
-        
-        for row, worker in enumerate(workers):
-            table.setItem(row, 0, QTableWidgetItem(worker.get('seqNo', '-')))
-            table.setItem(row, 1, QTableWidgetItem(worker.get('name', '-')))
-            table.setItem(row, 2, QTableWidgetItem(worker.get('jobType', '-')))
-            table.setItem(row, 3, QTableWidgetItem(worker.get('workerType', '-')))
-            table.setItem(row, 4, QTableWidgetItem(worker.get('workContent', '-')))
-            table.setItem(row, 5, QTableWidgetItem(worker.get('workHours', '-')))
-        
-        layout.addWidget(table)
-        scroll.setWidget(widget)
-        return scroll
+        return self._create_table_tab('worker_reports', WORKER_COLUMNS, "暂无人员报告数据")
     
     def create_machinery_tab(self):
         """创建机械租赁选项卡"""
+        return self._create_table_tab('machinery_rentals', MACHINERY_COLUMNS, "暂无机械租赁数据")
+    
+    def _create_table_tab(self, field: str, columns: tuple, no_data_text: str):
+        """
+        创建只有一个明细表格的选项卡
+        
+        :param field: DailyReport 中的明细列表字段
+        :param columns: 表格列定义
+        :param no_data_text: 无数据时的提示
+        :return: (选项卡内容, [_DetailSection])
+        """
         # ✅ 创建滚动区域
         scroll = QScrollArea()
         scroll.setWidgetResizable(True)
@@ -391,36 +559,17 @@ class DailyReportDetailDialog(QDialog):
         layout.setContentsMargins(0, 0, 0, 0)
         layout.setSpacing(0)
         
-        machinery = self.report_data.get('machineryRentals', [])
-        
-        if not machinery:
-            no_data_label = QLabel("暂无机械租赁数据")
-            no_data_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            no_data_label.setStyleSheet("color: #999999; font-size: 14px; padding: 50px;")
-            layout.addWidget(no_data_label)
-            scroll.setWidget(widget)
-            return scroll
-        
-        table = QTableWidget()
-        table.setRowCount(len(machinery))
-        table.setColumnCount(6)
-        table.setHorizontalHeaderLabels([
-            "序号", "机械名称", "数量", "吨位", "用途", "班次"
-        ])
+        no_data_label = QLabel(no_data_text)
+        no_data_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        no_data_label.setStyleSheet("color: #999999; font-size: 14px; padding: 50px;")
+        layout.addWidget(no_data_label)
         
+        table = QTableView()
         self._setup_table_style(table)
-        
-        for row, item in enumerate(machinery):
-            table.setItem(row, 0, QTableWidgetItem(item.get('seqNo', '-')))
-            table.setItem(row, 1, QTableWidgetItem(item.get('machineName', '-')))
-            table.setItem(row, 2, QTableWidgetItem(item.get('quantity', '-')))
-            table.setItem(row, 3, QTableWidgetItem(item.get('tonnage', '-')))
-            table.setItem(row, 4, QTableWidgetItem(item.get('usage', '-')))
-            table.setItem(row, 5, QTableWidgetItem(item.get('shift', '-')))
-        
         layout.addWidget(table)
+        
         scroll.setWidget(widget)
-        return scroll
+        return scroll, [_DetailSection(field, columns, table, no_data_label)]
     
     def create_problems_and_requirements_tab(self):
         """创建问题反馈选项卡（包含问题反馈和需求描述）"""
@@ -436,21 +585,21 @@ class DailyReportDetailDialog(QDialog):
         layout.setContentsMargins(10, 10, 10, 10)
         
         # 1. 问题反馈分组
-        problems_group = self._create_problems_group()
-        layout.addWidget(problems_group)
+        problems_section = self._create_problems_group()
+        layout.addWidget(problems_section.group)
         
         # 2. 需求描述分组
-        requirements_group = self._create_requirements_group()
-        layout.addWidget(requirements_group)
+        requirements_section = self._create_requirements_group()
+        layout.addWidget(requirements_section.group)
         
         layout.addStretch()
         
         scroll.setWidget(container)
         
         # ✅ 直接返回 QScrollArea，移除父视图包装
-        return scroll
+        return scroll, [problems_section, requirements_section]
     
-    def _create_problems_group(self):
+    def _create_problems_group(self) -> _DetailSection:
         """创建问题反馈分组"""
         group = QGroupBox("1. 问题反馈")
         group.setStyleSheet("""
@@ -474,50 +623,20 @@ class DailyReportDetailDialog(QDialog):
         layout = QVBoxLayout(group)
         layout.setContentsMargins(10, 20, 10, 10)
         
-        problems = self.report_data.get('problemFeedbacks', [])
+        no_data_label = QLabel("✅ 暂无问题反馈")
+        no_data_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        no_data_label.setStyleSheet("color: #4CAF50; font-size: 14px; font-weight: bold; padding: 30px;")
+        layout.addWidget(no_data_label)
         
-        if not problems:
-            no_data_label = QLabel("✅ 暂无问题反馈")
-            no_data_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            no_data_label.setStyleSheet("color: #4CAF50; font-size: 14px; font-weight: bold; padding: 30px;")
-            layout.addWidget(no_data_label)
-            group.setMinimumHeight(120)
-            group.setMaximumHeight(120)
-        else:
-            table = QTableWidget()
-            table.setRowCount(len(problems))
-            table.setColumnCount(5)
-            table.setHorizontalHeaderLabels([
-                "序号", "问题描述", "原因", "影响", "处理进度"
-            ])
-            
-            self._setup_table_style(table)
-            
-            for row, problem in enumerate(problems):
-                table.setItem(row, 0, QTableWidgetItem(problem.get('problemNo', '-')))
-                
-                # 问题描述标红
-                desc_item = QTableWidgetItem(problem.get('description', '-'))
-                desc_item.setForeground(QColor(244, 67, 54))
-                table.setItem(row, 1, desc_item)
-                
-                table.setItem(row, 2, QTableWidgetItem(problem.get('reason', '-')))
-                table.setItem(row, 3, QTableWidgetItem(problem.get('impact', '-')))
-                table.setItem(row, 4, QTableWidgetItem(problem.get('progress', '-')))
-            
-            layout.addWidget(table)
-            
-            # ✅ 动态计算 QGroupBox 的高度
-            # 标题高度 + 内边距 + 表格高度
-            title_height = 30
-            padding_top_bottom = 20 + 10
-            group_height = title_height + padding_top_bottom + table.minimumHeight()
-            group.setMinimumHeight(group_height)
-            group.setMaximumHeight(group_height)
+        table = QTableView()
+        self._setup_table_style(table)
+        layout.addWidget(table)
         
-        return group
+        # 问题描述标红
+        return _DetailSection('problem_feedbacks', PROBLEM_COLUMNS, table, no_data_label, group,
+                              highlight_column=1)
     
-    def _create_requirements_group(self):
+    def _create_requirements_group(self) -> _DetailSection:
         """创建需求描述分组"""
         group = QGroupBox("2. 需求描述")
         group.setStyleSheet("""
@@ -541,52 +660,26 @@ class DailyReportDetailDialog(QDialog):
         layout = QVBoxLayout(group)
         layout.setContentsMargins(10, 20, 10, 10)
         
-        requirements = self.report_data.get('requirements', [])
+        no_data_label = QLabel("暂无需求描述")
+        no_data_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        no_data_label.setStyleSheet("color: #999999; font-size: 14px; padding: 30px;")
+        layout.addWidget(no_data_label)
         
-        if not requirements:
-            no_data_label = QLabel("暂无需求描述")
-            no_data_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            no_data_label.setStyleSheet("color: #999999; font-size: 14px; padding: 30px;")
-            layout.addWidget(no_data_label)
-            group.setMinimumHeight(120)
-            group.setMaximumHeight(120)
-        else:
-            table = QTableWidget()
-            table.setRowCount(len(requirements))
-            table.setColumnCount(4)
-            table.setHorizontalHeaderLabels([
-                "序号", "需求描述", "紧急程度", "期望时间"
-            ])
-            
-            self._setup_table_style(table)
-            
-            for row, req in enumerate(requirements):
-                table.setItem(row, 0, QTableWidgetItem(req.get('requirementNo', '-')))
-                table.setItem(row, 1, QTableWidgetItem(req.get('description', '-')))
-                table.setItem(row, 2, QTableWidgetItem(req.get('urgencyLevel', '-')))
-                table.setItem(row, 3, QTableWidgetItem(req.get('expectedTime', '-')))
-            
-            layout.addWidget(table)
-            
-            # ✅ 动态计算 QGroupBox 的高度
-            # 标题高度 + 内边距 + 表格高度
-            title_height = 30
-            padding_top_bottom = 20 + 10
-            group_height = title_height + padding_top_bottom + table.minimumHeight()
-            group.setMinimumHeight(group_height)
-            group.setMaximumHeight(group_height)
+        table = QTableView()
+        self._setup_table_style(table)
+        layout.addWidget(table)
         
-        return group
+        return _DetailSection('requirements', REQUIREMENT_COLUMNS, table, no_data_label, group)
     
-    def _setup_table_style(self, table: QTableWidget):
-        """设置表格样式"""
+    def _setup_table_style(self, table: QTableView):
+        """设置表格样式（列宽和高度在显示数据时由 _fit_table 设置）"""
         table.setStyleSheet("""
-            QTableWidget {
+            QTableView {
                 border: none;
                 background-color: transparent;
                 gridline-color: #e0e0e0;
             }
-            QTableWidget::item {
+            QTableView::item {
                 padding: 8px;
                 color: #333333;
             }
@@ -597,14 +690,14 @@ class DailyReportDetailDialog(QDialog):
                 border: 1px solid #e0e0e0;
                 font-weight: bold;
             }
-            QTableWidget::item:selected {
+            QTableView::item:selected {
                 background-color: #e3f2fd;
             }
         """)
         
         # 设置表格属性
-        table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
-        table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
+        table.setEditTriggers(QTableView.EditTrigger.NoEditTriggers)
+        table.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)
         table.horizontalHeader().setStretchLastSection(True)
         table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
         table.verticalHeader().setVisible(False)
@@ -615,26 +708,7 @@ class DailyReportDetailDialog(QDialog):
         
         # 启用自动换行
         table.setWordWrap(True)
-        table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.ResizeToContents)
-        
-        # 设置列宽
-        for i in range(table.columnCount()):
-            table.setColumnWidth(i, 150)
         
         # 调整表格高度以适应内容
         table.setSizePolicy(QSizePolicy.Policy.Expanding, 
                            QSizePolicy.Policy.Expanding)
-        
-        # 计算并设置表格的最小高度（根据行数）
-        row_count = table.rowCount()
-        header_height = table.horizontalHeader().height()
-        
-        # ✅ 正确的做法：计算每一行的实际高度并求和，而不是用默认值
-        total_row_height = 0
-        for row in range(row_count):
-            total_row_height += table.rowHeight(row)
-        
-        total_height = header_height + total_row_height + 2  # +2 for border
-        table.setMinimumHeight(total_height)
-        # ✅ 移除最大高度限制，让表格自动扩展
-
@@ -4,6 +4,8 @@
 登录界面
 """
 
+import logging
+
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit,
     QPushButton, QMessageBox, QFrame, QSpacerItem, QSizePolicy, QCheckBox
@@ -13,6 +15,9 @@ from PyQt6.QtGui import QFont
 
 from services.auth_service import AuthService
 from services.config_service import ConfigService
+from services.logging_config import LazyJson
+
+logger = logging.getLogger(__name__)
 
 
 class LoginThread(QThread):
@@ -30,9 +35,7 @@ class LoginThread(QThread):
     
     def run(self):
         """执行登录"""
-        print("\n" + "="*60)
-        print("【登录线程】开始执行")
-        print("="*60 + "\n")
+        logger.debug("【登录线程】开始执行")
         
         try:
             user_info = self.auth_service.login(
@@ -40,11 +43,10 @@ class LoginThread(QThread):
                 self.password,
                 self.api_base_url
             )
-            print("\n✅ 登录线程成功，发送成功信号\n")
+            logger.debug("✅ 登录线程成功，发送成功信号")
             self.login_success.emit(user_info)
         except Exception as e:
-            print(f"\n❌ 登录线程失败: {str(e)}")
-            print(f"异常类型: {type(e).__name__}\n")
+            logger.debug("❌ 登录线程失败: %s: %s", type(e).__name__, e)
             self.login_failed.emit(str(e))
 
 
@@ -248,28 +250,23 @@ class LoginWidget(QWidget):
         username = self.username_input.text().strip()
         password = self.password_input.text().strip()
         
-        print("\n" + "="*60)
-        print("【UI层】登录按钮点击")
-        print(f"服务器: {server}")
-        print(f"用户名: {username}")
-        print(f"密码长度: {len(password)}")
-        print("="*60 + "\n")
+        logger.debug("【UI层】登录按钮点击（服务器: %s，用户名: %s）", server, username)
         
         # 验证输入
         if not server:
-            print("⚠️  服务器地址为空\n")
+            logger.debug("⚠️  服务器地址为空")
             self._show_warning("输入错误", "请输入服务器地址")
             self.server_input.setFocus()
             return
         
         if not username:
-            print("⚠️  用户名/手机号为空\n")
+            logger.debug("⚠️  用户名/手机号为空")
             self._show_warning("输入错误", "请输入用户名或手机号")
             self.username_input.setFocus()
             return
         
         if not password:
-            print("⚠️  密码为空\n")
+            logger.debug("⚠️  密码为空")
             self._show_warning("输入错误", "请输入密码")
             self.password_input.setFocus()
             return
@@ -278,7 +275,7 @@ class LoginWidget(QWidget):
         self.login_button.setEnabled(False)
         self.login_button.setText("登录中...")
         
-        print("🚀 开始登录流程...\n")
+        logger.info("🚀 开始登录流程...")
         
         # 创建并启动登录线程
         self.login_thread = LoginThread(username, password, server)
@@ -289,10 +286,7 @@ class LoginWidget(QWidget):
     
     def on_login_success(self, user_info: dict):
         """登录成功处理"""
-        print("\n" + "="*60)
-        print("【UI层】登录成功")
-        print(f"用户信息: {user_info}")
-        print("="*60 + "\n")
+        logger.debug("【UI层】登录成功，用户信息: %s", LazyJson(user_info))
         
         # 保存登录信息
         server = self.server_input.text().strip()
@@ -315,16 +309,13 @@ class LoginWidget(QWidget):
         
         # ✅ 新增：保存用户信息到本地缓存
         self.config_service.save_user_info(user_info)
-        print("✅ 用户信息已缓存到本地")
+        logger.debug("✅ 用户信息已缓存到本地")
         
         self.login_success.emit(user_info)
     
     def on_login_failed(self, error_message: str):
         """登录失败处理"""
-        print("\n" + "="*60)
-        print("【UI层】登录失败")
-        print(f"后端返回错误: {error_message}")
-        print("="*60 + "\n")
+        logger.warning("【UI层】登录失败: %s", error_message)
         
         # 创建错误对话框，直接显示后端返回的错误消息
         msg_box = QMessageBox(self)
@@ -371,7 +362,7 @@ class LoginWidget(QWidget):
     
     def on_login_finished(self):
         """登录完成处理"""
-        print("🔄 登录流程结束，恢复按钮状态\n")
+        logger.debug("🔄 登录流程结束，恢复按钮状态")
         self.login_button.setEnabled(True)
         self.login_button.setText("登录")
     
@@ -4,6 +4,8 @@
 主窗口
 """
 
+import logging
+
 from PyQt6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QStackedWidget,
     QMessageBox, QApplication
@@ -18,6 +20,8 @@ from services.config_service import ConfigService
 from services.project_service import ProjectService
 from services.app_state import AppState
 
+logger = logging.getLogger(__name__)
+
 
 class MainWindow(QMainWindow):
     """主窗口类"""
@@ -75,12 +79,8 @@ class MainWindow(QMainWindow):
     
     def on_login_success(self, user_info: dict):
         """登录成功处理"""
-        print("\n" + "="*60)
-        print("【主窗口】登录成功，切换到上传界面")
-        print(f"用户ID: {user_info.get('id')}")
-        print(f"用户名: {user_info.get('username')}")
-        print(f"姓名: {user_info.get('name')}")
-        print("="*60 + "\n")
+        logger.info("【主窗口】登录成功，切换到上传界面（用户: %s，ID: %s）",
+                    user_info.get('username'), user_info.get('id'))
         
         self.user_info = user_info
         
@@ -91,7 +91,7 @@ class MainWindow(QMainWindow):
         self.upload_widget.set_user_info(user_info, self.project_info)
         self.stacked_widget.setCurrentWidget(self.upload_widget)
         
-        print("✅ 界面切换完成\n")
+        logger.debug("✅ 界面切换完成")
     
     def on_logout(self):
         """退出登录处理"""
@@ -151,18 +151,14 @@ class MainWindow(QMainWindow):
         refresh_token = self.config_service.get_refresh_token()
         
         if not token:
-            print("📌 没有保存的Token，显示登录界面")
+            logger.info("📌 没有保存的Token，显示登录界面")
             return
         
         # 获取保存的登录信息
         login_info = self.config_service.get_login_info()
         api_base_url = login_info.get('server_url', 'http://42.192.76.234:8081')
         
-        print("\n" + "="*60)
-        print("【主窗口】尝试自动登录")
-        print(f"Token: {token[:30] if token else 'None'}...")
-        print(f"API URL: {api_base_url}")
-        print("="*60 + "\n")
+        logger.info("【主窗口】尝试自动登录: %s", api_base_url)
         
         # 设置认证服务的Token
         self.auth_service.set_token(token, api_base_url, refresh_token)
@@ -170,9 +166,8 @@ class MainWindow(QMainWindow):
         # ✅ 首先尝试从本地缓存获取用户信息
         cached_user_info = self.config_service.get_user_info()
         if cached_user_info:
-            print("✅ 从本地缓存获取用户信息")
-            print(f"缓存用户ID: {cached_user_info.get('id')}")
-            print(f"缓存用户名: {cached_user_info.get('username')}")
+            logger.debug("✅ 从本地缓存获取用户信息（用户: %s，ID: %s）",
+                         cached_user_info.get('username'), cached_user_info.get('id'))
         
         # 尝试获取项目信息（验证Token是否有效）
         try:
@@ -183,7 +178,7 @@ class MainWindow(QMainWindow):
             if cached_user_info:
                 # 优先使用本地缓存的完整用户信息
                 self.user_info = cached_user_info
-                print("✅ 使用缓存的用户信息\n")
+                logger.debug("✅ 使用缓存的用户信息")
             else:
                 # 如果没有缓存，使用简化版用户信息
                 username = login_info.get('username', '用户')
@@ -192,17 +187,16 @@ class MainWindow(QMainWindow):
                     'token': token,
                     'refreshToken': refresh_token
                 }
-                print("✅ 使用简化版用户信息\n")
+                logger.debug("✅ 使用简化版用户信息")
             
-            print("✅ 自动登录成功，跳转到上传界面\n")
+            logger.info("✅ 自动登录成功，跳转到上传界面")
             
             # 直接跳转到上传界面
             self.upload_widget.set_user_info(self.user_info, self.project_info)
             self.stacked_widget.setCurrentWidget(self.upload_widget)
             
         except Exception as e:
-            print(f"❌ 自动登录失败: {e}")
-            print("尝试刷新Token...\n")
+            logger.warning("❌ 自动登录失败: %s，尝试刷新Token...", e)
             
             # 如果有刷新Token，尝试刷新
             if refresh_token:
@@ -219,7 +213,7 @@ class MainWindow(QMainWindow):
                     # ✅ 同时更新缓存的用户信息
                     self.config_service.save_user_info(user_info)
                     
-                    print("✅ Token刷新成功\n")
+                    logger.info("✅ Token刷新成功")
                     
                     # 重新获取项目信息
                     self.fetch_project_info()
@@ -229,12 +223,11 @@ class MainWindow(QMainWindow):
                     self.stacked_widget.setCurrentWidget(self.upload_widget)
                     
                 except Exception as refresh_error:
-                    print(f"❌ Token刷新失败: {refresh_error}")
-                    print("清除Token，显示登录界面\n")
+                    logger.warning("❌ Token刷新失败: %s，清除Token，显示登录界面", refresh_error)
                     self.config_service.clear_token()
                     self.config_service.clear_user_info()  # ✅ 同时清除用户信息缓存
             else:
-                print("没有刷新Token，清除Token，显示登录界面\n")
+                logger.info("没有刷新Token，清除Token，显示登录界面")
                 self.config_service.clear_token()
                 self.config_service.clear_user_info()  # ✅ 同时清除用户信息缓存
     
@@ -242,7 +235,7 @@ class MainWindow(QMainWindow):
         """获取项目信息"""
         try:
             if not self.auth_service.get_token():
-                print("⚠️  没有Token，无法获取项目信息")
+                logger.warning("⚠️  没有Token，无法获取项目信息")
                 return
             
             api_base_url = self.auth_service.get_api_base_url()
@@ -254,9 +247,9 @@ class MainWindow(QMainWindow):
             # 保存到全局状态
             self.app_state.set_project_info(self.project_info)
             
-            print("✅ 项目信息获取成功\n")
+            logger.debug("✅ 项目信息获取成功")
             
         except Exception as e:
-            print(f"❌ 获取项目信息失败: {e}\n")
+            logger.error("❌ 获取项目信息失败: %s", e)
             self.project_info = None
 
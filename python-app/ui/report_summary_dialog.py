@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+日报汇总对话框
+展示所有解析出的日报的汇总统计（工种工时、机械台班、进度滞后、未关闭问题），可导出
+"""
+
+import logging
+
+from PyQt6.QtWidgets import (
+    QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QTabWidget,
+    QTableWidget, QTableWidgetItem, QHeaderView, QAbstractItemView, QFileDialog, QMessageBox
+)
+from PyQt6.QtGui import QFont
+
+from services.report_summary import EXPORT_SHEETS, export_summary
+
+logger = logging.getLogger(__name__)
+
+
+def summary_text(summary: dict) -> str:
+    """
+    汇总结果的一行摘要（预览面板中显示）
+
+    :param summary: summarize_reports 的返回值
+    :return: 摘要文本
+    """
+    return (
+        f"📊 共 {summary['reportCount']} 天  ·  总工时 {summary['totalManHours']} 小时  ·  "
+        f"机械台班 {summary['totalMachineShifts']}  ·  进度滞后 {summary['delayedDays']} 天  ·  "
+        f"未关闭问题 {summary['openProblemCount']} 条"
+    )
+
+
+class ReportSummaryDialog(QDialog):
+    """日报汇总对话框"""
+
+    def __init__(self, summary: dict, parent=None):
+        super().__init__(parent)
+        self.summary = summary
+        self.setup_ui()
+
+    def setup_ui(self):
+        """初始化UI"""
+        self.setWindowTitle("日报汇总统计")
+        self.setMinimumSize(800, 600)
+
+        layout = QVBoxLayout(self)
+        layout.setSpacing(15)
+        layout.setContentsMargins(20, 20, 20, 20)
+
+        # 标题
+        title_label = QLabel("📊 日报汇总统计")
+        title_font = QFont()
+        title_font.setPointSize(16)
+        title_font.setBold(True)
+        title_label.setFont(title_font)
+        title_label.setStyleSheet("color: #2196F3;")
+        layout.addWidget(title_label)
+
+        date_range = self.summary['dateRange']
+        range_text = f"{date_range[0]} ~ {date_range[1]}" if date_range else '-'
+        overview_label = QLabel(
+            f"📅 日期范围: {range_text}\n{summary_text(self.summary)}\n"
+            f"📋 实际进度落后于计划的任务（累计）: {self.summary['delayedTaskCount']} 项"
+        )
+        overview_label.setStyleSheet("color: #333333; font-size: 13px; padding: 5px;")
+        layout.addWidget(overview_label)
+
+        # 每类汇总一个选项卡（列与导出的Excel工作表一致）
+        tab_widget = QTabWidget()
+        for title, key, columns in EXPORT_SHEETS:
+            tab_widget.addTab(self._create_table(self.summary[key], columns), f"{title}（{len(self.summary[key])}）")
+        layout.addWidget(tab_widget)
+
+        # 导出和关闭按钮
+        button_layout = QHBoxLayout()
+        button_layout.addStretch()
+
+        export_button = QPushButton("📤 导出")
+        export_button.setMinimumSize(100, 40)
+        export_button.clicked.connect(self.export)
+        export_button.setStyleSheet("""
+            QPushButton {
+                background-color: #4CAF50;
+                color: white;
+                border: none;
+                border-radius: 5px;
+                font-size: 14px;
+                font-weight: bold;
+            }
+            QPushButton:hover {
+                background-color: #388E3C;
+            }
+        """)
+        button_layout.addWidget(export_button)
+
+        close_button = QPushButton("关闭")
+        close_button.setMinimumSize(100, 40)
+        close_button.clicked.connect(self.accept)
+        close_button.setStyleSheet("""
+            QPushButton {
+                background-color: #757575;
+                color: white;
+                border: none;
+                border-radius: 5px;
+                font-size: 14px;
+                font-weight: bold;
+            }
+            QPushButton:hover {
+                background-color: #616161;
+            }
+        """)
+        button_layout.addWidget(close_button)
+
+        layout.addLayout(button_layout)
+
+    def _create_table(self, items: list, columns: tuple) -> QTableWidget:
+        """创建汇总表格（汇总结果按分类聚合，行数少，直接使用 QTableWidget）"""
+        table = QTableWidget(len(items), len(columns))
+        table.setHorizontalHeaderLabels([header for header, _ in columns])
+        for row, item in enumerate(items):
+            for column, (_, field) in enumerate(columns):
+                table.setItem(row, column, QTableWidgetItem(str(item[field])))
+
+        table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        table.verticalHeader().setVisible(False)
+        table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
+        return table
+
+    def export(self):
+        """导出汇总结果"""
+        output_path, _ = QFileDialog.getSaveFileName(
+            self,
+            "导出汇总",
+            "日报汇总.xlsx",
+            "Excel文件 (*.xlsx);;JSON文件 (*.json)"
+        )
+        if not output_path:
+            return
+
+        try:
+            export_summary(self.summary, output_path)
+        except Exception as e:
+            logger.error("❌ 导出汇总失败: %s", e)
+            QMessageBox.critical(self, "错误", f"导出失败：{e}")
+            return
+
+        logger.info("✅ 汇总已导出: %s", output_path)
+        QMessageBox.information(self, "导出成功", f"汇总已导出到：\n{output_path}")
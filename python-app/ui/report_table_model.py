@@ -0,0 +1,430 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+日报预览表格模型
+基于 QAbstractTableModel 按需提供单元格数据（只绘制可见行，不为每个单元格创建对象），
+勾选状态保存在位图中，勾选数量随勾选变化增减，行数较多时显示和勾选都不随行数变慢；
+批量勾选（全选、反选、按条件勾选）一次替换整个位图，只发出一次变化通知；
+ReportFilterProxyModel 按搜索索引筛选显示的行，新增的日报在显示前增量加入索引
+"""
+
+from typing import Callable, Dict, Iterable, List, Optional
+
+from PyQt6.QtCore import QAbstractTableModel, QModelIndex, QSortFilterProxyModel, Qt, pyqtSignal
+from PyQt6.QtGui import QColor, QFont
+
+from report_model import DailyReport
+from services.report_search_index import ReportSearchIndex
+from services.upload_index import (
+    REPORT_MODIFIED, REPORT_NEW, REPORT_UNCHANGED, classify_report, normalize_report_date
+)
+
+# 表头
+HEADERS = ("✓", "日期", "项目名称", "进度状态", "任务数", "人员数", "机械数", "问题数", "天气")
+
+# 列号
+COLUMN_CHECK = 0
+COLUMN_DATE = 1
+COLUMN_REPORTER = 2
+COLUMN_PROGRESS = 3
+COLUMN_PROBLEMS = 7
+
+# 进度状态映射
+PROGRESS_TEXT = {
+    'normal': '正常',
+    'delayed': '滞后',
+    'ahead': '超前'
+}
+
+# 进度状态颜色
+PROGRESS_COLORS = {
+    'normal': QColor(76, 175, 80),    # 绿色
+    'delayed': QColor(244, 67, 54),   # 红色
+    'ahead': QColor(33, 150, 243)     # 蓝色
+}
+
+# 日期列按上传状态显示的后缀、颜色和提示
+STATUS_SUFFIX = {REPORT_UNCHANGED: '（已上传）', REPORT_MODIFIED: '（已修改）'}
+STATUS_COLORS = {REPORT_UNCHANGED: QColor(158, 158, 158), REPORT_MODIFIED: QColor(255, 152, 0)}
+STATUS_TOOLTIPS = {
+    REPORT_UNCHANGED: "该日期的日报已上传过且内容未变化，不勾选覆盖时上传会被跳过",
+    REPORT_MODIFIED: "该日期的日报上传后内容有变化，上传时将自动覆盖服务器上的记录"
+}
+
+PROBLEM_COLOR = QColor(244, 67, 54)
+
+# 按字节取反（反选时整块处理位图）
+_INVERT_TABLE = bytes(255 - value for value in range(256))
+
+
+class ReportTableModel(QAbstractTableModel):
+    """日报预览表格模型"""
+
+    checked_count_changed = pyqtSignal(int)  # 勾选数量变化信号（勾选数量）
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._reports: List[DailyReport] = []
+        self._statuses: List[str] = []  # 各行相对已上传记录的状态（添加时计算一次）
+        self._checked = bytearray()  # 勾选位图，第 row 行对应第 row >> 3 字节的第 row & 7 位
+        self._checked_count = 0
+        self._uploaded_fingerprints: Dict[str, Optional[str]] = {}
+        self._bold_font = QFont("Arial", 10, QFont.Weight.Bold)
+
+    # ---------- QAbstractTableModel ----------
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._reports)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(HEADERS)
+
+    def headerData(self, section: int, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+    def flags(self, index: QModelIndex):
+        flags = Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+        if index.column() == COLUMN_CHECK:
+            flags |= Qt.ItemFlag.ItemIsUserCheckable
+        return flags
+
+    def data(self, index: QModelIndex, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        row, column = index.row(), index.column()
+        report = self._reports[row]
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._display_text(report, self._statuses[row], column)
+        if role == Qt.ItemDataRole.CheckStateRole and column == COLUMN_CHECK:
+            return Qt.CheckState.Checked if self.is_checked(row) else Qt.CheckState.Unchecked
+        if role == Qt.ItemDataRole.ForegroundRole:
+            if column == COLUMN_DATE:
+                return STATUS_COLORS.get(self._statuses[row])
+            if column == COLUMN_PROGRESS:
+                return PROGRESS_COLORS.get(report.overall_progress, QColor(0, 0, 0))
+            if column == COLUMN_PROBLEMS and report.problem_feedbacks:
+                return PROBLEM_COLOR
+        if role == Qt.ItemDataRole.FontRole:
+            if column == COLUMN_PROGRESS or (column == COLUMN_PROBLEMS and report.problem_feedbacks):
+                return self._bold_font
+        if role == Qt.ItemDataRole.TextAlignmentRole and column > COLUMN_PROGRESS:
+            return Qt.AlignmentFlag.AlignCenter
+        if role == Qt.ItemDataRole.ToolTipRole and column == COLUMN_DATE:
+            return STATUS_TOOLTIPS.get(self._statuses[row])
+        return None
+
+    def setData(self, index: QModelIndex, value, role=Qt.ItemDataRole.EditRole) -> bool:
+        if not index.isValid() or index.column() != COLUMN_CHECK or role != Qt.ItemDataRole.CheckStateRole:
+            return False
+        self.set_checked(index.row(), Qt.CheckState(value) == Qt.CheckState.Checked)
+        return True
+
+    @staticmethod
+    def _display_text(report: DailyReport, status: str, column: int) -> Optional[str]:
+        """单元格显示文本"""
+        if column == COLUMN_DATE:
+            return f"{report.report_date or '-'}{STATUS_SUFFIX.get(status, '')}"
+        if column == COLUMN_REPORTER:
+            return report.reporter_name or '-'
+        if column == COLUMN_PROGRESS:
+            return PROGRESS_TEXT.get(report.overall_progress, '正常')
+        if column == 4:
+            return str(len(report.task_progress_list))
+        if column == 5:
+            return str(report.on_site_personnel_count)
+        if column == 6:
+            return str(len(report.machinery_rentals))
+        if column == COLUMN_PROBLEMS:
+            return str(len(report.problem_feedbacks))
+        if column == 8:
+            return report.weather or '-'
+        return None
+
+    # ---------- 日报 ----------
+
+    def reports(self) -> List[DailyReport]:
+        """
+        获取全部日报（按显示顺序，不要直接修改）
+
+        :return: 日报列表
+        """
+        return self._reports
+
+    def report(self, row: int) -> DailyReport:
+        """
+        获取指定行的日报
+
+        :param row: 行号
+        :return: 日报
+        """
+        return self._reports[row]
+
+    def status(self, row: int) -> str:
+        """
+        获取指定行的日报相对已上传记录的状态
+
+        :param row: 行号
+        :return: REPORT_NEW / REPORT_MODIFIED / REPORT_UNCHANGED
+        """
+        return self._statuses[row]
+
+    def append_reports(self, reports: List[DailyReport]):
+        """
+        在末尾追加日报（未勾选）
+
+        :param reports: 日报列表
+        """
+        if not reports:
+            return
+        first = len(self._reports)
+        self.beginInsertRows(QModelIndex(), first, first + len(reports) - 1)
+        self._reports.extend(reports)
+        self._statuses.extend(self._classify(report) for report in reports)
+        self._checked.extend(bytes((len(self._reports) + 7) // 8 - len(self._checked)))
+        self.endInsertRows()
+
+    def clear(self):
+        """清空日报和勾选状态"""
+        self.beginResetModel()
+        self._reports = []
+        self._statuses = []
+        self._checked = bytearray()
+        self.endResetModel()
+        self._set_checked_count(0)
+
+    def set_uploaded_fingerprints(self, fingerprints: Dict[str, Optional[str]]):
+        """
+        设置当前项目已上传过的日报（{日期: 内容指纹}），重新计算各行状态
+
+        :param fingerprints: UploadedReportIndex.get_fingerprints 的返回值
+        """
+        self._uploaded_fingerprints = fingerprints or {}
+        self._statuses = [self._classify(report) for report in self._reports]
+        if self._reports:
+            self.dataChanged.emit(self.index(0, COLUMN_DATE), self.index(len(self._reports) - 1, COLUMN_DATE))
+
+    def _classify(self, report: DailyReport) -> str:
+        """日报相对已上传记录的状态"""
+        if not self._uploaded_fingerprints:
+            return REPORT_NEW
+        return classify_report(report, self._uploaded_fingerprints)
+
+    # ---------- 勾选 ----------
+
+    def is_checked(self, row: int) -> bool:
+        """
+        指定行是否勾选
+
+        :param row: 行号
+        :return: 是否勾选
+        """
+        return bool(self._checked[row >> 3] & (1 << (row & 7)))
+
+    def set_checked(self, row: int, checked: bool):
+        """
+        设置指定行的勾选状态
+
+        :param row: 行号
+        :param checked: 是否勾选
+        """
+        if self.is_checked(row) == checked:
+            return
+        mask = 1 << (row & 7)
+        if checked:
+            self._checked[row >> 3] |= mask
+        else:
+            self._checked[row >> 3] &= ~mask
+        index = self.index(row, COLUMN_CHECK)
+        self.dataChanged.emit(index, index, [Qt.ItemDataRole.CheckStateRole])
+        self._set_checked_count(self._checked_count + (1 if checked else -1))
+
+    def checked_count(self) -> int:
+        """
+        勾选的日报数量
+
+        :return: 数量
+        """
+        return self._checked_count
+
+    def checked_rows(self) -> List[int]:
+        """
+        勾选的行号（升序）
+
+        :return: 行号列表
+        """
+        rows = []
+        for byte_index, byte in enumerate(self._checked):
+            if byte:
+                base = byte_index << 3
+                rows.extend(base + bit for bit in range(8) if byte & (1 << bit))
+        return rows
+
+    def checked_reports(self) -> List[DailyReport]:
+        """
+        勾选的日报（按显示顺序）
+
+        :return: 日报列表
+        """
+        return [self._reports[row] for row in self.checked_rows()]
+
+    # ---------- 批量勾选（一次替换位图，只发出一次通知） ----------
+
+    def set_all_checked(self, checked: bool):
+        """
+        勾选或取消勾选全部日报
+
+        :param checked: 是否勾选
+        """
+        row_count = len(self._reports)
+        bits = bytearray(b'\xff' * len(self._checked) if checked else len(self._checked))
+        self._replace_checked(self._mask_tail(bits, row_count))
+
+    def invert_checked(self):
+        """反选：已勾选的取消勾选，未勾选的勾选"""
+        self._replace_checked(self._mask_tail(bytearray(self._checked.translate(_INVERT_TABLE)),
+                                              len(self._reports)))
+
+    def check_matching(self, predicate: Callable[[DailyReport, str], bool]):
+        """
+        只勾选满足条件的日报（其余取消勾选）
+
+        :param predicate: 判断函数，参数为 (日报, 上传状态)
+        """
+        bits = bytearray(len(self._checked))
+        for row, (report, status) in enumerate(zip(self._reports, self._statuses)):
+            if predicate(report, status):
+                bits[row >> 3] |= 1 << (row & 7)
+        self._replace_checked(bits)
+
+    def check_rows(self, rows: Iterable[int]):
+        """
+        只勾选指定的行（其他行取消勾选）
+
+        :param rows: 行号
+        """
+        bits = bytearray(len(self._checked))
+        for row in rows:
+            bits[row >> 3] |= 1 << (row & 7)
+        self._replace_checked(bits)
+
+    def check_statuses(self, statuses: Iterable[str]):
+        """
+        只勾选指定上传状态的日报（如 REPORT_NEW：未上传过的日报）
+
+        :param statuses: 上传状态（REPORT_NEW / REPORT_MODIFIED / REPORT_UNCHANGED）
+        """
+        statuses = set(statuses)
+        self.check_matching(lambda report, status: status in statuses)
+
+    def check_progress(self, progresses: Iterable[str]):
+        """
+        只勾选指定进度状态的日报
+
+        :param progresses: 进度状态（normal / delayed / ahead）
+        """
+        progresses = set(progresses)
+        self.check_matching(lambda report, status: report.overall_progress in progresses)
+
+    def check_date_range(self, start: str, end: str):
+        """
+        只勾选日期在范围内的日报（包含两端，无法识别日期的日报不勾选）
+
+        :param start: 开始日期（YYYY-MM-DD）
+        :param end: 结束日期（YYYY-MM-DD）
+        """
+        def in_range(report: DailyReport, status: str) -> bool:
+            date = normalize_report_date(report.report_date)
+            return len(date) == 10 and start <= date <= end
+
+        self.check_matching(in_range)
+
+    def date_range(self) -> Optional[tuple]:
+        """
+        日报的日期范围（只统计可识别的日期）
+
+        :return: (最早日期, 最晚日期)（YYYY-MM-DD），没有可识别的日期时返回None
+        """
+        dates = [date for date in (normalize_report_date(report.report_date) for report in self._reports)
+                 if len(date) == 10]
+        return (min(dates), max(dates)) if dates else None
+
+    @staticmethod
+    def _mask_tail(bits: bytearray, row_count: int) -> bytearray:
+        """清除最后一个字节中超出行数的位"""
+        if row_count & 7:
+            bits[-1] &= (1 << (row_count & 7)) - 1
+        return bits
+
+    def _replace_checked(self, bits: bytearray):
+        """替换整个勾选位图，发出一次勾选列变化通知和一次勾选数量变化信号"""
+        self._checked = bits
+        if self._reports:
+            self.dataChanged.emit(self.index(0, COLUMN_CHECK), self.index(len(self._reports) - 1, COLUMN_CHECK),
+                                  [Qt.ItemDataRole.CheckStateRole])
+        self._set_checked_count(bin(int.from_bytes(bits, 'little')).count('1'))
+
+    def _set_checked_count(self, count: int):
+        """更新勾选数量，有变化时发出信号"""
+        if count != self._checked_count:
+            self._checked_count = count
+            self.checked_count_changed.emit(count)
+
+
+class ReportFilterProxyModel(QSortFilterProxyModel):
+    """按搜索条件筛选日报预览表格的行（条件语法见 services.report_search_index）"""
+
+    def __init__(self, source_model: ReportTableModel, parent=None):
+        super().__init__(parent)
+        self._index = ReportSearchIndex()
+        self._query = ''
+        self._matched_rows: Optional[set] = None  # 匹配的行号，None表示不筛选
+        self.setSourceModel(source_model)
+        # 在代理自身处理完插入之后连接：新增的日报随解析逐批加入索引，搜索时不再集中建索引
+        source_model.rowsInserted.connect(self._index_new_rows)
+        source_model.modelAboutToBeReset.connect(self._index.clear)
+
+    def filterAcceptsRow(self, source_row: int, source_parent: QModelIndex) -> bool:
+        if self._matched_rows is None:
+            return True
+        if source_row >= self._index.row_count:
+            # 筛选期间新增的日报：索引新增的行后重新搜索（已有行的结果不变，无需重新筛选）
+            self._sync_index()
+        return source_row in self._matched_rows
+
+    def set_query(self, query: str):
+        """
+        设置搜索条件并重新筛选
+
+        :param query: 查询字符串，为空时显示全部
+        """
+        self._query = query
+        self._sync_index()
+        self.invalidateFilter()
+
+    def query(self) -> str:
+        """当前搜索条件"""
+        return self._query
+
+    def is_filtering(self) -> bool:
+        """是否正在筛选（搜索条件不为空）"""
+        return self._matched_rows is not None
+
+    def source_rows(self) -> List[int]:
+        """
+        显示的行对应的原表格行号（按显示顺序）
+
+        :return: 行号列表
+        """
+        return [self.mapToSource(self.index(row, 0)).row() for row in range(self.rowCount())]
+
+    def _index_new_rows(self):
+        """把尚未索引的日报加入索引"""
+        self._index.add_reports(self.sourceModel().reports()[self._index.row_count:])
+
+    def _sync_index(self):
+        """把尚未索引的日报加入索引并按当前条件重新搜索"""
+        self._index_new_rows()
+        self._matched_rows = self._index.search(self._query)
@@ -4,22 +4,46 @@
 文件上传界面
 """
 
+import logging
+
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
     QListWidget, QListWidgetItem, QMessageBox, QFrame,
-    QComboBox, QProgressBar, QGroupBox, QTableWidget, QTableWidgetItem,
-    QHeaderView, QAbstractItemView, QScrollArea, QCheckBox, QApplication
+    QComboBox, QProgressBar, QGroupBox, QTableView,
+    QHeaderView, QAbstractItemView, QScrollArea, QCheckBox, QApplication,
+    QMenu, QDialog, QDialogButtonBox, QDateEdit, QFormLayout, QLineEdit
 )
-from PyQt6.QtCore import Qt, pyqtSignal, QThread, QFileInfo
-from PyQt6.QtGui import QFont, QIcon, QColor
+from PyQt6.QtCore import Qt, pyqtSignal, QThread, QFileInfo, QDate, QTimer
+from PyQt6.QtGui import QFont, QIcon
 
+from report_model import DailyReport
 from services.upload_service import UploadService
 from services.auth_service import AuthService
 from services.config_service import ConfigService
-from services.base_service import BaseService
-from parse_daily_report_excel import DailyReportExcelParser
-from convert_to_api_format import convert_to_api_format
+from services.batch_import_service import (
+    BatchImportService, DEFAULT_BATCH_SIZE, DEFAULT_MAX_CONCURRENCY, build_import_groups
+)
+from services.report_summary import summarize_reports
+from services.upload_index import REPORT_MODIFIED, REPORT_NEW, REPORT_UNCHANGED, UploadedReportIndex
+from services.upload_journal import UploadJournal
+from services.parse_service import ParseService
+from services.logging_config import LazyJson
 from ui.daily_report_detail_dialog import DailyReportDetailDialog
+from ui.report_summary_dialog import ReportSummaryDialog, summary_text
+from ui.report_table_model import ReportFilterProxyModel, ReportTableModel
+
+logger = logging.getLogger(__name__)
+
+# 预览筛选栏的快捷条件：(显示文本, 查询条件)
+QUICK_FILTERS = (
+    ("全部日报", ""),
+    ("有问题反馈", "问题:"),
+    ("进度滞后", "进度:滞后"),
+    ("进度超前", "进度:超前")
+)
+
+# 输入搜索条件后等待的毫秒数（连续输入时只筛选一次）
+FILTER_DELAY_MS = 200
 
 
 class UploadThread(QThread):
@@ -28,95 +52,134 @@ class UploadThread(QThread):
     progress_updated = pyqtSignal(int)  # 进度更新信号
     upload_success = pyqtSignal(dict)   # 上传成功信号
     upload_failed = pyqtSignal(str)     # 上传失败信号
+    batch_uploaded = pyqtSignal(int, int)  # 批次上传完成信号（已完成日报数, 日报总数）
     
     def __init__(self, parsed_reports: list, project_id: int, reporter_id: int, 
-                 api_base_url: str, token: str, overwrite_existing: bool = False):
+                 api_base_url: str, token: str, overwrite_existing: bool = False,
+                 batch_size: int = DEFAULT_BATCH_SIZE,
+                 max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+                 resume_upload_id: str = None, modified_reports: list = None):
         super().__init__()
         self.parsed_reports = parsed_reports
+        self.modified_reports = modified_reports or []  # 已上传过、内容有变化的日报（覆盖上传）
         self.project_id = project_id
         self.reporter_id = reporter_id
         self.api_base_url = api_base_url
         self.token = token
         self.overwrite_existing = overwrite_existing
+        self.batch_size = batch_size
+        self.max_concurrency = max_concurrency
+        self.resume_upload_id = resume_upload_id  # 继续上传日志中未完成的上传
+    
+    def on_batch_done(self, done: int, total: int):
+        """批次完成回调（在上传线程中调用），10%~100%按已完成日报数计算"""
+        self.batch_uploaded.emit(done, total)
+        self.progress_updated.emit(10 + int(90 * done / total) if total else 100)
     
     def run(self):
         """执行上传"""
-        import json
-        
+        journal = None
         try:
             # 发送进度
-            self.progress_updated.emit(10)
+            self.progress_updated.emit(5)
             
-            # 转换为API格式
-            api_data = convert_to_api_format(
-                self.parsed_reports, 
-                self.project_id, 
-                self.reporter_id,
-                self.overwrite_existing
+            # 分批并发调用批量导入API（自动添加token），每完成一批更新一次进度，
+            # 各批状态记录在上传日志中，中断后可继续上传
+            journal = UploadJournal()
+            import_service = BatchImportService(
+                self.api_base_url,
+                self.token,
+                batch_size=self.batch_size,
+                max_concurrency=self.max_concurrency,
+                journal=journal,
+                uploaded_index=UploadedReportIndex()
             )
             
-            # 输出请求体到控制台
-            print("\n" + "="*80)
-            print("📤 发送上传请求 - API请求体")
-            print("="*80)
-            print(json.dumps(api_data, indent=2, ensure_ascii=False))
-            print("="*80 + "\n")
-            
-            self.progress_updated.emit(30)
-            
-            # 创建基础服务实例，自动添加token
-            base_service = BaseService(self.api_base_url, self.token)
-            
-            self.progress_updated.emit(50)
-            
-            # 调用批量导入API，使用基础服务的POST方法（自动添加token）
-            response = base_service.post(
-                '/api/v1/daily-reports/batch-import',
-                json_data=api_data,
-                include_token=True,
-                timeout=60
-            )
-            
-            self.progress_updated.emit(80)
-            
-            # 输出原始响应到控制台
-            print("\n" + "="*80)
-            print("📥 收到服务器响应 - 原始响应数据")
-            print("="*80)
-            response_text = response.text if hasattr(response, 'text') else str(response)
-            try:
-                response_json = json.loads(response_text)
-                print(json.dumps(response_json, indent=2, ensure_ascii=False))
-            except:
-                print(response_text)
-            print("="*80 + "\n")
-            
-            # 使用基础服务解析响应
-            data = base_service.parse_response(response, expected_code=1)
-            
-            # 返回导入结果
-            upload_result = {
-                'totalCount': data.get('totalCount', 0),
-                'successCount': data.get('successCount', 0),
-                'failedCount': data.get('failedCount', 0),
-                'skippedCount': data.get('skippedCount', 0),
-                'successReports': data.get('successReports', []),
-                'failedReports': data.get('failedReports', [])
-            }
+            if self.resume_upload_id:
+                self.progress_updated.emit(10)
+                upload_result = import_service.resume_upload(self.resume_upload_id, self.on_batch_done)
+            else:
+                # 转换为API格式（已修改的日报单独一组覆盖上传）
+                import_groups = build_import_groups(
+                    self.parsed_reports, 
+                    self.project_id, 
+                    self.reporter_id,
+                    self.overwrite_existing,
+                    self.modified_reports
+                )
+                
+                # 请求体只在DEBUG级别输出（截断到固定长度）
+                if logger.isEnabledFor(logging.DEBUG):
+                    for api_data, _ in import_groups:
+                        logger.debug("📤 发送上传请求 - API请求体: %s", LazyJson(api_data, indent=2))
+                
+                self.progress_updated.emit(10)
+                upload_result = import_service.import_groups(import_groups, self.on_batch_done)
             
             self.progress_updated.emit(100)
             self.upload_success.emit(upload_result)
             
         except Exception as e:
-            import traceback
-            # 输出详细的错误堆栈信息
-            error_detail = traceback.format_exc()
-            print("\n" + "="*80)
-            print("❌ 上传错误 - 异常堆栈")
-            print("="*80)
-            print(error_detail)
-            print("="*80 + "\n")
+            logger.exception("❌ 上传错误: %s", e)
             self.upload_failed.emit(str(e))
+        finally:
+            if journal:
+                journal.close()
+
+
+class ParseThread(QThread):
+    """解析线程"""
+    
+    file_started = pyqtSignal(int, int, str)  # 开始解析文件信号（文件序号, 文件总数, 文件路径）
+    sheet_parsed = pyqtSignal(int, object)    # 工作表解析完成信号（文件序号, DailyReport）
+    file_failed = pyqtSignal(str, str)        # 文件解析失败信号（文件路径, 错误信息）
+    parse_finished = pyqtSignal(bool)         # 解析结束信号（是否被取消）
+    parse_failed = pyqtSignal(str)            # 解析异常信号
+    
+    def __init__(self, file_paths: list):
+        super().__init__()
+        self.file_paths = list(file_paths)
+        self._cancelled = False
+    
+    def cancel(self):
+        """取消解析（当前工作表/任务完成后停止）"""
+        self._cancelled = True
+    
+    def is_cancelled(self) -> bool:
+        """是否已取消"""
+        return self._cancelled
+    
+    def run(self):
+        """执行解析"""
+        parts = ParseService().iter_parse(self.file_paths)
+        current_file = -1
+        
+        try:
+            for part in parts:
+                if self._cancelled:
+                    break
+                
+                # 按文件顺序产出，文件序号变化即开始解析下一个文件
+                if part['fileIndex'] != current_file:
+                    current_file = part['fileIndex']
+                    self.file_started.emit(current_file, len(self.file_paths), part['filePath'])
+                
+                if part['error']:
+                    self.file_failed.emit(part['filePath'], part['error'])
+                    continue
+                
+                for report in part['reports']:
+                    self.sheet_parsed.emit(current_file, report)
+            
+            self.parse_finished.emit(self._cancelled)
+            
+        except Exception as e:
+            logger.exception("❌ 解析错误: %s", e)
+            self.parse_failed.emit(str(e))
+        
+        finally:
+            # 关闭迭代器，取消尚未开始的解析任务
+            parts.close()
 
 
 class UploadWidget(QWidget):
@@ -129,13 +192,25 @@ class UploadWidget(QWidget):
         self.user_info = None
         self.project_info = None
         self.upload_thread = None
+        self.unfinished_upload = None  # 上传日志中最近一次未完成的上传
+        self.parse_thread = None
+        self.parse_errors = []  # 解析失败的文件（文件路径, 错误信息）
         self.selected_files = []
-        self.parsed_reports = []  # 存储解析后的日报数据
-        self.checked_reports = set()  # ✅ 存储勾选的日报索引
+        self.report_model = ReportTableModel(self)  # 解析后的日报及勾选状态
+        self.filter_model = ReportFilterProxyModel(self.report_model, self)  # 按搜索条件筛选显示的行
+        self.detail_dialog = None  # 日报详情对话框（第一次查看详情时创建，之后复用）
+        self.detail_row = -1  # 详情对话框中显示的日报所在行
+        self.report_summary = None  # 解析出的日报的汇总统计（解析结束时计算）
+        self.uploaded_fingerprints = {}  # 当前项目已上传过的日报 {日期(YYYY-MM-DD): 内容指纹}
         self.auth_service = AuthService()
         self.config_service = ConfigService()
         self.setup_ui()
     
+    @property
+    def parsed_reports(self) -> list:
+        """解析后的日报（按表格行顺序）"""
+        return self.report_model.reports()
+    
     def setup_ui(self):
         """初始化UI"""
         # 主布局
@@ -234,6 +309,14 @@ class UploadWidget(QWidget):
         self.overwrite_checkbox.setChecked(False)  # 默认不勾选
         button_layout.addWidget(self.overwrite_checkbox)
         
+        # 继续上次未完成的上传（有未完成的上传时显示）
+        self.resume_button = QPushButton("↻ 继续上次上传")
+        self.resume_button.setMinimumSize(130, 45)
+        self.resume_button.clicked.connect(self.resume_upload)
+        self.resume_button.setStyleSheet(self.get_button_style("#FF9800", "#F57C00"))
+        self.resume_button.setVisible(False)
+        button_layout.addWidget(self.resume_button)
+        
         self.upload_button = QPushButton("开始上传")
         self.upload_button.setMinimumSize(130, 45)
         self.upload_button.clicked.connect(self.start_upload)
@@ -442,14 +525,30 @@ class UploadWidget(QWidget):
         self.select_all_button.setStyleSheet(self.get_button_style("#4CAF50", "#388E3C"))
         button_layout.addWidget(self.select_all_button)
         
-        # ✅ 新增：反选按钮
-        self.deselect_all_button = QPushButton("✗ 反选")
+        # ✅ 新增：取消全选按钮
+        self.deselect_all_button = QPushButton("✗ 全不选")
         self.deselect_all_button.setMinimumSize(100, 40)
         self.deselect_all_button.clicked.connect(self.deselect_all_reports)
         self.deselect_all_button.setEnabled(False)
         self.deselect_all_button.setStyleSheet(self.get_button_style("#FF9800", "#F57C00"))
         button_layout.addWidget(self.deselect_all_button)
         
+        # 批量勾选菜单：反选、按上传状态/进度状态/日期范围勾选
+        self.select_menu_button = QPushButton("☰ 批量选择")
+        self.select_menu_button.setMinimumSize(120, 40)
+        self.select_menu_button.setEnabled(False)
+        self.select_menu_button.setStyleSheet(self.get_button_style("#607D8B", "#455A64"))
+        self.select_menu_button.setMenu(self.create_select_menu())
+        button_layout.addWidget(self.select_menu_button)
+        
+        # 汇总统计：工种工时、机械台班、进度滞后、未关闭问题
+        self.summary_button = QPushButton("📊 汇总统计")
+        self.summary_button.setMinimumSize(120, 40)
+        self.summary_button.clicked.connect(self.show_report_summary)
+        self.summary_button.setEnabled(False)
+        self.summary_button.setStyleSheet(self.get_button_style("#9C27B0", "#7B1FA2"))
+        button_layout.addWidget(self.summary_button)
+        
         self.preview_button = QPushButton("🔍 预览数据")
         self.preview_button.setMinimumSize(130, 40)
         self.preview_button.clicked.connect(self.preview_data)
@@ -459,6 +558,9 @@ class UploadWidget(QWidget):
         
         layout.addLayout(button_layout)
         
+        # 筛选栏：按人员、机械、任务、问题、日期、进度状态筛选显示的日报
+        layout.addLayout(self.create_filter_bar())
+        
         # ✅ 新增：加载动画标签
         self.loading_label = QLabel("⏳ 正在加载数据...")
         self.loading_label.setStyleSheet("""
@@ -471,25 +573,21 @@ class UploadWidget(QWidget):
         self.loading_label.setVisible(False)
         layout.addWidget(self.loading_label)
         
-        # 数据表格
-        self.data_table = QTableWidget()
+        # 数据表格（模型/视图：只绘制可见行，行数较多时也不卡顿）
+        self.data_table = QTableView()
+        self.data_table.setModel(self.filter_model)
         self.data_table.setMinimumHeight(250)
         self.data_table.setMaximumHeight(400)
-        self.data_table.setColumnCount(9)  # ✅ 增加一列用于勾选
-        self.data_table.setHorizontalHeaderLabels([
-            "✓", "日期", "项目名称", "进度状态", "任务数", "人员数", 
-            "机械数", "问题数", "天气"
-        ])
         
         # 设置表格样式
         self.data_table.setStyleSheet("""
-            QTableWidget {
+            QTableView {
                 border: 2px solid #e0e0e0;
                 border-radius: 5px;
                 background-color: white;
                 gridline-color: #e0e0e0;
             }
-            QTableWidget::item {
+            QTableView::item {
                 padding: 8px;
                 color: #000000;
             }
@@ -508,17 +606,139 @@ class UploadWidget(QWidget):
         self.data_table.horizontalHeader().setStretchLastSection(True)
         self.data_table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
         
-        # 启用自动换行
-        self.data_table.setWordWrap(True)
-        self.data_table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.ResizeToContents)
+        # 固定行高（按内容计算行高需要逐行测量所有单元格，行数多时很慢）
+        self.data_table.setWordWrap(False)
+        self.data_table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        self.data_table.verticalHeader().setDefaultSectionSize(36)
         
         # 双击事件 - 显示详情
         self.data_table.doubleClicked.connect(self.show_report_detail)
         
+        # ✅ 监听勾选数量变化（只连接一次）
+        self.report_model.checked_count_changed.connect(self.update_upload_button_text)
+        
+        # 显示的行数变化时更新筛选结果数量
+        self.filter_model.rowsInserted.connect(self.update_filter_count)
+        self.filter_model.rowsRemoved.connect(self.update_filter_count)
+        self.filter_model.modelReset.connect(self.update_filter_count)
+        
         layout.addWidget(self.data_table)
         
+        # 汇总摘要（解析结束后显示）
+        self.summary_label = QLabel()
+        self.summary_label.setStyleSheet("color: #333333; font-size: 13px; padding: 5px;")
+        self.summary_label.setVisible(False)
+        layout.addWidget(self.summary_label)
+        
+        # 预览数据清空时同时清空汇总
+        self.report_model.modelReset.connect(self.refresh_report_summary)
+        
         return group
     
+    def create_filter_bar(self) -> QHBoxLayout:
+        """创建预览筛选栏"""
+        filter_layout = QHBoxLayout()
+        
+        self.filter_combo = QComboBox()
+        for text, _ in QUICK_FILTERS:
+            self.filter_combo.addItem(text)
+        self.filter_combo.setMinimumHeight(36)
+        self.filter_combo.setStyleSheet("color: #000000; font-size: 13px;")
+        self.filter_combo.currentIndexChanged.connect(self.apply_filter)
+        filter_layout.addWidget(self.filter_combo)
+        
+        self.filter_input = QLineEdit()
+        self.filter_input.setPlaceholderText("搜索人员、机械、任务、问题、日期，如：张伟  机械:汽车吊  日期:2025-03")
+        self.filter_input.setToolTip(
+            "空格分隔多个条件，同时满足；可加前缀限定字段：人员: 机械: 任务: 问题: 日期: 进度:\n"
+            "例如 \"人员:张伟 问题:\" 查找张伟在场且有问题反馈的日报"
+        )
+        self.filter_input.setClearButtonEnabled(True)
+        self.filter_input.setMinimumHeight(36)
+        self.filter_input.setStyleSheet("""
+            QLineEdit {
+                padding: 6px;
+                border: 2px solid #ddd;
+                border-radius: 5px;
+                font-size: 13px;
+                color: #000000;
+                background-color: #ffffff;
+            }
+            QLineEdit:focus {
+                border-color: #2196F3;
+            }
+        """)
+        filter_layout.addWidget(self.filter_input, 1)
+        
+        # 连续输入时只在停顿后筛选一次
+        self.filter_timer = QTimer(self)
+        self.filter_timer.setSingleShot(True)
+        self.filter_timer.setInterval(FILTER_DELAY_MS)
+        self.filter_timer.timeout.connect(self.apply_filter)
+        self.filter_input.textChanged.connect(self.filter_timer.start)
+        
+        self.filter_count_label = QLabel()
+        self.filter_count_label.setStyleSheet("color: #666666; font-size: 13px;")
+        filter_layout.addWidget(self.filter_count_label)
+        
+        return filter_layout
+    
+    def apply_filter(self):
+        """按快捷条件和搜索框内容筛选预览表格"""
+        self.filter_timer.stop()
+        quick_query = QUICK_FILTERS[self.filter_combo.currentIndex()][1]
+        self.filter_model.set_query(f"{quick_query} {self.filter_input.text()}")
+        self.update_filter_count()
+    
+    def update_filter_count(self):
+        """显示筛选结果数量"""
+        if self.filter_model.is_filtering():
+            self.filter_count_label.setText(
+                f"显示 {self.filter_model.rowCount()} / {self.report_model.rowCount()} 条"
+            )
+        else:
+            self.filter_count_label.setText("")
+    
+    def refresh_report_summary(self):
+        """重新汇总解析出的日报并更新摘要"""
+        if self.report_model.rowCount() == 0:
+            self.report_summary = None
+        else:
+            self.report_summary = summarize_reports(self.parsed_reports)
+        
+        self.summary_button.setEnabled(self.report_summary is not None)
+        self.summary_label.setVisible(self.report_summary is not None)
+        if self.report_summary is not None:
+            self.summary_label.setText(summary_text(self.report_summary))
+    
+    def show_report_summary(self):
+        """显示汇总统计对话框"""
+        if self.report_summary is None:
+            return
+        ReportSummaryDialog(self.report_summary, self).exec()
+    
+    def create_select_menu(self) -> QMenu:
+        """创建批量勾选菜单"""
+        menu = QMenu(self)
+        menu.addAction("反选", self.report_model.invert_checked)
+        menu.addSeparator()
+        menu.addAction("未上传的日报", lambda: self.report_model.check_statuses([REPORT_NEW]))
+        menu.addAction("未上传及已修改的日报",
+                       lambda: self.report_model.check_statuses([REPORT_NEW, REPORT_MODIFIED]))
+        menu.addSeparator()
+        for progress, text in (('delayed', '滞后'), ('ahead', '超前'), ('normal', '正常')):
+            menu.addAction(f"进度{text}的日报", lambda checked=False, p=progress: self.report_model.check_progress([p]))
+        menu.addSeparator()
+        menu.addAction("按日期范围...", self.select_reports_by_date_range)
+        menu.addAction("筛选出的日报", lambda: self.report_model.check_rows(self.filter_model.source_rows()))
+        return menu
+    
+    def set_selection_enabled(self, enabled: bool):
+        """启用或禁用勾选相关按钮"""
+        self.select_all_button.setEnabled(enabled)
+        self.deselect_all_button.setEnabled(enabled)
+        self.select_menu_button.setEnabled(enabled)
+    
     def get_button_style(self, color: str, hover_color: str = None):
         """获取按钮样式"""
         if hover_color is None:
@@ -549,11 +769,8 @@ class UploadWidget(QWidget):
     
     def set_user_info(self, user_info: dict, project_info: dict = None):
         """设置用户信息和项目信息"""
-        print("\n" + "="*60)
-        print("【UI层】进入上传页面")
-        print(f"用户信息: {user_info}")
-        print(f"项目信息: {project_info}")
-        print("="*60 + "\n")
+        logger.debug("【UI层】进入上传页面，用户信息: %s，项目信息: %s",
+                     LazyJson(user_info), LazyJson(project_info))
         
         self.user_info = user_info
         self.project_info = project_info
@@ -570,17 +787,57 @@ class UploadWidget(QWidget):
         
         self.user_label.setText(display_text)
         
-        print(f"✅ 用户信息已设置: {display_text}\n")
+        logger.debug("✅ 用户信息已设置: %s", display_text)
         
         # 显示项目信息
         if project_info:
             # 只显示项目名称
             project_name = project_info.get('name', '未知项目')
             self.project_name_value.setText(project_name)
-            print(f"✅ 项目信息已设置: {project_name}\n")
+            logger.debug("✅ 项目信息已设置: %s", project_name)
         else:
             self.project_name_value.setText("未加载")
-            print("⚠️  没有项目信息\n")
+            logger.warning("⚠️  没有项目信息")
+        
+        self.refresh_resume_button()
+    
+    def get_upload_credentials(self):
+        """
+        获取上传所需的认证信息
+        
+        :return: (服务器地址, token)
+        """
+        token = self.user_info.get('token') if self.user_info else None
+        token = token or self.config_service.get_token()
+        api_base_url = self.config_service.get_login_info().get('server_url', 'http://42.192.76.234:8081')
+        return api_base_url, token
+    
+    def load_uploaded_fingerprints(self):
+        """读取当前项目已上传过的日报及内容指纹（用于在预览中标记）"""
+        self.uploaded_fingerprints = {}
+        project_id = self.project_info.get('id') if self.project_info else None
+        if project_id:
+            api_base_url, _ = self.get_upload_credentials()
+            self.uploaded_fingerprints = UploadedReportIndex().get_fingerprints(api_base_url, project_id)
+        self.report_model.set_uploaded_fingerprints(self.uploaded_fingerprints)
+    
+    def refresh_resume_button(self):
+        """根据上传日志显示或隐藏"继续上次上传"按钮"""
+        self.unfinished_upload = None
+        project_id = self.project_info.get('id') if self.project_info else None
+        if project_id:
+            api_base_url, _ = self.get_upload_credentials()
+            try:
+                self.unfinished_upload = UploadService(api_base_url).get_unfinished_upload(project_id)
+            except Exception as e:
+                logger.warning("⚠️  读取上传日志失败: %s", e)
+        
+        if self.unfinished_upload:
+            pending_count = self.unfinished_upload['pendingCount']
+            self.resume_button.setText(f"↻ 继续上次上传（剩余 {pending_count} 条）")
+            self.resume_button.setVisible(True)
+        else:
+            self.resume_button.setVisible(False)
     
     def add_files(self):
         """添加文件（一次只能添加一个，新文件替换旧文件）"""
@@ -600,9 +857,7 @@ class UploadWidget(QWidget):
             # 清空旧文件
             self.selected_files.clear()
             self.file_list.clear()
-            self.parsed_reports.clear()
-            self.checked_reports.clear()
-            self.data_table.setRowCount(0)
+            self.report_model.clear()
             
             # 添加新文件
             self.selected_files.append(file_path)
@@ -616,8 +871,7 @@ class UploadWidget(QWidget):
             # ✅ 在调用preview_data之前显示加载动画
             self.loading_label.setVisible(True)
             self.preview_button.setEnabled(False)
-            self.select_all_button.setEnabled(False)
-            self.deselect_all_button.setEnabled(False)
+            self.set_selection_enabled(False)
             
             QApplication.processEvents()  # 更新UI，显示加载动画
             
@@ -644,10 +898,8 @@ class UploadWidget(QWidget):
             
             if reply == QMessageBox.StandardButton.Yes:
                 self.selected_files.clear()
-                self.parsed_reports.clear()
-                self.checked_reports.clear()  # ✅ 清除勾选状态
+                self.report_model.clear()  # ✅ 同时清除勾选状态
                 self.file_list.clear()
-                self.data_table.setRowCount(0)
                 self.progress_bar.setValue(0)
                 self.status_label.setText("已清空文件列表")
                 self.preview_button.setEnabled(False)
@@ -655,7 +907,15 @@ class UploadWidget(QWidget):
                 self.upload_button.setText("开始上传")  # ✅ 重置按钮文本
     
     def preview_data(self):
-        """预览数据"""
+        """预览数据（在后台线程中解析，解析过程中再次点击则取消解析）"""
+        # 解析进行中：取消解析
+        if self.parse_thread and self.parse_thread.isRunning():
+            self.parse_thread.cancel()
+            self.preview_button.setEnabled(False)
+            self.preview_button.setText("正在取消...")
+            self.status_label.setText("正在取消解析...")
+            return
+        
         if not self.selected_files:
             QMessageBox.warning(self, "提示", "请先添加文件")
             # 隐藏加载动画
@@ -667,151 +927,99 @@ class UploadWidget(QWidget):
         if not self.loading_label.isVisible():
             self.loading_label.setVisible(True)
         
-        # 禁用预览按钮
-        self.preview_button.setEnabled(False)
-        self.preview_button.setText("解析中...")
-        self.select_all_button.setEnabled(False)
-        self.deselect_all_button.setEnabled(False)
+        # 解析期间预览按钮变为取消按钮，其他操作按钮禁用
+        self.preview_button.setEnabled(True)
+        self.preview_button.setText("⏹ 取消解析")
+        self.set_selection_enabled(False)
+        self.upload_button.setEnabled(False)
+        self.add_file_button.setEnabled(False)
+        self.clear_button.setEnabled(False)
         self.status_label.setText("正在解析Excel文件...")
         
-        try:
-            self.parsed_reports.clear()
-            
-            # 解析所有文件
-            for file_path in self.selected_files:
-                try:
-                    parser = DailyReportExcelParser(file_path)
-                    all_reports = parser.parse_all_sheets()
-                    self.parsed_reports.extend(all_reports)
-                except Exception as e:
-                    QMessageBox.warning(self, "解析错误", f"文件 {file_path} 解析失败：{str(e)}")
-                    continue
-            
-            if not self.parsed_reports:
-                QMessageBox.warning(self, "提示", "没有解析到有效数据")
-                return
-            
-            # 显示在表格中
-            self.display_parsed_data()
-            
-            # ✅ 启用全选/反选按钮
-            self.select_all_button.setEnabled(True)
-            self.deselect_all_button.setEnabled(True)
-            
-            # 启用上传按钮
-            self.upload_button.setEnabled(True)
-            self.status_label.setText(f"解析完成，共 {len(self.parsed_reports)} 条日报记录")
-            
-            # ✅ 解析完成后隐藏加载动画
-            self.loading_label.setVisible(False)
-            
-            QMessageBox.information(
-                self, 
-                "解析成功", 
-                f'成功解析 {len(self.parsed_reports)} 条日报记录\n请勾选要上传的记录，然后点击"开始上传"'
-            )
-            
-        except Exception as e:
-            QMessageBox.critical(self, "错误", f"解析失败：{str(e)}")
-            self.status_label.setText(f"解析失败：{str(e)}")
+        self.report_model.clear()
+        self.parse_errors = []
+        self.load_uploaded_fingerprints()
+        
+        # 在后台线程中解析，解析出的日报逐条追加到表格
+        self.parse_thread = ParseThread(self.selected_files)
+        self.parse_thread.file_started.connect(self.on_parse_file_started)
+        self.parse_thread.sheet_parsed.connect(self.on_sheet_parsed)
+        self.parse_thread.file_failed.connect(self.on_parse_file_failed)
+        self.parse_thread.parse_finished.connect(self.on_parse_finished)
+        self.parse_thread.parse_failed.connect(self.on_parse_failed)
+        self.parse_thread.start()
+    
+    def on_parse_file_started(self, file_index: int, file_count: int, file_path: str):
+        """开始解析文件"""
+        file_name = QFileInfo(file_path).fileName()
+        self.loading_label.setText(f"⏳ 正在解析文件 ({file_index + 1}/{file_count})：{file_name}")
+    
+    def on_sheet_parsed(self, file_index: int, report: DailyReport):
+        """工作表解析完成，追加到表格"""
+        self.report_model.append_reports([report])
+        self.status_label.setText(f"正在解析Excel文件... 已解析 {len(self.parsed_reports)} 个工作表")
+    
+    def on_parse_file_failed(self, file_path: str, error_message: str):
+        """文件解析失败（解析结束后统一提示）"""
+        self.parse_errors.append((file_path, error_message))
+    
+    def on_parse_finished(self, cancelled: bool):
+        """解析结束"""
+        self.restore_after_parse()
+        
+        for file_path, error_message in self.parse_errors:
+            QMessageBox.warning(self, "解析错误", f"文件 {file_path} 解析失败：{error_message}")
+        
+        if cancelled:
+            self.status_label.setText(f"已取消解析，已解析 {len(self.parsed_reports)} 条日报记录")
+            if self.parsed_reports:
+                self.set_selection_enabled(True)
+                self.refresh_report_summary()
+            self.update_upload_button_text()
+            return
         
-        finally:
-            # ✅ 确保加载动画最后被隐藏
-            self.loading_label.setVisible(False)
-            
-            # 恢复预览按钮
-            self.preview_button.setEnabled(True)
-            self.preview_button.setText("🔍 预览数据")
-    
-    def display_parsed_data(self):
-        """在表格中显示解析后的数据"""
-        self.data_table.setRowCount(len(self.parsed_reports))
-        
-        # 进度状态映射
-        progress_map = {
-            'normal': '正常',
-            'delayed': '滞后',
-            'ahead': '超前'
-        }
-        
-        # 进度状态颜色
-        progress_colors = {
-            'normal': QColor(76, 175, 80),    # 绿色
-            'delayed': QColor(244, 67, 54),   # 红色
-            'ahead': QColor(33, 150, 243)     # 蓝色
-        }
-        
-        for row, report in enumerate(self.parsed_reports):
-            # 勾选框
-            check_box = QTableWidgetItem()
-            check_box.setFlags(Qt.ItemFlag.ItemIsUserCheckable | Qt.ItemFlag.ItemIsEnabled)
-            check_box.setCheckState(Qt.CheckState.Unchecked)
-            self.data_table.setItem(row, 0, check_box)
-            
-            # 日期
-            date_item = QTableWidgetItem(report.get('reportDate', '-'))
-            self.data_table.setItem(row, 1, date_item)
-            
-            # 填报人名称（原项目名称）
-            reporter_item = QTableWidgetItem(report.get('reporterName', '-'))  # ✅ 改为 reporterName
-            self.data_table.setItem(row, 2, reporter_item)
-            
-            # 进度状态
-            progress = report.get('overallProgress', 'normal')
-            progress_text = progress_map.get(progress, '正常')
-            progress_item = QTableWidgetItem(progress_text)
-            progress_item.setForeground(progress_colors.get(progress, QColor(0, 0, 0)))
-            progress_item.setFont(QFont("Arial", 10, QFont.Weight.Bold))
-            self.data_table.setItem(row, 3, progress_item)
-            
-            # 任务数
-            task_count = len(report.get('taskProgressList', []))
-            task_item = QTableWidgetItem(str(task_count))
-            task_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.data_table.setItem(row, 4, task_item)
-            
-            # 人员数
-            worker_count = report.get('onSitePersonnelCount', 0)
-            worker_item = QTableWidgetItem(str(worker_count))
-            worker_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.data_table.setItem(row, 5, worker_item)
-            
-            # 机械数
-            machinery_count = len(report.get('machineryRentals', []))
-            machinery_item = QTableWidgetItem(str(machinery_count))
-            machinery_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.data_table.setItem(row, 6, machinery_item)
-            
-            # 问题数
-            problem_count = len(report.get('problemFeedbacks', []))
-            problem_item = QTableWidgetItem(str(problem_count))
-            problem_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            # 如果有问题，标红
-            if problem_count > 0:
-                problem_item.setForeground(QColor(244, 67, 54))
-                problem_item.setFont(QFont("Arial", 10, QFont.Weight.Bold))
-            self.data_table.setItem(row, 7, problem_item)
-            
-            # 天气
-            weather = report.get('weather', '-')
-            weather_item = QTableWidgetItem(weather)
-            weather_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.data_table.setItem(row, 8, weather_item)
+        if not self.parsed_reports:
+            QMessageBox.warning(self, "提示", "没有解析到有效数据")
+            self.status_label.setText("没有解析到有效数据")
+            return
         
-        # ✅ 新增：监听勾选状态变化
-        self.data_table.itemChanged.connect(self.update_upload_button_text)
+        # ✅ 启用全选/反选按钮
+        self.set_selection_enabled(True)
         
-        # ✅ 新增：更新按钮文本
-        self.update_upload_button_text()
+        # 汇总统计
+        self.refresh_report_summary()
+        
+        # 启用上传按钮
+        self.upload_button.setEnabled(True)
+        self.status_label.setText(f"解析完成，共 {len(self.parsed_reports)} 条日报记录")
+        
+        QMessageBox.information(
+            self, 
+            "解析成功", 
+            f'成功解析 {len(self.parsed_reports)} 条日报记录\n请勾选要上传的记录，然后点击"开始上传"'
+        )
+    
+    def on_parse_failed(self, error_message: str):
+        """解析异常"""
+        self.restore_after_parse()
+        QMessageBox.critical(self, "错误", f"解析失败：{error_message}")
+        self.status_label.setText(f"解析失败：{error_message}")
+    
+    def restore_after_parse(self):
+        """解析结束后恢复界面状态"""
+        # ✅ 隐藏加载动画
+        self.loading_label.setVisible(False)
+        self.loading_label.setText("⏳ 正在加载数据...")
+        
+        # 恢复预览按钮
+        self.preview_button.setEnabled(True)
+        self.preview_button.setText("🔍 预览数据")
+        self.add_file_button.setEnabled(True)
+        self.clear_button.setEnabled(True)
     
     def update_upload_button_text(self):
         """更新上传按钮文本，显示勾选数量"""
-        checked_count = 0
-        for row in range(self.data_table.rowCount()):
-            item = self.data_table.item(row, 0)
-            if item and item.checkState() == Qt.CheckState.Checked:
-                checked_count += 1
-        
+        checked_count = self.report_model.checked_count()
         total_count = len(self.parsed_reports)
         if checked_count == 0:
             self.upload_button.setText("开始上传")
@@ -821,18 +1029,44 @@ class UploadWidget(QWidget):
             self.upload_button.setEnabled(True)
     
     def select_all_reports(self):
-        """全选所有日报"""
-        for row in range(self.data_table.rowCount()):
-            item = self.data_table.item(row, 0)
-            if item:
-                item.setCheckState(Qt.CheckState.Checked)
+        """全选所有日报（不覆盖时跳过已上传且内容未变化的日报）"""
+        if self.overwrite_checkbox.isChecked():
+            self.report_model.set_all_checked(True)
+        else:
+            self.report_model.check_statuses([REPORT_NEW, REPORT_MODIFIED])
     
     def deselect_all_reports(self):
-        """反选所有日报"""
-        for row in range(self.data_table.rowCount()):
-            item = self.data_table.item(row, 0)
-            if item:
-                item.setCheckState(Qt.CheckState.Unchecked)
+        """取消勾选所有日报"""
+        self.report_model.set_all_checked(False)
+    
+    def select_reports_by_date_range(self):
+        """按日期范围勾选日报（包含两端）"""
+        date_range = self.report_model.date_range()
+        if not date_range:
+            QMessageBox.warning(self, "提示", "日报日期无法识别，不能按日期范围选择")
+            return
+        
+        dialog = QDialog(self)
+        dialog.setWindowTitle("按日期范围选择")
+        form = QFormLayout(dialog)
+        start_edit = QDateEdit(QDate.fromString(date_range[0], 'yyyy-MM-dd'))
+        end_edit = QDateEdit(QDate.fromString(date_range[1], 'yyyy-MM-dd'))
+        for edit in (start_edit, end_edit):
+            edit.setCalendarPopup(True)
+            edit.setDisplayFormat('yyyy-MM-dd')
+        form.addRow("开始日期:", start_edit)
+        form.addRow("结束日期:", end_edit)
+        buttons = QDialogButtonBox(QDialogButtonBox.StandardButton.Ok | QDialogButtonBox.StandardButton.Cancel)
+        buttons.button(QDialogButtonBox.StandardButton.Ok).setText("确定")
+        buttons.button(QDialogButtonBox.StandardButton.Cancel).setText("取消")
+        buttons.accepted.connect(dialog.accept)
+        buttons.rejected.connect(dialog.reject)
+        form.addRow(buttons)
+        
+        if dialog.exec() != QDialog.DialogCode.Accepted:
+            return
+        start, end = sorted((start_edit.date().toString('yyyy-MM-dd'), end_edit.date().toString('yyyy-MM-dd')))
+        self.report_model.check_date_range(start, end)
     
     def start_upload(self):
         """开始上传"""
@@ -842,17 +1076,31 @@ class UploadWidget(QWidget):
             return
         
         # ✅ 新增：收集勾选的日报
-        checked_reports = []
-        for row in range(self.data_table.rowCount()):
-            item = self.data_table.item(row, 0)
-            if item and item.checkState() == Qt.CheckState.Checked:
-                checked_reports.append(self.parsed_reports[row])
+        checked_rows = self.report_model.checked_rows()
+        checked_reports = [self.report_model.report(row) for row in checked_rows]
         
         # ✅ 检查是否有勾选
         if not checked_reports:
             QMessageBox.warning(self, "提示", "请勾选要上传的日报")
             return
         
+        # 不覆盖时增量上传：跳过已上传且内容未变化的日报，内容有变化的日报自动覆盖上传
+        skipped_count = 0
+        modified_reports = []
+        if not self.overwrite_checkbox.isChecked():
+            groups = {REPORT_NEW: [], REPORT_MODIFIED: [], REPORT_UNCHANGED: []}
+            for row in checked_rows:
+                groups[self.report_model.status(row)].append(self.report_model.report(row))
+            checked_reports = groups[REPORT_NEW]
+            modified_reports = groups[REPORT_MODIFIED]
+            skipped_count = len(groups[REPORT_UNCHANGED])
+            if not checked_reports and not modified_reports:
+                QMessageBox.information(
+                    self, "提示",
+                    f"勾选的 {skipped_count} 条日报都已上传过且内容未变化。\n如需重新上传，请勾选\"覆盖已存在的记录\""
+                )
+                return
+        
         # 使用当前项目ID
         if not self.project_info:
             QMessageBox.warning(self, "提示", "没有项目信息，请重新登录")
@@ -867,8 +1115,7 @@ class UploadWidget(QWidget):
         reporter_id = self.user_info.get('id', 1)
         
         # 获取认证信息
-        token = self.user_info.get('token') or self.config_service.get_token()
-        api_base_url = self.config_service.get_login_info().get('server_url', 'http://42.192.76.234:8081')
+        api_base_url, token = self.get_upload_credentials()
         
         if not token:
             QMessageBox.warning(self, "提示", "登录状态已失效，请重新登录")
@@ -878,7 +1125,13 @@ class UploadWidget(QWidget):
         msg_box = QMessageBox(self)
         msg_box.setIcon(QMessageBox.Icon.Question)
         msg_box.setWindowTitle("确认上传")
-        msg_box.setText(f"确定要上传选中的 {len(checked_reports)} 条日报记录吗？")
+        upload_count = len(checked_reports) + len(modified_reports)
+        confirm_text = f"确定要上传选中的 {upload_count} 条日报记录吗？"
+        if modified_reports:
+            confirm_text += f"\n（其中 {len(modified_reports)} 条内容有变化，将覆盖服务器上的记录）"
+        if skipped_count:
+            confirm_text += f"\n（已跳过 {skipped_count} 条已上传且未变化的日报）"
+        msg_box.setText(confirm_text)
         msg_box.setStandardButtons(QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No)
         msg_box.setDefaultButton(QMessageBox.StandardButton.Yes)
         
@@ -893,13 +1146,7 @@ class UploadWidget(QWidget):
         if reply != QMessageBox.StandardButton.Yes:
             return
         
-        # 禁用按钮
-        self.upload_button.setEnabled(False)
-        self.add_file_button.setEnabled(False)
-        self.clear_button.setEnabled(False)
-        self.preview_button.setEnabled(False)
-        
-        self.status_label.setText(f"正在上传 {len(checked_reports)} 条日报...")
+        self.status_label.setText(f"正在上传 {upload_count} 条日报...")
         
         # 获取是否覆盖旧记录的选项
         overwrite_existing = self.overwrite_checkbox.isChecked()
@@ -911,9 +1158,65 @@ class UploadWidget(QWidget):
             reporter_id, 
             api_base_url, 
             token,
-            overwrite_existing
+            overwrite_existing,
+            modified_reports=modified_reports
         )
+        self.start_upload_thread()
+    
+    def resume_upload(self):
+        """继续上次未完成的上传（只重传未完成的日报）"""
+        if not self.unfinished_upload:
+            return
+        
+        api_base_url, token = self.get_upload_credentials()
+        if not token:
+            QMessageBox.warning(self, "提示", "登录状态已失效，请重新登录")
+            return
+        
+        upload = self.unfinished_upload
+        msg_box = QMessageBox(self)
+        msg_box.setIcon(QMessageBox.Icon.Question)
+        msg_box.setWindowTitle("继续上传")
+        msg_box.setText(
+            f"上次上传共 {upload['reportCount']} 条日报，还有 {upload['pendingCount']} 条未完成。\n"
+            f"是否继续上传未完成的日报？"
+        )
+        resume_button = msg_box.addButton("继续上传", QMessageBox.ButtonRole.AcceptRole)
+        discard_button = msg_box.addButton("放弃", QMessageBox.ButtonRole.DestructiveRole)
+        msg_box.addButton("取消", QMessageBox.ButtonRole.RejectRole)
+        msg_box.exec()
+        
+        clicked = msg_box.clickedButton()
+        if clicked == discard_button:
+            with UploadJournal() as journal:
+                journal.discard_upload(upload['uploadId'])
+            self.refresh_resume_button()
+            return
+        if clicked != resume_button:
+            return
+        
+        self.status_label.setText(f"正在继续上传 {upload['pendingCount']} 条日报...")
+        self.upload_thread = UploadThread(
+            [],
+            upload['projectId'],
+            upload['reporterId'],
+            api_base_url,
+            token,
+            upload['overwriteExisting'],
+            resume_upload_id=upload['uploadId']
+        )
+        self.start_upload_thread()
+    
+    def start_upload_thread(self):
+        """禁用按钮并启动上传线程"""
+        self.upload_button.setEnabled(False)
+        self.resume_button.setEnabled(False)
+        self.add_file_button.setEnabled(False)
+        self.clear_button.setEnabled(False)
+        self.preview_button.setEnabled(False)
+        
         self.upload_thread.progress_updated.connect(self.on_progress_updated)
+        self.upload_thread.batch_uploaded.connect(self.on_batch_uploaded)
         self.upload_thread.upload_success.connect(self.on_upload_success)
         self.upload_thread.upload_failed.connect(self.on_upload_failed)
         self.upload_thread.finished.connect(self.on_upload_finished)
@@ -923,16 +1226,13 @@ class UploadWidget(QWidget):
         """进度更新"""
         self.progress_bar.setValue(progress)
     
+    def on_batch_uploaded(self, done: int, total: int):
+        """批次上传完成"""
+        self.status_label.setText(f"正在上传日报... 已完成 {done}/{total} 条")
+    
     def on_upload_success(self, result: dict):
         """上传成功"""
-        import json
-        
-        # 完整输出后台返回的数据到控制台
-        print("\n" + "="*80)
-        print("✅ 上传成功 - 完整的后台响应数据")
-        print("="*80)
-        print(json.dumps(result, indent=2, ensure_ascii=False))
-        print("="*80 + "\n")
+        logger.debug("✅ 上传成功 - 后台响应数据: %s", LazyJson(result, indent=2))
         
         success_count = result.get('successCount', 0)
         failed_count = result.get('failedCount', 0)
@@ -954,21 +1254,20 @@ class UploadWidget(QWidget):
         QMessageBox.information(self, "上传成功", message)
         self.status_label.setText(f"上传完成：成功 {success_count} 条，失败 {failed_count} 条")
         
+        # 继续上传的是上次的日报，不清空当前列表
+        if self.upload_thread and self.upload_thread.resume_upload_id:
+            self.progress_bar.setValue(0)
+            return
+        
         # 清空已上传的文件和数据
         self.selected_files.clear()
-        self.parsed_reports.clear()
+        self.report_model.clear()
         self.file_list.clear()
-        self.data_table.setRowCount(0)
         self.progress_bar.setValue(0)
     
     def on_upload_failed(self, error_message: str):
         """上传失败"""
-        # 完整输出错误信息到控制台
-        print("\n" + "="*80)
-        print("❌ 上传失败 - 错误信息")
-        print("="*80)
-        print(error_message)
-        print("="*80 + "\n")
+        logger.error("❌ 上传失败: %s", error_message)
         
         msg_box = QMessageBox(self)
         msg_box.setIcon(QMessageBox.Icon.Critical)
@@ -999,9 +1298,13 @@ class UploadWidget(QWidget):
     def on_upload_finished(self):
         """上传完成"""
         self.upload_button.setEnabled(True)
+        self.resume_button.setEnabled(True)
         self.add_file_button.setEnabled(True)
         self.clear_button.setEnabled(True)
         self.preview_button.setEnabled(True)
+        
+        # 本次上传中断时显示"继续上次上传"
+        self.refresh_resume_button()
     
     def has_pending_uploads(self):
         """是否有待上传的文件"""
@@ -1009,15 +1312,30 @@ class UploadWidget(QWidget):
     
     def show_report_detail(self, index):
         """显示日报详情"""
-        row = index.row()
-        
-        if row < 0 or row >= len(self.parsed_reports):
+        if not self.show_report_detail_row(index.row()):
             return
+        self.detail_dialog.exec()
+    
+    def show_report_detail_row(self, row: int) -> bool:
+        """
+        在（复用的）详情对话框中显示某一行的日报
         
-        # 获取对应的日报数据
-        report_data = self.parsed_reports[row]
+        :param row: 表格中显示的行号（筛选后）
+        :return: 行号是否有效
+        """
+        if row < 0 or row >= self.filter_model.rowCount():
+            return False
         
-        # 创建并显示详情对话框
-        dialog = DailyReportDetailDialog(report_data, self)
-        dialog.exec()
-
+        if self.detail_dialog is None:
+            self.detail_dialog = DailyReportDetailDialog(parent=self)
+            self.detail_dialog.previous_requested.connect(lambda: self.show_report_detail_row(self.detail_row - 1))
+            self.detail_dialog.next_requested.connect(lambda: self.show_report_detail_row(self.detail_row + 1))
+            self.report_model.modelReset.connect(self.detail_dialog.clear_cache)
+        
+        # 获取对应的日报数据
+        self.detail_row = row
+        source_row = self.filter_model.mapToSource(self.filter_model.index(row, 0)).row()
+        self.detail_dialog.set_report(self.report_model.report(source_row))
+        self.detail_dialog.set_navigation_enabled(row > 0, row < self.filter_model.rowCount() - 1)
+        self.data_table.selectRow(row)
+        return True
@@ -0,0 +1,360 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+日报批量上传命令行工具
+功能：无界面解析并上传目录或通配符匹配的日报Excel文件，适合定时任务（cron/计划任务）运行
+
+复用图形界面保存的登录Token（过期时自动刷新），多进程并行解析，分批并发上传，
+默认按内容指纹增量上传。运行日志输出到标准错误，结束时在标准输出打印一行JSON格式的汇总结果。
+使用 --watch 持续监视目录，文件放入共享目录后数秒内自动上传。
+
+退出码：0 全部成功；1 部分文件解析失败或部分日报上传失败；2 参数、登录或上传错误
+"""
+
+import warnings
+# 忽略urllib3的OpenSSL警告
+warnings.filterwarnings('ignore', message='urllib3 v2 only supports OpenSSL 1.1.1+')
+
+import argparse
+import glob
+import json
+import logging
+import os
+import signal
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from report_model import DailyReport
+from services.auth_service import AuthService
+from services.batch_import_service import DEFAULT_BATCH_SIZE, DEFAULT_MAX_CONCURRENCY
+from services.config_service import ConfigService
+from services.folder_watcher import DEFAULT_POLL_INTERVAL, DEFAULT_SETTLE_SECONDS, FolderWatcher
+from services.logging_config import LOG_LEVEL_ENV, setup_logging
+from services.parse_service import ParseService
+from services.project_service import ProjectService
+from services.upload_index import UploadedReportIndex, normalize_report_date
+from services.upload_service import UploadService
+
+logger = logging.getLogger(__name__)
+
+# 目录中匹配的Excel文件扩展名（与图形界面的文件选择一致）
+EXCEL_SUFFIXES = ('.xlsx', '.xls')
+
+# 命令行登录时读取密码的环境变量（避免密码出现在进程列表和crontab中）
+PASSWORD_ENV = 'MOLTEN_SALT_PASSWORD'
+
+# 退出码
+EXIT_OK = 0
+EXIT_PARTIAL = 1
+EXIT_ERROR = 2
+
+
+def is_excel_file(path: Path) -> bool:
+    """是否为要上传的Excel文件（跳过Excel打开文件时生成的临时锁文件 ~$xxx.xlsx）"""
+    return path.is_file() and path.suffix.lower() in EXCEL_SUFFIXES and not path.name.startswith('~$')
+
+
+def expand_paths(patterns: List[str], recursive: bool = False) -> List[str]:
+    """
+    展开命令行中的文件、目录和通配符，得到要上传的Excel文件列表
+
+    :param patterns: 文件路径、目录或通配符（如 "共享盘/日报/*.xlsx"）
+    :param recursive: 目录是否包含子目录中的文件
+    :return: 去重后的文件路径列表（保持参数顺序，目录内按文件名排序）
+    """
+    files = []
+    for pattern in patterns:
+        path = Path(pattern)
+        if path.is_dir():
+            candidates = path.rglob('*') if recursive else path.iterdir()
+        elif glob.has_magic(pattern):
+            candidates = (Path(match) for match in glob.glob(pattern, recursive=True))
+        else:
+            # 明确指定的文件直接交给解析（不存在或格式不对时在汇总中报告）
+            files.append(pattern)
+            continue
+        files.extend(str(candidate) for candidate in sorted(candidates) if is_excel_file(candidate))
+
+    seen = set()
+    unique_files = []
+    for file_path in files:
+        key = os.path.normcase(os.path.abspath(file_path))
+        if key not in seen:
+            seen.add(key)
+            unique_files.append(file_path)
+    return unique_files
+
+
+def authenticate(server_url: str = None, username: str = None,
+                 password: str = None) -> Tuple[str, str, Dict, Dict]:
+    """
+    获取上传所需的登录状态
+
+    指定用户名时重新登录；否则使用图形界面保存的Token，Token失效时用刷新Token换取新Token。
+    新Token会保存到配置文件，与图形界面共享。
+
+    :param server_url: 服务器地址，默认使用保存的服务器地址
+    :param username: 用户名或手机号
+    :param password: 密码，默认读取环境变量或记住的密码
+    :return: (服务器地址, Token, 用户信息, 项目信息)
+    :raises Exception: 登录失败时抛出异常
+    """
+    config_service = ConfigService()
+    login_info = config_service.get_login_info()
+    server_url = (server_url or login_info.get('server_url', 'http://42.192.76.234:8081')).rstrip('/')
+    auth_service = AuthService()
+
+    if username:
+        if not password and username == login_info.get('username'):
+            password = login_info.get('password')
+        if not password:
+            raise Exception(f'未提供密码，请通过环境变量 {PASSWORD_ENV} 指定')
+        user_info = auth_service.login(username, password, server_url)
+        config_service.save_login_info(server_url, username, password, login_info.get('remember_password', False))
+        config_service.save_user_info(user_info)
+        return server_url, user_info['token'], user_info, ProjectService(server_url, user_info['token']).get_my_project()
+
+    token = config_service.get_token()
+    if not token:
+        raise Exception('没有保存的登录Token，请先在图形界面登录，或使用 --username 登录')
+
+    user_info = config_service.get_user_info() or {}
+    try:
+        return server_url, token, user_info, ProjectService(server_url, token).get_my_project()
+    except Exception as e:
+        refresh_token = config_service.get_refresh_token()
+        if not refresh_token:
+            raise Exception(f'登录已失效，请重新登录：{e}')
+        logger.warning("⚠️  Token已失效，尝试刷新: %s", e)
+
+    auth_service.set_token(token, server_url, refresh_token)
+    refreshed = auth_service.refresh_access_token()
+    config_service.save_token(refreshed.get('token'), refreshed.get('refreshToken'), refreshed.get('expiresAt'))
+    config_service.save_user_info(refreshed)
+    return server_url, refreshed['token'], refreshed, ProjectService(server_url, refreshed['token']).get_my_project()
+
+
+def dedupe_reports(reports: List[DailyReport]) -> List[DailyReport]:
+    """
+    同一日期出现在多个文件中时只保留最后一个（后面的文件通常是更新的版本）
+
+    :param reports: 按文件顺序合并的日报列表
+    :return: 去重后的日报列表
+    """
+    by_date = {}
+    for report in reports:
+        date = normalize_report_date(report.report_date)
+        if date in by_date:
+            logger.warning("⚠️  日期 %s 在多个文件中出现，使用最后一个文件中的日报", report.report_date)
+            del by_date[date]
+        by_date[date] = report
+    return list(by_date.values())
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """构造命令行参数解析器"""
+    arg_parser = argparse.ArgumentParser(
+        prog='upload_cli.py',
+        description='无界面解析并上传日报Excel文件（日志输出到标准错误，JSON汇总输出到标准输出）',
+        epilog='示例: python upload_cli.py /mnt/share/日报 -r --summary upload_summary.json'
+    )
+    arg_parser.add_argument('paths', nargs='+', help='Excel文件、目录或通配符（通配符请加引号，支持 **）')
+    arg_parser.add_argument('-r', '--recursive', action='store_true', help='包含目录下子目录中的文件')
+    arg_parser.add_argument('--server', help='服务器地址，默认使用图形界面保存的地址')
+    arg_parser.add_argument('--username', help=f'重新登录的用户名或手机号（密码通过环境变量 {PASSWORD_ENV} 指定）')
+    arg_parser.add_argument('--project-id', type=int, help='项目ID，默认使用当前用户的项目')
+    arg_parser.add_argument('--reporter-id', type=int, help='填报人ID，默认使用当前用户ID')
+    arg_parser.add_argument('--overwrite', action='store_true', help='覆盖已存在的记录（上传全部日报）')
+    arg_parser.add_argument('--all', action='store_true',
+                            help='不按本地索引增量上传，发送全部日报（已存在的记录由服务器跳过）')
+    arg_parser.add_argument('-j', '--workers', type=int, default=None, help='并行解析的进程数，默认使用CPU核数')
+    arg_parser.add_argument('--no-cache', action='store_true', help='不使用解析缓存，强制重新解析')
+    arg_parser.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE, help='每批上传的日报数量')
+    arg_parser.add_argument('--concurrency', type=int, default=DEFAULT_MAX_CONCURRENCY, help='同时上传的批次数')
+    arg_parser.add_argument('--dry-run', action='store_true', help='只解析和比对，不上传')
+    arg_parser.add_argument('--summary', help='同时把JSON汇总结果写入该文件')
+    arg_parser.add_argument('--watch', action='store_true',
+                            help='监视模式：持续监视指定目录，新放入或修改过的工作簿写入完成后自动上传，'
+                                 '每处理完一个文件输出一行JSON记录')
+    arg_parser.add_argument('--interval', type=float, default=DEFAULT_POLL_INTERVAL, help='监视模式的扫描间隔（秒）')
+    arg_parser.add_argument('--settle', type=float, default=DEFAULT_SETTLE_SECONDS,
+                            help='监视模式下文件最后一次修改后至少等待的秒数（避免处理仍在写入的文件）')
+    arg_parser.add_argument('--log-level', choices=('DEBUG', 'INFO', 'WARNING', 'ERROR'), type=str.upper,
+                            help=f'日志级别，默认读取环境变量 {LOG_LEVEL_ENV}，未设置时为INFO')
+    arg_parser.add_argument('-v', '--verbose', action='store_true',
+                            help='输出调试日志（请求体和服务器原始响应），等同于 --log-level DEBUG')
+    return arg_parser
+
+
+def run(args: argparse.Namespace, file_paths: List[str] = None, login: bool = True) -> Tuple[int, Dict]:
+    """
+    执行一次批量上传
+
+    :param args: 命令行参数
+    :param file_paths: 要上传的文件，默认展开命令行中的路径
+    :param login: 指定了 --username 时是否重新登录（否则使用已保存的Token）
+    :return: (退出码, 汇总结果)
+    """
+    started = time.time()
+    summary = {
+        'status': 'error',
+        'server': None,
+        'projectId': None,
+        'files': [],
+        'reportCount': 0,
+        'result': None,
+        'error': None
+    }
+
+    try:
+        if file_paths is None:
+            file_paths = expand_paths(args.paths, args.recursive)
+        if not file_paths:
+            raise Exception('没有找到Excel文件')
+        logger.info("📂 共 %d 个Excel文件", len(file_paths))
+
+        server_url, token, user_info, project_info = authenticate(
+            args.server, args.username if login else None, os.environ.get(PASSWORD_ENV)
+        )
+        project_id = args.project_id or (project_info or {}).get('id')
+        if not project_id:
+            raise Exception('无法确定项目ID，请使用 --project-id 指定')
+        reporter_id = args.reporter_id or user_info.get('id') or 1
+        summary.update(server=server_url, projectId=project_id)
+
+        # 多进程并行解析所有文件，单个文件失败不影响其他文件
+        all_reports = []
+        for result in ParseService(max_workers=args.workers, use_cache=not args.no_cache).parse_files(file_paths):
+            summary['files'].append({
+                'path': result['filePath'],
+                'reportCount': len(result['reports']),
+                'error': result['error']
+            })
+            if result['error']:
+                logger.error("✗ 文件 %s 解析失败: %s", result['filePath'], result['error'])
+            all_reports.extend(result['reports'])
+
+        reports = dedupe_reports(all_reports)
+        summary['reportCount'] = len(reports)
+        parse_failed = any(file_info['error'] for file_info in summary['files'])
+        if not reports:
+            raise Exception('没有解析到有效数据')
+
+        if args.dry_run:
+            groups = UploadedReportIndex().diff(server_url, project_id, reports)
+            summary['result'] = {
+                f'{status}Count': len(group_reports) for status, group_reports in groups.items()
+            }
+            summary['status'] = 'partial' if parse_failed else 'ok'
+            return (EXIT_PARTIAL if parse_failed else EXIT_OK), summary
+
+        result = UploadService(server_url, token).upload_reports(
+            reports, project_id, reporter_id,
+            overwrite_existing=args.overwrite,
+            skip_uploaded=not args.all,
+            batch_size=args.batch_size,
+            max_concurrency=args.concurrency
+        )
+        summary['result'] = result
+        if parse_failed or result.get('failedCount'):
+            summary['status'] = 'partial'
+            return EXIT_PARTIAL, summary
+        summary['status'] = 'ok'
+        return EXIT_OK, summary
+
+    except Exception as e:
+        logger.error("❌ 上传失败: %s", e)
+        summary['error'] = str(e)
+        return EXIT_ERROR, summary
+
+    finally:
+        summary['elapsedSeconds'] = round(time.time() - started, 3)
+
+
+def watch(args: argparse.Namespace, output) -> int:
+    """
+    监视目录：新放入或修改过的工作簿写入完成后自动解析上传，
+    每处理完一个文件向 output 输出一行JSON格式的台账记录
+
+    :param args: 命令行参数（paths 为监视的目录）
+    :param output: 输出JSON记录的流
+    :return: 退出码
+    """
+    folders = [path for path in args.paths if Path(path).is_dir()]
+    if len(folders) != len(args.paths):
+        logger.error("❌ 监视模式只能指定目录: %s", ', '.join(p for p in args.paths if p not in folders))
+        return EXIT_ERROR
+
+    # 指定了用户名时只在启动时登录一次，之后使用保存的Token（失效时自动刷新）
+    if args.username:
+        try:
+            authenticate(args.server, args.username, os.environ.get(PASSWORD_ENV))
+        except Exception as e:
+            logger.error("❌ 登录失败: %s", e)
+            return EXIT_ERROR
+
+    def ingest(path: str) -> Dict:
+        exit_code, summary = run(args, [path], login=False)
+        if exit_code == EXIT_ERROR or summary['files'][0]['error']:
+            raise Exception(summary['error'] or summary['files'][0]['error'])
+        # 部分日报上传失败时按处理失败记录，重试间隔后重新上传（已上传的日报会被跳过）
+        failed_count = (summary.get('result') or {}).get('failedCount')
+        if failed_count:
+            raise Exception(f"{failed_count} 个日报上传失败")
+        return summary
+
+    def on_result(path: str, record: Dict):
+        print(json.dumps(record, ensure_ascii=False), file=output, flush=True)
+
+    watcher = FolderWatcher(
+        folders, ingest,
+        recursive=args.recursive,
+        interval=args.interval,
+        settle_seconds=args.settle,
+        on_result=on_result
+    )
+    # 收到终止信号（如 systemd stop）时处理完当前文件后退出
+    signal.signal(signal.SIGTERM, lambda *_: watcher.stop())
+    try:
+        watcher.run()
+    except KeyboardInterrupt:
+        pass
+    return EXIT_OK
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    主函数
+
+    :param argv: 命令行参数（不含程序名），默认读取 sys.argv
+    :return: 退出码
+    """
+    arg_parser = build_parser()
+    args = arg_parser.parse_args(argv)
+    # 试运行时文件会被记入台账为已处理，之后正式监视时不再上传
+    if args.watch and args.dry_run:
+        arg_parser.error('--watch 不能与 --dry-run 同时使用')
+
+    # 日志输出到标准错误，标准输出只保留JSON汇总（监视模式为每个文件的JSON记录）
+    setup_logging('DEBUG' if args.verbose else args.log_level, console_stream=sys.stderr)
+
+    if args.watch:
+        return watch(args, sys.stdout)
+
+    exit_code, summary = run(args)
+
+    summary_text = json.dumps(summary, ensure_ascii=False)
+    if args.summary:
+        with open(args.summary, 'w', encoding='utf-8') as f:
+            f.write(summary_text + '\n')
+    print(summary_text)
+    return exit_code
+
+
+if __name__ == "__main__":
+    # Windows/macOS 以 spawn 方式启动解析子进程时需要
+    import multiprocessing
+    multiprocessing.freeze_support()
+    sys.exit(main())